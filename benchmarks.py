@@ -0,0 +1,429 @@
+from __future__ import annotations
+
+from contextlib import contextmanager, nullcontext
+import copy
+import random
+import sys
+import time
+import tracemalloc
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional
+
+from conselheiro import Conselheiro, ConselheiroSegundoPlano
+from eventos import (
+    Evento,
+    EventoAtaque,
+    EventoDerrota,
+    EventoDrop,
+    EventoMensagem,
+    EventoNivel,
+    EventoPonto,
+    EventoStatus,
+    EventoXP,
+    EventoXPParty,
+    Rolagem,
+)
+from ia import ORCAMENTO_SIMULACAO_MS, IAExpectimax
+from motor import (
+    Armadura,
+    Batalha,
+    Bota,
+    Campanha,
+    Guerreiro,
+    Luva,
+    Orc,
+    Personagem,
+    Queimacao,
+    SequenciaSementes,
+    calcular_dano_rpg,
+    executar_acao,
+    gerar_equipamento_aleatorio,
+    gerar_monstro_aleatorio_escalado,
+    gerar_status_base_aleatorio,
+    iniciar_campanha,
+)
+from sessao import VELOCIDADES, AndarConcluido, AndarIniciado, SessaoCampanha, TurnoJogador
+from simulacao import jogar_batalha, montar_party_spec, politica_agressiva
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+
+def _cronometrar(funcao: Callable[[], object], repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes
+
+
+def _heroi_equipado() -> Personagem:
+    heroi = Guerreiro("Bench", {"HP": 12, "ATK": 12, "DEF": 12, "SPD": 12})
+    for item in (Armadura(), Bota(), Luva()):
+        heroi.equipar_item(item)
+    return heroi
+
+
+def _bonus_legado(stat: str) -> property:
+    base = {"ATK": "_forca_base", "DEF": "_defesa_base", "SPD": "_velocidade_base", "HP": "_vida_max_base"}[stat]
+
+    def ler(self: Personagem) -> int:
+        bonus = sum(e.modificadores.get(stat, 0) for e in self.equipamento.values() if e)
+        return getattr(self, base) + bonus
+
+    return property(ler)
+
+
+@contextmanager
+def _atributos_sem_cache() -> Iterator[None]:
+    originais = {nome: Personagem.__dict__[nome] for nome in ("forca", "defesa", "velocidade", "vida_max")}
+    Personagem.forca = _bonus_legado("ATK")
+    Personagem.defesa = _bonus_legado("DEF")
+    Personagem.velocidade = _bonus_legado("SPD")
+    Personagem.vida_max = _bonus_legado("HP")
+    try:
+        yield
+    finally:
+        for nome, prop in originais.items():
+            setattr(Personagem, nome, prop)
+
+
+def bench_atributos(repeticoes: int = 200_000) -> Dict[str, float]:
+    random.seed(0)
+    heroi = _heroi_equipado()
+    monstro = Orc(1)
+    unidades = [_heroi_equipado() for _ in range(3)] + [Orc(i) for i in range(3)]
+
+    def ataque() -> None:
+        dano, _, _ = calcular_dano_rpg(heroi, monstro)
+        monstro.vida = monstro.vida_max
+        monstro.receber_dano(dano)
+
+    def leitura() -> int:
+        return heroi.forca + heroi.defesa + heroi.velocidade + heroi.vida_max
+
+    def iniciativa() -> None:
+        sorted(unidades, key=lambda u: (u.velocidade, u.forca), reverse=True)
+
+    resultados: Dict[str, float] = {}
+    for rotulo, contexto in (("cache", nullcontext), ("sem_cache", _atributos_sem_cache)):
+        with contexto():
+            resultados[f"ataque_{rotulo}_us"] = _cronometrar(ataque, repeticoes) * 1e6
+            resultados[f"leitura_{rotulo}_us"] = _cronometrar(leitura, repeticoes) * 1e6
+            resultados[f"iniciativa_{rotulo}_us"] = _cronometrar(iniciativa, repeticoes // 4) * 1e6
+    for nome in ("ataque", "leitura", "iniciativa"):
+        resultados[f"{nome}_ganho"] = resultados[f"{nome}_sem_cache_us"] / resultados[f"{nome}_cache_us"]
+    return resultados
+
+
+def _bytes_por_objeto(fabrica: Callable[[], object], quantidade: int) -> float:
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    objetos = [fabrica() for _ in range(quantidade)]
+    depois = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in depois.compare_to(antes, "filename"))
+    del objetos
+    return total / quantidade
+
+
+def bench_memoria(quantidade: int = 20_000) -> Dict[str, float]:
+    random.seed(0)
+    return {
+        "monstro_bytes": _bytes_por_objeto(lambda: gerar_monstro_aleatorio_escalado(5), quantidade),
+        "equipamento_bytes": _bytes_por_objeto(gerar_equipamento_aleatorio, quantidade),
+        "status_bytes": _bytes_por_objeto(Queimacao, quantidade),
+    }
+
+
+def _turnos_legado(herois: List[Personagem], inimigos: List[Personagem], rodadas: int) -> int:
+    ordem = sorted(herois + inimigos, key=lambda u: (u.velocidade, u.forca), reverse=True)
+    indice = 0
+    rodada = 1
+    turnos = 0
+    while True:
+        if indice >= len(ordem):
+            rodada += 1
+            if rodada > rodadas:
+                return turnos
+            ordem = [u for u in herois if u.esta_vivo()] + [u for u in inimigos if u.esta_vivo()]
+            ordem.sort(key=lambda u: (u.velocidade, u.forca), reverse=True)
+            indice = 0
+        unidade = ordem[indice]
+        indice += 1
+        if unidade.esta_vivo():
+            turnos += 1
+
+
+def _turnos_agenda(batalha: Batalha, rodadas: int) -> int:
+    turnos = 0
+    while batalha.agenda.proximo(batalha) is not None and batalha.rodada <= rodadas:
+        turnos += 1
+    return turnos
+
+
+def bench_iniciativa(unidades: int = 600, rodadas: int = 200) -> Dict[str, float]:
+    random.seed(0)
+    herois: List[Personagem] = [Guerreiro(f"H{i}", gerar_status_base_aleatorio()) for i in range(unidades // 2)]
+    inimigos: List[Personagem] = [Orc(i) for i in range(unidades // 2)]
+    for unidade in (herois + inimigos)[::10]:
+        unidade.vida = 0
+    resultados: Dict[str, float] = {}
+    inicio = time.perf_counter()
+    turnos = _turnos_legado(herois, inimigos, rodadas)
+    resultados["legado_us_por_turno"] = (time.perf_counter() - inicio) / turnos * 1e6
+    for modo in ("rodadas", "atb"):
+        batalha = Batalha(herois, inimigos, registrar_eventos=False, modo_iniciativa=modo)
+        inicio = time.perf_counter()
+        turnos = _turnos_agenda(batalha, rodadas)
+        resultados[f"{modo}_us_por_turno"] = (time.perf_counter() - inicio) / turnos * 1e6
+    resultados["ganho_rodadas"] = resultados["legado_us_por_turno"] / resultados["rodadas_us_por_turno"]
+    return resultados
+
+
+def _acaba_legado(batalha: Batalha) -> bool:
+    herois_vivos = any(u.esta_vivo() for u in batalha.herois)
+    inimigos_vivos = any(u.esta_vivo() for u in batalha.inimigos)
+    return not (herois_vivos and inimigos_vivos)
+
+
+def bench_vivos(unidades: int = 600, repeticoes: int = 20_000) -> Dict[str, float]:
+    random.seed(0)
+    herois: List[Personagem] = [Guerreiro(f"H{i}", gerar_status_base_aleatorio()) for i in range(unidades // 2)]
+    inimigos: List[Personagem] = [Orc(i) for i in range(unidades // 2)]
+    batalha = Batalha(herois, inimigos, registrar_eventos=False)
+    for unidade in herois[:-1] + inimigos[:-1]:
+        unidade.vida = 0
+    resultados = {
+        "acaba_legado_us": _cronometrar(lambda: _acaba_legado(batalha), repeticoes) * 1e6,
+        "acaba_contadores_us": _cronometrar(batalha.acaba, repeticoes) * 1e6,
+    }
+    resultados["acaba_ganho"] = resultados["acaba_legado_us"] / resultados["acaba_contadores_us"]
+    return resultados
+
+
+def _andar_final(ia: Optional[IAExpectimax], semente: int) -> int:
+    sementes = SequenciaSementes(semente)
+    party = montar_party_spec("Guerreiro", sementes.filho(0).rng())
+    campanha = Campanha(party, registrar_eventos=False, sementes=sementes, ia_inimigos=ia)
+    while True:
+        batalha = campanha.iniciar_andar()
+        if not batalha:
+            break
+        jogar_batalha(batalha, politica_agressiva)
+        if campanha.finalizar_andar() != "proximo":
+            break
+    return campanha.andar_atual
+
+
+def bench_ia(campanhas: int = 20) -> Dict[str, float]:
+    resultados: Dict[str, float] = {}
+    resultados["aleatoria_andar_medio"] = sum(_andar_final(None, s) for s in range(campanhas)) / campanhas
+    for rotulo, orcamento in (("simulacao", ORCAMENTO_SIMULACAO_MS), ("gui", 40.0)):
+        ia = IAExpectimax(orcamento)
+        tempos: List[float] = []
+        profundidades: List[int] = []
+
+        def cronometrada(batalha: Batalha, unidade: Personagem) -> Optional[Personagem]:
+            inicio = time.perf_counter()
+            alvo = ia(batalha, unidade)
+            tempos.append(time.perf_counter() - inicio)
+            profundidades.append(ia.ultima_profundidade)
+            return alvo
+
+        andares = [_andar_final(cronometrada, s) for s in range(campanhas)]
+        resultados[f"{rotulo}_andar_medio"] = sum(andares) / campanhas
+        resultados[f"{rotulo}_ms_medio"] = sum(tempos) / len(tempos) * 1e3
+        resultados[f"{rotulo}_ms_max"] = max(tempos) * 1e3
+        resultados[f"{rotulo}_profundidade_media"] = sum(profundidades) / len(profundidades)
+    return resultados
+
+
+def _batalha_em_andamento() -> Batalha:
+    campanha = iniciar_campanha("Bench", "Mago", sementes=SequenciaSementes(7), registrar_eventos=False)
+    for _ in range(2):
+        batalha = campanha.iniciar_andar()
+        jogar_batalha(batalha, politica_agressiva)
+        campanha.finalizar_andar()
+    batalha = campanha.iniciar_andar()
+    for _ in range(4):
+        if batalha.proximo_turno() != "Jogador":
+            break
+        heroi = batalha.turno_ativo
+        acao, alvo = politica_agressiva(batalha, heroi)
+        executar_acao(batalha, heroi, acao, alvo)
+        batalha.gerenciar_status_pos_turno(heroi)
+    return batalha
+
+
+def bench_clonagem(repeticoes: int = 20_000) -> Dict[str, float]:
+    batalha = _batalha_em_andamento()
+    estado = batalha.capturar()
+    jogar_batalha(batalha, politica_agressiva)
+    batalha.restaurar(estado)
+    if batalha.capturar() != estado:
+        raise AssertionError("restaurar() não reproduziu o estado capturado")
+    resultados = {
+        "capturar_us": _cronometrar(batalha.capturar, repeticoes) * 1e6,
+        "restaurar_us": _cronometrar(lambda: batalha.restaurar(estado), repeticoes) * 1e6,
+        "deepcopy_us": _cronometrar(lambda: copy.deepcopy(batalha), repeticoes // 100) * 1e6,
+    }
+    resultados["clones_por_segundo"] = 1e6 / (resultados["capturar_us"] + resultados["restaurar_us"])
+    resultados["deepcopy_por_segundo"] = 1e6 / resultados["deepcopy_us"]
+    return resultados
+
+
+def bench_conselheiro(tique_ms: float = 5.0) -> Dict[str, float]:
+    batalha = _batalha_em_andamento()
+    if batalha.proximo_turno() != "Jogador":
+        raise AssertionError("a batalha de referência deveria parar no turno de um herói")
+    heroi = batalha.turno_ativo
+    estado = batalha.capturar(com_rng=True)
+    inicio = time.perf_counter()
+    conselheiro = Conselheiro(batalha, heroi)
+    copia_ms = (time.perf_counter() - inicio) * 1e3
+    inicio = time.perf_counter()
+    fundo = ConselheiroSegundoPlano(conselheiro)
+    primeiro_ms = 0.0
+    atrasos: List[float] = []
+    while fundo.ativo():
+        tique = time.perf_counter()
+        time.sleep(tique_ms / 1000)
+        atrasos.append(time.perf_counter() - tique - tique_ms / 1000)
+        if not primeiro_ms and not fundo.resultados.empty():
+            primeiro_ms = (time.perf_counter() - inicio) * 1e3
+    total = time.perf_counter() - inicio
+    if batalha.capturar(com_rng=True) != estado:
+        raise AssertionError("o conselheiro alterou a batalha ao vivo")
+    return {
+        "copia_ms": copia_ms,
+        "primeiro_lote_ms": primeiro_ms,
+        "total_ms": total * 1e3,
+        "rollouts_por_segundo": conselheiro.rollouts * len(conselheiro.candidatos) / total,
+        "atraso_tique_medio_ms": sum(atrasos) / len(atrasos) * 1e3,
+        "atraso_tique_max_ms": max(atrasos) * 1e3,
+    }
+
+
+def _andar_sintetico(quantidade: int, rng: random.Random) -> List[Evento]:
+    modelos: List[Evento] = [
+        EventoAtaque("inimigo", "Andar 9 (Grupo) | Bruxa #9", "Herói", 7, False, Rolagem(15, 3, 0, 4, 2)),
+        EventoAtaque("guerreiro", "Herói", "Andar 9 (Grupo) | Bruxa #9", 0, False, Rolagem(2, 3, 0, 18, 2)),
+        EventoAtaque("mago", "Aliado Mago", "Andar 9 (Grupo) | Bruxa #9", 12, True, Rolagem(20, 4, 6, 3, 2)),
+        EventoAtaque("maldicao", "Andar 9 (Grupo) | Bruxa #9", "Aliado Mago", 9, False),
+        EventoStatus("Andar 9 (Grupo) | Bruxa #9", "Queimação", "tick", 2, 3),
+        EventoDerrota("Andar 9 (Grupo) | Bruxa #9", "Herói"),
+        EventoXPParty("Herói", 5, 3),
+        EventoXP("Herói", 8, 12, 40),
+        EventoNivel("Herói", 4),
+        EventoPonto("Herói", "ATK"),
+        EventoDrop("Andar 9 (Grupo) | Bruxa #9", "Luvas de Couro", "Herói"),
+        EventoMensagem(" {0} passa o turno.", "info", ("Aliado Arqueiro",)),
+    ]
+    return [rng.choice(modelos) for _ in range(quantidade)]
+
+
+def _log_legado(texto: "tk.Text", eventos: List[Evento], max_linhas: int, cores: Dict[str, str]) -> None:
+    for evento in eventos:
+        linha, tag = evento.texto(), evento.tag
+        texto.configure(state="normal")
+        texto.insert("end", linha + "\n", tag if tag in cores else "default")
+        texto.configure(state="disabled")
+        texto.see("end")
+    excesso = int(texto.index("end-1c").split(".")[0]) - max_linhas
+    if excesso > 0:
+        texto.configure(state="normal")
+        texto.delete("1.0", f"{excesso + 1}.0")
+        texto.configure(state="disabled")
+
+
+def bench_log(eventos: int = 10_000, por_turno: int = 40) -> Dict[str, float]:
+    import tkinter as tk
+
+    from heroeis import LOG_COLORS, LOG_MAX_LINHAS, PainelLog
+
+    andar = _andar_sintetico(eventos, random.Random(0))
+    turnos = [andar[i : i + por_turno] for i in range(0, len(andar), por_turno)]
+    root = tk.Tk()
+    root.geometry("1024x640")
+    resultados: Dict[str, float] = {}
+    try:
+        for rotulo in ("legado", "lote"):
+            texto = tk.Text(root, wrap=tk.WORD, font=("Consolas", 10), state=tk.DISABLED)
+            texto.pack(fill=tk.BOTH, expand=True)
+            for tag, cor in LOG_COLORS.items():
+                texto.tag_configure(tag, foreground=cor)
+            root.update()
+            painel = PainelLog(texto)
+            inicio = time.perf_counter()
+            for turno in turnos:
+                if rotulo == "legado":
+                    _log_legado(texto, turno, LOG_MAX_LINHAS, LOG_COLORS)
+                else:
+                    painel.adicionar(turno)
+                    painel.descarregar()
+                root.update_idletasks()
+            duracao = time.perf_counter() - inicio
+            resultados[f"{rotulo}_ms"] = duracao * 1e3
+            resultados[f"{rotulo}_us_por_evento"] = duracao / eventos * 1e6
+            resultados[f"{rotulo}_ms_por_turno"] = duracao / len(turnos) * 1e3
+            texto.destroy()
+    finally:
+        root.destroy()
+    resultados["ganho"] = resultados["legado_ms"] / resultados["lote_ms"]
+    return resultados
+
+
+def _sessao_roteirizada(velocidade: str, andares: int, semente: int, sondagem: float) -> Dict[str, float]:
+    campanha = iniciar_campanha(
+        "Bench", "Guerreiro", sementes=SequenciaSementes(semente), andar_final=andares, ia_inimigos=IAExpectimax(40.0)
+    )
+    sessao = SessaoCampanha(campanha, velocidade=velocidade)
+    batalha: Optional[Batalha] = None
+    turnos = 0
+    inicio = time.perf_counter()
+    sessao.iniciar()
+    while sessao.ativa() or not sessao.mensagens.empty():
+        time.sleep(sondagem)
+        for mensagem in sessao.drenar():
+            if isinstance(mensagem, AndarIniciado):
+                batalha = mensagem.batalha
+            elif isinstance(mensagem, TurnoJogador):
+                turnos += 1
+                sessao.agir(*politica_agressiva(batalha, mensagem.heroi))
+            elif isinstance(mensagem, AndarConcluido) and mensagem.resultado != "proximo":
+                sessao.encerrar()
+    return {"segundos": time.perf_counter() - inicio, "turnos": turnos, "andar": campanha.andar_atual}
+
+
+def bench_velocidade(andares: int = 3, semente: int = 5, sondagem_ms: float = 50.0) -> Dict[str, float]:
+    resultados: Dict[str, float] = {}
+    for velocidade in VELOCIDADES:
+        sessao = _sessao_roteirizada(velocidade, andares, semente, sondagem_ms / 1000)
+        for chave, valor in sessao.items():
+            resultados[f"{velocidade}_{chave}"] = valor
+    for velocidade in VELOCIDADES:
+        resultados[f"{velocidade}_fracao"] = resultados[f"{velocidade}_segundos"] / resultados["normal_segundos"]
+    return resultados
+
+
+BENCHMARKS: Dict[str, Callable[[], Dict[str, float]]] = {
+    "atributos": bench_atributos,
+    "memoria": bench_memoria,
+    "iniciativa": bench_iniciativa,
+    "vivos": bench_vivos,
+    "ia": bench_ia,
+    "clonagem": bench_clonagem,
+    "conselheiro": bench_conselheiro,
+    "log": bench_log,
+    "velocidade": bench_velocidade,
+}
+
+
+def main(nomes: List[str]) -> None:
+    for nome in nomes or list(BENCHMARKS):
+        print(f"== {nome}")
+        for chave, valor in BENCHMARKS[nome]().items():
+            print(f"{chave:>32}: {valor:.3f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
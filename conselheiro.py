@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import copy
+import math
+import queue
+import random
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from eventos import LogEventos
+from ia import alvo_guloso
+from motor import (
+    Batalha,
+    IAInimigo,
+    Personagem,
+    acoes_disponiveis,
+    alvos_acao,
+    executar_acao,
+    tipo_alvo_acao,
+)
+from simulacao import Politica, jogar_batalha, politica_agressiva
+
+ROLLOUTS_POR_LOTE = 8
+MAX_ROLLOUTS = 400
+MIN_ROLLOUTS = 64
+RODADAS_ROLLOUT = 50
+ERRO_PADRAO_ALVO = 0.01
+
+Candidato = Tuple[str, Optional[int]]
+
+
+class Avaliacao(NamedTuple):
+    acao: str
+    alvo: Optional[str]
+    rollouts: int
+    dano_medio: float
+    prob_vitoria: float
+
+
+def copiar_batalha(
+    batalha: Batalha, rng: random.Random, ia_inimigos: IAInimigo = alvo_guloso
+) -> Batalha:
+    memo = {id(batalha.log): LogEventos(1), id(batalha.rng): rng, id(batalha.ia_inimigos): ia_inimigos}
+    copia = copy.deepcopy(batalha, memo)
+    copia.registrar_eventos = False
+    return copia
+
+
+class Conselheiro:
+    def __init__(
+        self,
+        batalha: Batalha,
+        heroi: Personagem,
+        semente: int = 0,
+        politica: Politica = politica_agressiva,
+        ia_inimigos: IAInimigo = alvo_guloso,
+    ) -> None:
+        self.rng = random.Random(semente)
+        self.batalha = copiar_batalha(batalha, self.rng, ia_inimigos)
+        self.unidades = self.batalha.herois + self.batalha.inimigos
+        self.heroi = self.unidades[heroi.posicao]
+        self.semente = semente
+        self.politica = politica
+        self.estado = self.batalha.capturar()
+        self.candidatos: List[Candidato] = []
+        for acao in acoes_disponiveis(self.heroi):
+            if tipo_alvo_acao(self.heroi, acao):
+                self.candidatos.extend((acao, alvo.posicao) for alvo in alvos_acao(self.batalha, self.heroi, acao))
+            else:
+                self.candidatos.append((acao, None))
+        self.rollouts = 0
+        self._vitorias = [0] * len(self.candidatos)
+        self._dano = [0] * len(self.candidatos)
+
+    def _rollout(self, acao: str, alvo: Optional[int], k: int) -> Tuple[int, bool]:
+        batalha = self.batalha
+        batalha.restaurar(self.estado)
+        self.rng.seed(self.semente + k)
+        vida_antes = sum(u.vida for u in batalha.inimigos)
+        executar_acao(batalha, self.heroi, acao, None if alvo is None else self.unidades[alvo])
+        dano = vida_antes - sum(u.vida for u in batalha.inimigos)
+        batalha.gerenciar_status_pos_turno(self.heroi)
+        if not batalha.acaba():
+            jogar_batalha(batalha, self.politica, batalha.rodada + RODADAS_ROLLOUT)
+        return dano, bool(batalha.vivos[0]) and not batalha.vivos[1]
+
+    def refinar(self, rollouts: int = ROLLOUTS_POR_LOTE) -> List[Avaliacao]:
+        for k in range(self.rollouts, self.rollouts + rollouts):
+            for i, (acao, alvo) in enumerate(self.candidatos):
+                dano, vitoria = self._rollout(acao, alvo, k)
+                self._dano[i] += dano
+                self._vitorias[i] += vitoria
+        self.rollouts += rollouts
+        self.batalha.restaurar(self.estado)
+        return self.avaliacoes()
+
+    def avaliacoes(self) -> List[Avaliacao]:
+        n = self.rollouts or 1
+        return [
+            Avaliacao(
+                acao,
+                None if alvo is None else self.unidades[alvo].nome,
+                self.rollouts,
+                self._dano[i] / n,
+                self._vitorias[i] / n,
+            )
+            for i, (acao, alvo) in enumerate(self.candidatos)
+        ]
+
+    def convergiu(self) -> bool:
+        if self.rollouts < MIN_ROLLOUTS:
+            return False
+        erros = (math.sqrt(v / self.rollouts * (1 - v / self.rollouts) / self.rollouts) for v in self._vitorias)
+        return max(erros, default=0.0) <= ERRO_PADRAO_ALVO
+
+
+def melhores_por_acao(avaliacoes: List[Avaliacao]) -> Dict[str, Avaliacao]:
+    melhores: Dict[str, Avaliacao] = {}
+    for avaliacao in avaliacoes:
+        atual = melhores.get(avaliacao.acao)
+        if atual is None or (avaliacao.prob_vitoria, avaliacao.dano_medio) > (atual.prob_vitoria, atual.dano_medio):
+            melhores[avaliacao.acao] = avaliacao
+    return melhores
+
+
+class ConselheiroSegundoPlano:
+    def __init__(self, conselheiro: Conselheiro, max_rollouts: int = MAX_ROLLOUTS) -> None:
+        self.conselheiro = conselheiro
+        self.max_rollouts = max_rollouts
+        self.resultados: "queue.Queue[List[Avaliacao]]" = queue.Queue()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._executar, name="conselheiro", daemon=True)
+        self._thread.start()
+
+    def _executar(self) -> None:
+        conselheiro = self.conselheiro
+        while not self._parar.is_set() and conselheiro.rollouts < self.max_rollouts:
+            self.resultados.put(conselheiro.refinar())
+            if conselheiro.convergiu():
+                break
+
+    def ativo(self) -> bool:
+        return self._thread.is_alive()
+
+    def ultimas(self) -> Optional[List[Avaliacao]]:
+        ultimas = None
+        while True:
+            try:
+                ultimas = self.resultados.get_nowait()
+            except queue.Empty:
+                return ultimas
+
+    def parar(self) -> None:
+        self._parar.set()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from fractions import Fraction
+from functools import lru_cache
+import random
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from motor import Arqueiro, Bruxa, Guerreiro, Mago, Personagem
+from transposicao import Efeitos
+
+FACES = 6
+CHANCE_TIRO_DUPLO = 0.3
+CHANCE_MALDICAO = 0.1
+DANO_MALDICAO = range(5, 16)
+
+Resultado = Tuple[Tuple[int, float], ...]
+
+
+class DistribuicaoDano:
+    def __init__(self, resultados: Dict[Tuple[int, bool], int]) -> None:
+        self.total = sum(resultados.values())
+        self.resultados: Tuple[Tuple[int, bool], ...] = tuple(sorted(resultados))
+        self.contagens: Tuple[int, ...] = tuple(resultados[r] for r in self.resultados)
+        pmf: Dict[int, int] = {}
+        for (dano, _), contagem in zip(self.resultados, self.contagens):
+            pmf[dano] = pmf.get(dano, 0) + contagem
+        self.pmf: Dict[int, float] = {dano: c / self.total for dano, c in sorted(pmf.items())}
+        self._pmf_contagens = pmf
+        self.prob_erro = pmf.get(0, 0) / self.total
+        self.prob_critico = sum(
+            c for (dano, critico), c in zip(self.resultados, self.contagens) if critico and dano > 0
+        ) / self.total
+        self.media = sum(dano * p for dano, p in self.pmf.items())
+        self._prob, self._alias = _tabela_alias(list(self.contagens))
+
+    def pmf_exata(self) -> Dict[int, Fraction]:
+        return {dano: Fraction(c, self.total) for dano, c in sorted(self._pmf_contagens.items())}
+
+    def amostrar(self, rng: Optional[random.Random] = None) -> Tuple[int, bool]:
+        rng = rng or random
+        i = rng.randrange(len(self._prob))
+        if rng.random() >= self._prob[i]:
+            i = self._alias[i]
+        return self.resultados[i]
+
+
+def _tabela_alias(pesos: List[int]) -> Tuple[List[float], List[int]]:
+    n = len(pesos)
+    total = sum(pesos)
+    escalados = [p * n for p in pesos]
+    prob = [1.0] * n
+    alias = list(range(n))
+    pequenos = [i for i, p in enumerate(escalados) if p < total]
+    grandes = [i for i, p in enumerate(escalados) if p >= total]
+    while pequenos and grandes:
+        s = pequenos.pop()
+        g = grandes.pop()
+        prob[s] = escalados[s] / total
+        alias[s] = g
+        escalados[g] -= total - escalados[s]
+        if escalados[g] < total:
+            pequenos.append(g)
+        else:
+            grandes.append(g)
+    return prob, alias
+
+
+@lru_cache(maxsize=None)
+def _distribuicao_diferenca(diferenca: int, crit_buff: bool) -> DistribuicaoDano:
+    resultados: Dict[Tuple[int, bool], int] = {}
+    for d_atk in range(1, FACES + 1):
+        for d_def in range(1, FACES + 1):
+            dano_bruto = d_atk - d_def + diferenca
+            if dano_bruto < 0:
+                dano = 0
+            elif dano_bruto == 0:
+                dano = 1
+            else:
+                dano = dano_bruto
+            critico = d_atk == FACES or crit_buff
+            if critico and dano > 0:
+                dano *= 2
+            chave = (dano, critico)
+            resultados[chave] = resultados.get(chave, 0) + 1
+    return DistribuicaoDano(resultados)
+
+
+def distribuicao_dano(
+    bonus_atk: int,
+    bonus_def: int,
+    dano_base_extra: int = 0,
+    defensor_ignora_def_bonus: bool = False,
+    crit_buff: bool = False,
+) -> DistribuicaoDano:
+    def_usada = 0 if defensor_ignora_def_bonus else bonus_def
+    return _distribuicao_diferenca(bonus_atk + dano_base_extra - def_usada, bool(crit_buff))
+
+
+def distribuicao_ataque(
+    atacante: Personagem,
+    defensor: Personagem,
+    dano_base_extra: int = 0,
+    defensor_ignora_def_bonus: bool = False,
+) -> DistribuicaoDano:
+    return distribuicao_dano(
+        atacante.forca // 5,
+        defensor.defesa // 6,
+        dano_base_extra,
+        defensor_ignora_def_bonus,
+        atacante.crit_chance_buff > 0,
+    )
+
+
+class ModeloAtaque:
+    def __init__(self, unidades: Sequence[Personagem]) -> None:
+        self.arqueiro = tuple(isinstance(u, Arqueiro) for u in unidades)
+        self.mago = tuple(isinstance(u, Mago) for u in unidades)
+        self.bruxa = tuple(isinstance(u, Bruxa) for u in unidades)
+        self.forca_base: List[int] = []
+        self.defesa_base: List[int] = []
+        self.chamado: List[Tuple[int, int]] = []
+        for unidade in unidades:
+            chamado = unidade.status_effects.get(Guerreiro.ChamadoLiderBuff.nome)
+            atk, def_val = (chamado.atk, chamado.def_val) if chamado else (0, 0)
+            self.chamado.append((atk, def_val))
+            self.forca_base.append(unidade.forca - atk)
+            self.defesa_base.append(unidade.defesa - def_val)
+        self._cache_ataque: Dict[Tuple[int, int, int, bool, bool, bool], Resultado] = {}
+        self._cache_rajada = lru_cache(maxsize=None)(self._rajada)
+
+    def forca(self, u: int, efeitos: Sequence[Efeitos]) -> int:
+        return self.forca_base[u] + (self.chamado[u][0] if efeitos[u][1] > 0 else 0)
+
+    def defesa(self, u: int, efeitos: Sequence[Efeitos]) -> int:
+        return self.defesa_base[u] + (self.chamado[u][1] if efeitos[u][1] > 0 else 0)
+
+    def _rajada(self, chave: Tuple[int, int, int, bool, bool], vida: int, duplo: bool) -> Resultado:
+        dist = distribuicao_dano(*chave)
+        resultado: Dict[int, float] = defaultdict(float)
+        p_repetir = 0.0
+        for dano, p in dist.pmf.items():
+            restante = max(0, vida - dano)
+            if duplo and restante > 0:
+                resultado[restante] += p * (1 - CHANCE_TIRO_DUPLO)
+                if restante == vida:
+                    p_repetir += p * CHANCE_TIRO_DUPLO
+                    continue
+                for final, q in self._cache_rajada(chave, restante, duplo):
+                    resultado[final] += p * CHANCE_TIRO_DUPLO * q
+            else:
+                resultado[restante] += p
+        return tuple((final, q / (1.0 - p_repetir)) for final, q in resultado.items())
+
+    def _chave(self, a: int, d: int, efeitos: Sequence[Efeitos]) -> Tuple[int, int, int, bool, bool]:
+        return (
+            self.forca(a, efeitos) // 5,
+            self.defesa(d, efeitos) // 6,
+            1 if self.arqueiro[a] else 0,
+            self.mago[a],
+            efeitos[a][0] > 0,
+        )
+
+    def dano_medio(self, a: int, d: int, efeitos: Sequence[Efeitos]) -> float:
+        media = distribuicao_dano(*self._chave(a, d, efeitos)).media
+        if self.arqueiro[a]:
+            media /= 1 - CHANCE_TIRO_DUPLO
+        if self.bruxa[a]:
+            maldicao = self.forca(a, efeitos) + sum(DANO_MALDICAO) / len(DANO_MALDICAO)
+            media = media * (1 - CHANCE_MALDICAO) + maldicao * CHANCE_MALDICAO
+        return media
+
+    def ataque(self, a: int, d: int, vida: int, efeitos: Sequence[Efeitos]) -> Resultado:
+        chave_cache = (a, d, vida, efeitos[a][0] > 0, efeitos[a][1] > 0, efeitos[d][1] > 0)
+        resultado_cache = self._cache_ataque.get(chave_cache)
+        if resultado_cache is not None:
+            return resultado_cache
+        normal = self._cache_rajada(self._chave(a, d, efeitos), vida, self.arqueiro[a])
+        if self.bruxa[a]:
+            resultado: Dict[int, float] = defaultdict(float)
+            for restante, p in normal:
+                resultado[restante] += p * (1 - CHANCE_MALDICAO)
+            forca = self.forca(a, efeitos)
+            for extra in DANO_MALDICAO:
+                resultado[max(0, vida - forca - extra)] += CHANCE_MALDICAO / len(DANO_MALDICAO)
+            normal = tuple(resultado.items())
+        self._cache_ataque[chave_cache] = normal
+        return normal
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+import json
+from typing import IO, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+
+class Rolagem(NamedTuple):
+    d_atk: int
+    bonus_atk: int
+    extra: int
+    d_def: int
+    bonus_def: int
+
+    @property
+    def total_atk(self) -> int:
+        return self.d_atk + self.bonus_atk + self.extra
+
+    @property
+    def total_def(self) -> int:
+        return self.d_def + self.bonus_def
+
+    def texto(self) -> str:
+        return (
+            f" | Rolagens: ATK={self.d_atk}+{self.bonus_atk}+{self.extra}={self.total_atk} "
+            f"vs DEF={self.d_def}+{self.bonus_def}={self.total_def} "
+        )
+
+
+GOLPES: Dict[str, Tuple[str, str, str]] = {
+    "guerreiro": ("[GUERREIRO] {a} ataca {b}", "erra o golpe em", "damage"),
+    "coronhada": ("[CORONHADA] {a} usa Coronhada em {b}", "erra Coronhada em", "damage"),
+    "mago": ("[MAGO] {a} lança magia em {b}", "erra a magia em", "skill"),
+    "bola_fogo": ("[BOLA FOGO] {a} lança Bola de Fogo em {b}", "erra a Bola de Fogo em", "skill"),
+    "arqueiro": ("[ARQUEIRO] {a} atira em {b}", "erra o tiro em", "damage"),
+    "inimigo": ("[INIMIGO] {a} ataca {b}", "erra o ataque em", "damage"),
+    "maldicao": ("[MAGIA] {a} lança Maldição Poderosa em {b}", "", "skill"),
+}
+
+
+class EventoAtaque(NamedTuple):
+    golpe: str
+    atacante: str
+    alvo: str
+    dano: int
+    critico: bool
+    rolagem: Optional[Rolagem] = None
+
+    @property
+    def erro(self) -> bool:
+        return self.dano <= 0
+
+    @property
+    def tag(self) -> str:
+        return "miss" if self.erro else GOLPES[self.golpe][2]
+
+    def texto(self) -> str:
+        acerto, erro, _ = GOLPES[self.golpe]
+        rolagem = f" ({self.rolagem.texto()})" if self.rolagem else ""
+        if self.erro:
+            return f" [MISS] {self.atacante} {erro} {self.alvo}{rolagem}."
+        crit = " [CRÍTICO] " if self.critico else ""
+        return f"{crit} {acerto.format(a=self.atacante, b=self.alvo)}{rolagem} causando {self.dano}!"
+
+
+class EventoDerrota(NamedTuple):
+    alvo: str
+    autor: str
+    tag: str = "damage"
+
+    def texto(self) -> str:
+        return f" {self.alvo} foi derrotado por {self.autor}!"
+
+
+class EventoCura(NamedTuple):
+    heroi: str
+    curado: int
+    vida: int
+    vida_max: int
+    fonte: Optional[str] = None
+    tag: str = "heal"
+
+    def texto(self) -> str:
+        if self.fonte is None:
+            return f" {self.heroi} recupera {self.curado} HP após a batalha (descanso)."
+        return f" {self.heroi} usou {self.fonte} e recuperou {self.curado} HP. ({self.vida}/{self.vida_max})"
+
+
+class EventoXP(NamedTuple):
+    heroi: str
+    quantidade: int
+    xp_atual: int
+    xp_proximo: int
+    tag: str = "xp"
+
+    def texto(self) -> str:
+        return f" {self.heroi} ganhou {self.quantidade} XP. ({self.xp_atual}/{self.xp_proximo})"
+
+
+class EventoXPParty(NamedTuple):
+    heroi: str
+    xp_base: int
+    xp_bonus: int
+    tag: str = "xp"
+
+    def texto(self) -> str:
+        return f" PARTY GAIN: {self.xp_base} XP base, {self.heroi} (+{self.xp_bonus} bônus) pela vitória!"
+
+
+class EventoNivel(NamedTuple):
+    heroi: str
+    nivel: int
+    pontos: int = 5
+    tag: str = "crit_hit"
+
+    def texto(self) -> str:
+        return (
+            f" {self.heroi} subiu para o **NÍVEL {self.nivel}**!\n"
+            f" Recebeu **+{self.pontos} Pontos** de Atributo Livres!"
+        )
+
+
+class EventoPonto(NamedTuple):
+    heroi: str
+    atributo: str
+    tag: str = "info"
+
+    def texto(self) -> str:
+        return f" {self.heroi} distribuiu automaticamente +1 ponto em {self.atributo}."
+
+
+class EventoDrop(NamedTuple):
+    monstro: str
+    item: str
+    heroi: str
+    tag: str = "item"
+
+    def texto(self) -> str:
+        return f" DROP: {self.monstro} deixou cair **{self.item}**! Foi para o inventário de {self.heroi}."
+
+
+class EventoEquipamento(NamedTuple):
+    heroi: str
+    item: str
+    slot: str
+    acao: str
+    anterior: Optional[str] = None
+
+    @property
+    def tag(self) -> str:
+        return "info" if self.acao == "guardou" else "equip"
+
+    def texto(self) -> str:
+        if self.acao == "guardou":
+            return f" {self.heroi} guardou {self.item} no inventário (melhor equipamento já equipado)."
+        if self.acao == "auto":
+            return f" {self.heroi} equipou automaticamente **{self.item}** no slot {self.slot}."
+        if self.acao == "substituiu":
+            return f" {self.heroi} substituiu {self.anterior} por {self.item}."
+        return f" {self.heroi} equipou **{self.item}** no slot {self.slot}!"
+
+
+TERMINO_STATUS: Dict[str, str] = {
+    "Chamado do Líder": " Chamado do Líder em {u} terminou e reverteu o buff.",
+    "Olho de Águia (100% CRIT)": " Olho de Águia em {u} terminou.",
+}
+
+
+class EventoStatus(NamedTuple):
+    unidade: str
+    status: str
+    fase: str
+    stacks: int = 1
+    dano: int = 0
+
+    @property
+    def tag(self) -> str:
+        return {"tick": "fire", "morte": "damage"}.get(self.fase, "info")
+
+    def texto(self) -> str:
+        if self.fase == "aplicado":
+            return f" {self.unidade} recebeu o status: {self.status}."
+        if self.fase == "acumulado":
+            return f" {self.unidade} acumulou {self.status} ({self.stacks}x) e a duração foi resetada."
+        if self.fase == "tick":
+            return f" {self.unidade} sofre {self.dano} de dano por {self.status} ({self.stacks} acúmulos)."
+        if self.fase == "morte":
+            return f" {self.unidade} morreu devido a {self.status}."
+        modelo = TERMINO_STATUS.get(self.status, " Efeito {s} em {u} terminou.")
+        return modelo.format(u=self.unidade, s=self.status)
+
+
+class EventoBuff(NamedTuple):
+    habilidade: str
+    autor: str
+    alvo: str
+    atk: int = 0
+    def_val: int = 0
+
+    @property
+    def tag(self) -> str:
+        return "crit_hit" if self.habilidade == "combo" else "skill"
+
+    def texto(self) -> str:
+        if self.habilidade == "chamado":
+            return f" [CHAMADO] {self.autor} bufou {self.alvo}: +{self.atk} ATK, +{self.def_val} DEF por 2T!"
+        if self.habilidade == "ignis":
+            return f" [IGNIS] {self.autor} imbuiu a arma de {self.alvo} com Fogo por 2 turnos!"
+        if self.habilidade == "olho_aguia":
+            return f" [OLHO ÁGUIA] {self.autor} bufou {self.alvo}: 100% de chance de CRÍTICO por 2 rodadas!"
+        return f" [COMBO] {self.autor} dispara um segundo tiro!"
+
+
+class EventoMensagem(NamedTuple):
+    modelo: str
+    tag: str = "default"
+    args: Tuple[object, ...] = ()
+
+    def texto(self) -> str:
+        return self.modelo.format(*self.args) if self.args else self.modelo
+
+
+Evento = Union[
+    EventoAtaque,
+    EventoDerrota,
+    EventoCura,
+    EventoXP,
+    EventoXPParty,
+    EventoNivel,
+    EventoPonto,
+    EventoDrop,
+    EventoEquipamento,
+    EventoStatus,
+    EventoBuff,
+    EventoMensagem,
+]
+
+
+def renderizar(eventos: Iterable[Evento]) -> Iterator[Tuple[str, str]]:
+    for evento in eventos:
+        yield evento.texto(), evento.tag
+
+
+def agrupar_por_tag(linhas: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    grupos: List[Tuple[str, str]] = []
+    textos: List[str] = []
+    atual: Optional[str] = None
+    for texto, tag in linhas:
+        if tag != atual and textos:
+            grupos.append(("".join(textos), atual))
+            textos = []
+        atual = tag
+        textos.append(texto + "\n")
+    if textos:
+        grupos.append(("".join(textos), atual))
+    return grupos
+
+
+class LogEventos:
+    __slots__ = ("capacidade", "arquivo", "total", "_despejados", "_eventos", "_saida")
+
+    def __init__(self, capacidade: int = 2000, arquivo: Optional[str] = None) -> None:
+        if capacidade <= 0:
+            raise ValueError("A capacidade do log deve ser positiva.")
+        self.capacidade = capacidade
+        self.arquivo = arquivo
+        self.total = 0
+        self._despejados = 0
+        self._eventos: Deque[Evento] = deque(maxlen=capacidade)
+        self._saida: Optional[IO[str]] = None
+
+    @property
+    def inicio(self) -> int:
+        return self.total - len(self._eventos)
+
+    def append(self, evento: Evento) -> None:
+        if self.arquivo and len(self._eventos) == self.capacidade and self._despejados == self.inicio:
+            self._despejar(self._eventos[0])
+        self._eventos.append(evento)
+        self.total += 1
+
+    def _despejar(self, evento: Evento) -> None:
+        if self._saida is None:
+            self._saida = open(self.arquivo, "a", encoding="utf-8")
+        registro = {"evento": type(evento).__name__, **evento._asdict()}
+        self._saida.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self._despejados += 1
+
+    def desde(self, posicao: int) -> List[Evento]:
+        deslocamento = max(0, posicao - self.inicio)
+        if deslocamento >= len(self._eventos):
+            return []
+        return list(islice(self._eventos, deslocamento, None))
+
+    def fechar(self) -> None:
+        if self.arquivo:
+            for evento in self.desde(self._despejados):
+                self._despejar(evento)
+        if self._saida is not None:
+            self._saida.close()
+            self._saida = None
+
+    def __len__(self) -> int:
+        return len(self._eventos)
+
+    def __iter__(self) -> Iterator[Evento]:
+        return iter(self._eventos)
+
+    def __getitem__(self, indice: int) -> Evento:
+        return self._eventos[indice]
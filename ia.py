@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import time
+from typing import List, Optional, Tuple
+
+from dano import ModeloAtaque
+from motor import Batalha, Personagem
+from transposicao import ZOBRIST, Efeitos, TabelaTransposicao, efeitos_unidade, zobrist_batalha
+
+VALOR_VITORIA = 1000.0
+ORCAMENTO_SIMULACAO_MS = 2.0
+
+Vidas = Tuple[int, ...]
+EfeitosBusca = Tuple[Efeitos, ...]
+
+
+class TempoEsgotado(Exception):
+    pass
+
+
+class BuscaExpectimax:
+    def __init__(
+        self,
+        batalha: Batalha,
+        unidade: Personagem,
+        prazo: Optional[float] = None,
+        tabela: Optional[TabelaTransposicao] = None,
+    ) -> None:
+        self.unidades: List[Personagem] = batalha.herois + batalha.inimigos
+        self.n_herois = len(batalha.herois)
+        self.raiz = unidade.posicao
+        self.prazo = prazo
+        self.nos = 0
+        self.vida_inicial: Vidas = tuple(u.vida for u in self.unidades)
+        self.efeitos_inicial: EfeitosBusca = tuple(efeitos_unidade(u) for u in self.unidades)
+        self.vida_max = [u.vida_max for u in self.unidades]
+        self.modelo = ModeloAtaque(self.unidades)
+        self._restante = [u.posicao for u in batalha.ordem[batalha.turno_idx :]]
+        vivos = [u for u in self.unidades if u.esta_vivo()]
+        vivos.sort(key=lambda u: (u.velocidade, u.forca), reverse=True)
+        self._rodada = [u.posicao for u in vivos]
+        self._rodada_inicial = batalha.rodada
+        self.tabela = tabela if tabela is not None else TabelaTransposicao()
+        self._z_vida = [ZOBRIST.tabela_vida(i, v) for i, v in enumerate(self.vida_max)]
+        self._z_turno: List[int] = []
+        self.ameaca = [self._ameaca(i) for i in range(len(self.unidades))]
+        self._termos = [[self._termo(i, v) for v in range(vida_max + 1)] for i, vida_max in enumerate(self.vida_max)]
+        self.hash_inicial = zobrist_batalha(batalha)
+        self.heuristica_inicial = sum(self._termos[i][v] for i, v in enumerate(self.vida_inicial))
+
+    def _oponentes(self, i: int) -> range:
+        return range(self.n_herois, len(self.unidades)) if i < self.n_herois else range(self.n_herois)
+
+    def _ameaca(self, i: int) -> float:
+        oponentes = self._oponentes(i)
+        medias = [self.modelo.dano_medio(i, j, self.efeitos_inicial) for j in oponentes]
+        return sum(medias) / len(medias) if medias else 0.0
+
+    def _estender_turnos(self, i: int) -> None:
+        restante = len(self._restante)
+        for j in range(len(self._z_turno), i + 1):
+            if j < restante:
+                posicao, rodada = j, self._rodada_inicial
+            else:
+                rodadas, resto = divmod(j - restante, len(self._rodada))
+                posicao, rodada = restante + resto, self._rodada_inicial + 1 + rodadas
+            self._z_turno.append(
+                ZOBRIST.chave("turno", posicao)
+                ^ ZOBRIST.chave("rodada", self._rodada_inicial)
+                ^ ZOBRIST.chave("rodada", rodada)
+            )
+
+    def _turno(self, i: int) -> int:
+        if i < len(self._restante):
+            return self._restante[i]
+        return self._rodada[(i - len(self._restante)) % len(self._rodada)]
+
+    def _termo(self, i: int, vida: int) -> float:
+        perda = 2.0 if vida <= 0 else 1.0 - vida / self.vida_max[i]
+        return self.ameaca[i] * perda if i < self.n_herois else -self.ameaca[i] * perda
+
+    @staticmethod
+    def _pos_turno(u: int, efeitos: EfeitosBusca, h: int) -> Tuple[EfeitosBusca, int]:
+        atual = efeitos[u]
+        critico, chamado, stacks, duracao = atual
+        if not (critico or chamado or duracao):
+            return efeitos, h
+        duracao = max(0, duracao - 1)
+        novo = (max(0, critico - 1), max(0, chamado - 1), stacks if duracao > 0 else 0, duracao)
+        h ^= ZOBRIST.efeitos(u, atual) ^ ZOBRIST.efeitos(u, novo)
+        return efeitos[:u] + (novo,) + efeitos[u + 1 :], h
+
+    def _esperanca(
+        self,
+        atacante: int,
+        alvo: int,
+        vida: Vidas,
+        efeitos: EfeitosBusca,
+        efeitos_depois: EfeitosBusca,
+        h: int,
+        heuristica: float,
+        i: int,
+        profundidade: int,
+    ) -> float:
+        z_alvo = self._z_vida[alvo]
+        termos = self._termos[alvo]
+        h ^= z_alvo[vida[alvo]]
+        heuristica -= termos[vida[alvo]]
+        total = 0.0
+        for restante, p in self.modelo.ataque(atacante, alvo, vida[alvo], efeitos):
+            nova = vida[:alvo] + (restante,) + vida[alvo + 1 :]
+            total += p * self.valor(
+                nova, efeitos_depois, h ^ z_alvo[restante], heuristica + termos[restante], i, profundidade
+            )
+        return total
+
+    def valor(
+        self, vida: Vidas, efeitos: EfeitosBusca, h: int, heuristica: float, i: int, profundidade: int
+    ) -> float:
+        self.nos += 1
+        if self.prazo is not None and time.perf_counter() > self.prazo:
+            raise TempoEsgotado
+        if not any(vida[: self.n_herois]):
+            return VALOR_VITORIA
+        if not any(vida[self.n_herois :]):
+            return -VALOR_VITORIA
+        if profundidade == 0:
+            return heuristica
+        while vida[self._turno(i)] <= 0:
+            i += 1
+        if i >= len(self._z_turno):
+            self._estender_turnos(i)
+        chave = h ^ self._z_turno[i]
+        valor = self.tabela.buscar(chave, profundidade)
+        if valor is not None:
+            return valor
+        u = self._turno(i)
+        queimacao = efeitos[u][2]
+        if queimacao:
+            restante = max(0, vida[u] - queimacao)
+            h ^= self._z_vida[u][vida[u]] ^ self._z_vida[u][restante]
+            heuristica += self._termos[u][restante] - self._termos[u][vida[u]]
+            vida = vida[:u] + (restante,) + vida[u + 1 :]
+        if vida[u] <= 0:
+            valor = self.valor(vida, efeitos, h, heuristica, i + 1, profundidade - 1)
+        else:
+            depois, h_depois = self._pos_turno(u, efeitos, h)
+            valores = [
+                self._esperanca(u, alvo, vida, efeitos, depois, h_depois, heuristica, i + 1, profundidade - 1)
+                for alvo in self._oponentes(u)
+                if vida[alvo] > 0
+            ]
+            valor = max(valores) if u >= self.n_herois else sum(valores) / len(valores)
+        self.tabela.guardar(chave, profundidade, valor)
+        return valor
+
+    def melhor_alvo(self, profundidade: int) -> Personagem:
+        vida = self.vida_inicial
+        efeitos = self.efeitos_inicial
+        depois, h = self._pos_turno(self.raiz, efeitos, self.hash_inicial)
+        alvos = [alvo for alvo in range(self.n_herois) if vida[alvo] > 0]
+        valores = [
+            self._esperanca(self.raiz, alvo, vida, efeitos, depois, h, self.heuristica_inicial, 0, profundidade - 1)
+            for alvo in alvos
+        ]
+        return self.unidades[alvos[valores.index(max(valores))]]
+
+
+def alvo_guloso(batalha: Batalha, unidade: Personagem) -> Optional[Personagem]:
+    herois = batalha.unidades_vivas(batalha.herois)
+    if len(herois) <= 1:
+        return herois[0] if herois else None
+    unidades = batalha.herois + batalha.inimigos
+    n_herois = len(batalha.herois)
+    modelo = ModeloAtaque(unidades)
+    efeitos = [efeitos_unidade(u) for u in unidades]
+
+    def perda(heroi: Personagem, vida: int) -> float:
+        return 2.0 if vida <= 0 else 1.0 - vida / heroi.vida_max
+
+    def ganho(heroi: Personagem) -> float:
+        h = heroi.posicao
+        oponentes = range(n_herois, len(unidades))
+        ameaca = sum(modelo.dano_medio(h, j, efeitos) for j in oponentes) / len(oponentes)
+        resultado = modelo.ataque(unidade.posicao, h, heroi.vida, efeitos)
+        return ameaca * (sum(p * perda(heroi, vida) for vida, p in resultado) - perda(heroi, heroi.vida))
+
+    return max(herois, key=ganho)
+
+
+class IAExpectimax:
+    def __init__(
+        self,
+        orcamento_ms: Optional[float] = 40.0,
+        profundidade_max: int = 8,
+        capacidade_tabela: int = 1 << 16,
+    ) -> None:
+        self.orcamento_ms = orcamento_ms
+        self.profundidade_max = profundidade_max
+        self.tabela = TabelaTransposicao(capacidade_tabela)
+        self.ultima_profundidade = 0
+
+    def __call__(self, batalha: Batalha, unidade: Personagem) -> Optional[Personagem]:
+        herois = batalha.unidades_vivas(batalha.herois)
+        if len(herois) <= 1:
+            return herois[0] if herois else None
+        prazo = None if self.orcamento_ms is None else time.perf_counter() + self.orcamento_ms / 1000
+        self.tabela.nova_geracao()
+        busca = BuscaExpectimax(batalha, unidade, tabela=self.tabela)
+        melhor = busca.melhor_alvo(1)
+        self.ultima_profundidade = 1
+        busca.prazo = prazo
+        for profundidade in range(2, self.profundidade_max + 1):
+            try:
+                melhor = busca.melhor_alvo(profundidade)
+            except TempoEsgotado:
+                break
+            self.ultima_profundidade = profundidade
+        return melhor
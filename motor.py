@@ -0,0 +1,1547 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import bisect
+from collections.abc import Mapping
+import hashlib
+import heapq
+import math
+import os
+import random
+import sys
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type, Union
+
+from eventos import (
+    Evento,
+    EventoAtaque,
+    EventoBuff,
+    EventoCura,
+    EventoDerrota,
+    EventoDrop,
+    EventoEquipamento,
+    EventoMensagem,
+    EventoNivel,
+    EventoPonto,
+    EventoStatus,
+    EventoXP,
+    EventoXPParty,
+    LogEventos,
+    Rolagem,
+    renderizar,
+)
+
+
+class SequenciaSementes:
+    __slots__ = ("entropia", "caminho")
+
+    def __init__(self, entropia: Optional[int] = None, caminho: Tuple[int, ...] = ()) -> None:
+        self.entropia = entropia if entropia is not None else int.from_bytes(os.urandom(16), "big")
+        self.caminho = caminho
+
+    def filho(self, indice: int) -> "SequenciaSementes":
+        return SequenciaSementes(self.entropia, self.caminho + (indice,))
+
+    def gerar(self, n: int) -> List["SequenciaSementes"]:
+        return [self.filho(i) for i in range(n)]
+
+    def semente(self) -> int:
+        chave = ":".join(str(v) for v in (self.entropia,) + self.caminho).encode()
+        return int.from_bytes(hashlib.sha256(chave).digest(), "big")
+
+    def rng(self) -> random.Random:
+        return random.Random(self.semente())
+
+
+class _RandomGlobal:
+    __slots__ = ()
+
+    def __getattr__(self, nome: str) -> Any:
+        return getattr(random, nome)
+
+
+RANDOM_GLOBAL = _RandomGlobal()
+
+
+class Dado:
+    @staticmethod
+    def rolar(a: int = 1, b: int = 6, rng: Optional[random.Random] = None) -> int:
+        return (rng or random).randint(a, b)
+
+
+def gerar_status_base_aleatorio(rng: Optional[random.Random] = None) -> Dict[str, int]:
+    return {
+        "HP": Dado.rolar(8, 15, rng),
+        "ATK": Dado.rolar(8, 15, rng),
+        "DEF": Dado.rolar(8, 15, rng),
+        "SPD": Dado.rolar(8, 15, rng),
+    }
+
+
+def distribuir_pontos_aleatorio(
+    stats: Dict[str, int],
+    pontos: int,
+    rng: Optional[random.Random] = None,
+) -> Dict[str, int]:
+    rng = rng or random
+    atualizado = stats.copy()
+    atributos = list(atualizado.keys())
+    for _ in range(pontos):
+        atributo = rng.choice(atributos)
+        atualizado[atributo] += 1
+    return atualizado
+
+
+def gerar_modificador_aleatorio(tipo: str, rng: Optional[random.Random] = None) -> int:
+    if tipo == "ATK":
+        return Dado.rolar(1, 10, rng)
+    if tipo in ("HP", "DEF"):
+        return Dado.rolar(1, 10, rng)
+    if tipo == "SPD":
+        return Dado.rolar(1, 15, rng)
+    return 0
+
+
+class Item:
+    __slots__ = ("nome", "__weakref__")
+
+    def __init__(self, nome: str) -> None:
+        self.nome = nome
+
+
+class PocaoCura(Item):
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("Poção de Cura")
+
+    def usar(self, heroi: "Personagem", battle: "Batalha") -> int:
+        cura = Dado.rolar(1, 12, battle.rng)
+        curado = heroi.curar(cura)
+        battle.emitir(EventoCura, heroi.nome, curado, heroi.vida, heroi.vida_max, self.nome)
+        return curado
+
+
+class Inventario:
+    __slots__ = ("itens", "_contagem")
+
+    def __init__(self) -> None:
+        self.itens: List[Item] = []
+        self._contagem: Optional[Dict[type, int]] = None
+
+    def _contar_tipo(self, tipo: type, delta: int) -> None:
+        if self._contagem is None:
+            self._contagem = {}
+        total = self._contagem.get(tipo, 0) + delta
+        if total:
+            self._contagem[tipo] = total
+        else:
+            del self._contagem[tipo]
+
+    def adicionar(self, item: Item) -> None:
+        self.itens.append(item)
+        self._contar_tipo(type(item), 1)
+
+    def remover(self, item: Item) -> bool:
+        self.itens.remove(item)
+        self._contar_tipo(type(item), -1)
+        return True
+
+    def substituir(self, itens: Iterable[Item]) -> None:
+        self.itens[:] = itens
+        self._contagem = None
+        for item in self.itens:
+            self._contar_tipo(type(item), 1)
+
+    def contar(self, item_class: type) -> int:
+        if not self._contagem:
+            return 0
+        return sum(n for tipo, n in self._contagem.items() if issubclass(tipo, item_class))
+
+    def listar(self) -> List[Item]:
+        return list(self.itens)
+
+
+STATS_MODIFICADOR = ("ATK", "DEF", "HP", "SPD")
+_INDICE_STAT = {stat: i for i, stat in enumerate(STATS_MODIFICADOR)}
+
+
+class Modificadores(Mapping):
+    __slots__ = ("vetor",)
+
+    def __init__(self, vetor: Tuple[int, int, int, int]) -> None:
+        self.vetor = vetor
+
+    def __getitem__(self, stat: str) -> int:
+        return self.vetor[_INDICE_STAT[stat]]
+
+    def get(self, stat: str, default: int = 0) -> int:
+        indice = _INDICE_STAT.get(stat)
+        return default if indice is None else self.vetor[indice]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(STATS_MODIFICADOR)
+
+    def __len__(self) -> int:
+        return len(STATS_MODIFICADOR)
+
+    def __repr__(self) -> str:
+        return f"Modificadores({dict(self)})"
+
+
+_MODIFICADORES: Dict[Tuple[int, int, int, int], Modificadores] = {}
+
+
+def criar_modificadores(valores: Mapping) -> Modificadores:
+    vetor = tuple(valores.get(stat, 0) for stat in STATS_MODIFICADOR)
+    modificadores = _MODIFICADORES.get(vetor)
+    if modificadores is None:
+        modificadores = _MODIFICADORES[vetor] = Modificadores(vetor)
+    return modificadores
+
+
+class Equipamento(Item):
+    __slots__ = ("slot", "modificadores")
+
+    def __init__(self, nome: str, slot: str, modificadores: Mapping) -> None:
+        super().__init__(sys.intern(nome))
+        self.slot = slot
+        self.modificadores = criar_modificadores(modificadores)
+
+    def get_bonus_str(self) -> str:
+        mod_str = [f"+{val} {stat}" for stat, val in self.modificadores.items() if val > 0]
+        return f"({', '.join(mod_str)})" if mod_str else "(Sem bônus)"
+
+
+SLOTS_EQUIPAMENTO = ("arma", "armadura", "bota", "luva")
+
+
+class Equipamentos(Mapping):
+    __slots__ = SLOTS_EQUIPAMENTO
+
+    def __init__(self) -> None:
+        self.arma: Optional[Equipamento] = None
+        self.armadura: Optional[Equipamento] = None
+        self.bota: Optional[Equipamento] = None
+        self.luva: Optional[Equipamento] = None
+
+    def __getitem__(self, slot: str) -> Optional[Equipamento]:
+        if slot not in SLOTS_EQUIPAMENTO:
+            raise KeyError(slot)
+        return getattr(self, slot)
+
+    def __setitem__(self, slot: str, item: Optional[Equipamento]) -> None:
+        if slot not in SLOTS_EQUIPAMENTO:
+            raise KeyError(slot)
+        setattr(self, slot, item)
+
+    def get(self, slot: str, default: Optional[Equipamento] = None) -> Optional[Equipamento]:
+        return getattr(self, slot, default) if slot in SLOTS_EQUIPAMENTO else default
+
+    def values(self) -> Tuple[Optional[Equipamento], ...]:
+        return (self.arma, self.armadura, self.bota, self.luva)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(SLOTS_EQUIPAMENTO)
+
+    def __len__(self) -> int:
+        return len(SLOTS_EQUIPAMENTO)
+
+
+class Arma(Equipamento):
+    __slots__ = ()
+
+    def __init__(
+        self,
+        atk_bonus: Optional[int] = None,
+        nome_base: str = "Arma",
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        atk = atk_bonus if atk_bonus is not None else gerar_modificador_aleatorio("ATK", rng)
+        mod = {"ATK": atk, "DEF": 0, "HP": 0, "SPD": 0}
+        mod_str = [f"+{val} {stat}" for stat, val in mod.items() if val > 0]
+        bonus_display = f"({', '.join(mod_str)})" if mod_str else "(Sem bônus)"
+        if atk_bonus is None:
+            nome_completo = f"Arma Aleatória {bonus_display}"
+        else:
+            nome_completo = f"{nome_base} {bonus_display}"
+        super().__init__(nome_completo, "arma", mod)
+
+
+class Armadura(Equipamento):
+    __slots__ = ()
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        stat = (rng or random).choice(["HP", "DEF"])
+        val = gerar_modificador_aleatorio(stat, rng)
+        mod = {"ATK": 0, "DEF": 0, "HP": 0, "SPD": 0}
+        mod[stat] = val
+        mod_str = [f"+{value} {key}" for key, value in mod.items() if value > 0]
+        nome_completo = f"Armadura Aleatória ({', '.join(mod_str)})" if mod_str else "Armadura Aleatória"
+        super().__init__(nome_completo, "armadura", mod)
+
+
+class Bota(Equipamento):
+    __slots__ = ()
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        spd = gerar_modificador_aleatorio("SPD", rng)
+        mod = {"ATK": 0, "DEF": 0, "HP": 0, "SPD": spd}
+        mod_str = [f"+{value} {key}" for key, value in mod.items() if value > 0]
+        nome_completo = f"Botas Aleatórias ({', '.join(mod_str)})" if mod_str else "Botas Aleatórias"
+        super().__init__(nome_completo, "bota", mod)
+
+
+class Luva(Equipamento):
+    __slots__ = ()
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        stat = (rng or random).choice(["HP", "DEF"])
+        val = gerar_modificador_aleatorio(stat, rng)
+        mod = {"ATK": 0, "DEF": 0, "HP": 0, "SPD": 0}
+        mod[stat] = val
+        mod_str = [f"+{value} {key}" for key, value in mod.items() if value > 0]
+        nome_completo = f"Luvas Aleatórias ({', '.join(mod_str)})" if mod_str else "Luvas Aleatórias"
+        super().__init__(nome_completo, "luva", mod)
+
+
+def gerar_equipamento_aleatorio(rng: Optional[random.Random] = None) -> Equipamento:
+    classes_equip = [Arma, Armadura, Bota, Luva]
+    equip_class = (rng or random).choice(classes_equip)
+    return equip_class(rng=rng)
+
+
+ESPADA_CURTA = Arma(atk_bonus=1, nome_base="Espada Curta Inicial")
+VARA_MOFADA = Arma(atk_bonus=1, nome_base="Vara Mofada Inicial")
+ARCO_GALHOS = Arma(atk_bonus=1, nome_base="Arco de Galhos Inicial")
+
+
+class StatusEffect:
+    __slots__ = ("alvo", "vence_em", "stacks")
+
+    nome = ""
+    duracao_max = 1
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if cls.nome:
+            EFEITOS_STATUS[cls.nome] = cls
+
+    def __init__(self) -> None:
+        self.alvo: Optional[Personagem] = None
+        self.vence_em = self.duracao_max
+        self.stacks = 1
+
+    @property
+    def duracao_restante(self) -> int:
+        return self.vence_em - (self.alvo.turnos if self.alvo else 0)
+
+    def _agendar(self, alvo: "Personagem") -> None:
+        self.vence_em = alvo.turnos + self.duracao_max
+        if alvo.expiracoes is None:
+            alvo.expiracoes = RodaExpiracao()
+        alvo.expiracoes.agendar(self.vence_em, self)
+
+    def aplicar(self, target: "Personagem", battle: "Batalha") -> None:
+        status = target.status_effects.get(self.nome)
+        if status is None:
+            self.alvo = target
+            target.status_effects[self.nome] = self
+            self._agendar(target)
+            self.ao_aplicar(target)
+            battle.emitir(EventoStatus, target.nome, self.nome, "aplicado")
+        else:
+            status.acumular(self, target)
+            battle.emitir(EventoStatus, target.nome, self.nome, "acumulado", status.stacks)
+
+    def ao_aplicar(self, alvo: "Personagem") -> None:
+        pass
+
+    def acumular(self, novo: "StatusEffect", alvo: "Personagem") -> None:
+        self.stacks += 1
+        self._agendar(alvo)
+
+    def no_inicio_turno(self, alvo: "Personagem", battle: "Batalha") -> None:
+        pass
+
+    def ao_expirar(self, alvo: "Personagem") -> None:
+        pass
+
+    def capturar(self) -> Tuple[int, ...]:
+        return (self.vence_em, self.stacks)
+
+    def restaurar(self, estado: Tuple[int, ...]) -> None:
+        self.vence_em, self.stacks = estado
+
+
+EFEITOS_STATUS: Dict[str, Type[StatusEffect]] = {}
+
+
+class RodaExpiracao:
+    __slots__ = ("casas",)
+
+    TAMANHO = 8
+
+    def __init__(self) -> None:
+        self.casas: List[List[Tuple[int, StatusEffect]]] = [[] for _ in range(self.TAMANHO)]
+
+    def agendar(self, vence_em: int, status: StatusEffect) -> None:
+        self.casas[vence_em % self.TAMANHO].append((vence_em, status))
+
+    def vencidos(self, agora: int) -> List[StatusEffect]:
+        indice = agora % self.TAMANHO
+        casa = self.casas[indice]
+        if not casa:
+            return []
+        self.casas[indice] = [(v, s) for v, s in casa if v > agora]
+        return [s for v, s in casa if v == agora and s.vence_em == agora]
+
+
+class Queimacao(StatusEffect):
+    __slots__ = ()
+
+    nome = "Queimação"
+    duracao_max = 2
+
+    def no_inicio_turno(self, alvo: "Personagem", battle: "Batalha") -> None:
+        dano = self.stacks * 1
+        alvo.vida -= dano
+        battle.emitir(EventoStatus, alvo.nome, self.nome, "tick", self.stacks, dano)
+        if not alvo.esta_vivo():
+            battle.emitir(EventoStatus, alvo.nome, self.nome, "morte", self.stacks)
+
+
+def calcular_dano_rpg(
+    atacante: "Personagem",
+    defensor: "Personagem",
+    dano_base_extra: int = 0,
+    defensor_ignora_def_bonus: bool = False,
+    rng: Optional[random.Random] = None,
+) -> Tuple[int, Rolagem, bool]:
+    bonus_atk = atacante.forca // 5
+    d_atk_roll = Dado.rolar(1, 6, rng)
+    d_atk_total = d_atk_roll + bonus_atk + dano_base_extra
+    bonus_def = defensor.defesa // 6
+    d_def_roll = Dado.rolar(1, 6, rng)
+
+    if defensor_ignora_def_bonus:
+        def_bonus_used = 0
+        d_def_total = d_def_roll
+    else:
+        def_bonus_used = bonus_def
+        d_def_total = d_def_roll + def_bonus_used
+
+    is_crit_roll = d_atk_roll == 6
+    is_crit_buff = atacante.crit_chance_buff > 0
+    is_crit = is_crit_roll or is_crit_buff
+    dano_bruto = d_atk_total - d_def_total
+    if dano_bruto < 0:
+        dano_final = 0
+    elif dano_bruto == 0:
+        dano_final = 1
+    else:
+        dano_final = dano_bruto
+    if is_crit and dano_final > 0:
+        dano_final *= 2
+    return dano_final, Rolagem(d_atk_roll, bonus_atk, dano_base_extra, d_def_roll, def_bonus_used), is_crit
+
+
+def _atributo_base(indice: int) -> property:
+    def ler(self: "Personagem") -> int:
+        return self._atributos_base[indice]
+
+    def escrever(self: "Personagem", valor: int) -> None:
+        self._atributos_base[indice] = valor
+        self._invalidar_atributos()
+
+    return property(ler, escrever)
+
+
+EstadoPersonagem = Tuple[Any, ...]
+
+
+class Personagem(ABC):
+    __slots__ = (
+        "nome",
+        "_atributos_base",
+        "_atributos",
+        "equipamento",
+        "inventario",
+        "status_effects",
+        "turnos",
+        "expiracoes",
+        "_crit_ate",
+        "_fogo_ate",
+        "_auto_attr_index",
+        "_vida",
+        "nivel",
+        "xp_atual",
+        "xp_proximo_nivel",
+        "pontos_atributos_livres",
+        "nivel_max",
+        "batalha",
+        "posicao",
+    )
+
+    _vida_max_base = _atributo_base(0)
+    _forca_base = _atributo_base(1)
+    _defesa_base = _atributo_base(2)
+    _velocidade_base = _atributo_base(3)
+
+    def __init__(
+        self,
+        nome: str,
+        vida_max: int,
+        forca: int,
+        defesa: int,
+        velocidade: int,
+        arma_inicial: Optional[Equipamento] = None,
+    ) -> None:
+        self.nome = nome
+        self._atributos_base = [vida_max, forca, defesa, velocidade]
+        self._atributos: Optional[Tuple[int, int, int, int]] = None
+        self.batalha: Optional[Batalha] = None
+        self.posicao = 0
+
+        self.equipamento = Equipamentos()
+        self.inventario = Inventario()
+        self.status_effects: Dict[str, StatusEffect] = {}
+        self.turnos = 0
+        self.expiracoes: Optional[RodaExpiracao] = None
+        self._crit_ate = 0
+        self._fogo_ate = 0
+        self._auto_attr_index = 0
+
+        if arma_inicial:
+            self.equipar_item(arma_inicial, is_initial=True)
+
+        self._vida = self.vida_max
+
+        self.nivel = 1
+        self.xp_atual = 0
+        self.xp_proximo_nivel = 10
+        self.pontos_atributos_livres = 0
+        self.nivel_max = 20
+
+    @property
+    def crit_chance_buff(self) -> int:
+        return max(0, self._crit_ate - self.turnos)
+
+    @crit_chance_buff.setter
+    def crit_chance_buff(self, turnos: int) -> None:
+        self._crit_ate = self.turnos + turnos
+
+    @property
+    def arma_elemento_fogo_duracao(self) -> int:
+        return max(0, self._fogo_ate - self.turnos)
+
+    @arma_elemento_fogo_duracao.setter
+    def arma_elemento_fogo_duracao(self, turnos: int) -> None:
+        self._fogo_ate = self.turnos + turnos
+
+    def capturar(self) -> EstadoPersonagem:
+        equipamento = self.equipamento
+        return (
+            tuple(self._atributos_base),
+            self._atributos,
+            self._vida,
+            self.nivel,
+            self.xp_atual,
+            self.xp_proximo_nivel,
+            self.pontos_atributos_livres,
+            self._auto_attr_index,
+            self.turnos,
+            self._crit_ate,
+            self._fogo_ate,
+            (equipamento.arma, equipamento.armadura, equipamento.bota, equipamento.luva),
+            tuple(self.inventario.itens),
+            tuple((status, status.capturar()) for status in self.status_effects.values()),
+        )
+
+    def restaurar(self, estado: EstadoPersonagem) -> None:
+        (
+            base,
+            self._atributos,
+            self._vida,
+            self.nivel,
+            self.xp_atual,
+            self.xp_proximo_nivel,
+            self.pontos_atributos_livres,
+            self._auto_attr_index,
+            self.turnos,
+            self._crit_ate,
+            self._fogo_ate,
+            equipados,
+            itens,
+            efeitos,
+        ) = estado
+        self._atributos_base[:] = base
+        equipamento = self.equipamento
+        equipamento.arma, equipamento.armadura, equipamento.bota, equipamento.luva = equipados
+        self.inventario.substituir(itens)
+        self.status_effects = {}
+        self.expiracoes = None
+        for status, valores in efeitos:
+            status.restaurar(valores)
+            self.status_effects[status.nome] = status
+            if self.expiracoes is None:
+                self.expiracoes = RodaExpiracao()
+            self.expiracoes.agendar(status.vence_em, status)
+
+    def _invalidar_atributos(self) -> None:
+        self._atributos = None
+        if self.batalha is not None:
+            self.batalha.agenda.reagendar(self)
+
+    def _calcular_atributos(self) -> Tuple[int, int, int, int]:
+        vida_max, forca, defesa, velocidade = self._atributos_base
+        for item in self.equipamento.values():
+            if item:
+                atk, def_val, hp, spd = item.modificadores.vetor
+                vida_max += hp
+                forca += atk
+                defesa += def_val
+                velocidade += spd
+        self._atributos = (vida_max, forca, defesa, velocidade)
+        return self._atributos
+
+    @property
+    def forca(self) -> int:
+        return (self._atributos or self._calcular_atributos())[1]
+
+    @property
+    def defesa(self) -> int:
+        return (self._atributos or self._calcular_atributos())[2]
+
+    @property
+    def velocidade(self) -> int:
+        return (self._atributos or self._calcular_atributos())[3]
+
+    @property
+    def vida_max(self) -> int:
+        return (self._atributos or self._calcular_atributos())[0]
+
+    @property
+    def vida(self) -> int:
+        return self._vida
+
+    @vida.setter
+    def vida(self, v: int) -> None:
+        vivo = self._vida > 0
+        self._vida = max(0, min(v, self.vida_max))
+        if self.batalha is not None and vivo != (self._vida > 0):
+            self.batalha.atualizar_vivo(self)
+
+    def _item_valor(self, item: Equipamento) -> Tuple[int, int]:
+        preferencia = {
+            "arma": "ATK",
+            "armadura": "DEF",
+            "bota": "SPD",
+            "luva": "DEF",
+        }
+        preferido = preferencia.get(item.slot, "ATK")
+        preferido_val = item.modificadores.get(preferido, 0)
+        total = sum(item.modificadores.values())
+        return preferido_val, total
+
+    def equipar_item(
+        self,
+        item: Equipamento,
+        battle: Optional["Batalha"] = None,
+        is_initial: bool = False,
+        auto: bool = False,
+    ) -> bool:
+        if not isinstance(item, Equipamento):
+            return False
+        slot = item.slot
+        old_item = self.equipamento[slot]
+
+        if is_initial:
+            self.equipamento[slot] = item
+            self._invalidar_atributos()
+            return True
+
+        if auto:
+            hp_before = self.vida
+            hp_max_before = self.vida_max
+            if old_item:
+                prefer_new = self._item_valor(item)
+                prefer_old = self._item_valor(old_item)
+                if prefer_new <= prefer_old:
+                    if battle:
+                        battle.emitir(EventoEquipamento, self.nome, item.nome, slot, "guardou")
+                    return False
+                self.inventario.adicionar(old_item)
+            self.equipamento[slot] = item
+            self._invalidar_atributos()
+            hp_max_after = self.vida_max
+            self.vida = hp_before + (hp_max_after - hp_max_before)
+            if battle:
+                battle.emitir(EventoEquipamento, self.nome, item.nome, slot, "auto")
+            return True
+
+        if old_item:
+            if battle:
+                battle.emitir(EventoEquipamento, self.nome, item.nome, slot, "substituiu", old_item.nome)
+            self.inventario.adicionar(old_item)
+
+        hp_before = self.vida
+        hp_max_before = self.vida_max
+        self.equipamento[slot] = item
+        self._invalidar_atributos()
+        hp_diff = self.vida_max - hp_max_before
+        self.vida = hp_before + hp_diff
+
+        if battle:
+            battle.emitir(EventoEquipamento, self.nome, item.nome, slot, "manual")
+        return True
+
+    def auto_equipar(self, battle: Optional["Batalha"] = None) -> None:
+        for item in list(self.inventario.itens):
+            if isinstance(item, Equipamento):
+                if self.equipar_item(item, battle, auto=True):
+                    self.inventario.remover(item)
+
+    def receber_dano(self, dano_calculado: int) -> int:
+        self.vida -= dano_calculado
+        return dano_calculado
+
+    def curar(self, valor_cura: int) -> int:
+        antes = self.vida
+        self.vida += valor_cura
+        return self.vida - antes
+
+    def esta_vivo(self) -> bool:
+        return self.vida > 0
+
+    def ganhar_xp(self, quantidade: int, battle: "Batalha") -> bool:
+        if self.nivel >= self.nivel_max:
+            return False
+        antes = self.nivel
+        self.xp_atual += quantidade
+        battle.emitir(EventoXP, self.nome, quantidade, self.xp_atual, self.xp_proximo_nivel)
+        while self.xp_atual >= self.xp_proximo_nivel and self.nivel < self.nivel_max:
+            self.upar_nivel(battle)
+        if self.pontos_atributos_livres > 0:
+            alocados = self.auto_distribuir_pontos()
+            for attr in alocados:
+                legivel = {
+                    "_vida_max_base": "HP",
+                    "_forca_base": "ATK",
+                    "_defesa_base": "DEF",
+                    "_velocidade_base": "SPD",
+                }[attr]
+                battle.emitir(EventoPonto, self.nome, legivel)
+        return self.nivel > antes
+
+    def upar_nivel(self, battle: "Batalha") -> None:
+        self.nivel += 1
+        self.xp_atual -= self.xp_proximo_nivel
+        self.xp_proximo_nivel = self.nivel * 10
+        self.pontos_atributos_livres += 5
+        battle.emitir(EventoNivel, self.nome, self.nivel, 5)
+
+    def adicionar_ponto_atributo(self, attr_name: str, quantidade: int) -> None:
+        if attr_name == "_vida_max_base":
+            self._vida_max_base += quantidade
+            self.vida += quantidade
+        elif attr_name == "_forca_base":
+            self._forca_base += quantidade
+        elif attr_name == "_defesa_base":
+            self._defesa_base += quantidade
+        elif attr_name == "_velocidade_base":
+            self._velocidade_base += quantidade
+        self.pontos_atributos_livres -= quantidade
+
+    def auto_distribuir_pontos(self) -> List[str]:
+        ordem = ["_vida_max_base", "_forca_base", "_defesa_base", "_velocidade_base"]
+        distribuidos: List[str] = []
+        while self.pontos_atributos_livres > 0:
+            attr = ordem[self._auto_attr_index % len(ordem)]
+            self._auto_attr_index += 1
+            self.adicionar_ponto_atributo(attr, 1)
+            distribuidos.append(attr)
+        return distribuidos
+
+    def get_status(self) -> str:
+        status_str = ", ".join(
+            f"{s.nome} ({s.stacks}x, {s.duracao_restante}T)" for s in self.status_effects.values()
+        )
+        if status_str:
+            status_str = f" | Status: {status_str}"
+        equip_info = " | Equip:" + "".join(
+            f" {slot[0].upper()}: {item.get_bonus_str() if item else '[Vazio]'}"
+            for slot, item in self.equipamento.items()
+        )
+        return (
+            f"[{self.nome} - NV:{self.nivel} ({self.xp_atual}/{self.xp_proximo_nivel}XP)] "
+            f"HP: {self.vida}/{self.vida_max} | ATK: {self.forca} | DEF: {self.defesa} | SPD: {self.velocidade}"
+            f"{equip_info}{status_str}"
+        )
+
+    def distribuir_xp_party(self, monstro: "Monstro", battle: "Batalha", party: List["Personagem"]) -> None:
+        xp_total = 5
+        xp_bonus = 3
+        for heroi in party:
+            if heroi.esta_vivo():
+                xp_ganha = xp_total
+                if heroi is self:
+                    xp_ganha += xp_bonus
+                heroi.ganhar_xp(xp_ganha, battle)
+        battle.emitir(EventoXPParty, self.nome, xp_total, xp_bonus)
+        item_drop = gerar_equipamento_aleatorio(battle.rng)
+        self.inventario.adicionar(item_drop)
+        battle.emitir(EventoDrop, monstro.nome, item_drop.nome, self.nome)
+        if self.equipar_item(item_drop, battle, auto=True):
+            self.inventario.remover(item_drop)
+
+    @abstractmethod
+    def atacar(self, alvo: "Personagem", battle: "Batalha", party: List["Personagem"]) -> int:
+        raise NotImplementedError
+
+    def get_habilidades_ativas(self) -> Dict[str, str]:
+        return {"classe": "Nenhuma", "arma": "Nenhuma"}
+
+
+class Guerreiro(Personagem):
+    __slots__ = ()
+
+    def __init__(self, nome: str, stats: Dict[str, int]) -> None:
+        super().__init__(nome, stats["HP"], stats["ATK"], stats["DEF"], stats["SPD"], arma_inicial=ESPADA_CURTA)
+
+    def atacar(self, alvo: "Personagem", battle: "Batalha", party: List["Personagem"]) -> int:
+        if not self.esta_vivo() or not alvo.esta_vivo():
+            return 0
+        dano_calculado, rolagem, is_crit = calcular_dano_rpg(self, alvo, rng=battle.rng)
+        causado = alvo.receber_dano(dano_calculado)
+        battle.emitir(EventoAtaque, "guerreiro", self.nome, alvo.nome, causado, is_crit and dano_calculado > 0, rolagem)
+        if not alvo.esta_vivo() and isinstance(alvo, Monstro):
+            self.distribuir_xp_party(alvo, battle, party)
+        return causado
+
+    def get_habilidades_ativas(self) -> Dict[str, str]:
+        return {"classe": "Chamado do Líder", "arma": "Coronhada"}
+
+    class ChamadoLiderBuff(StatusEffect):
+        __slots__ = ("atk", "def_val")
+
+        nome = "Chamado do Líder"
+        duracao_max = 2
+
+        def __init__(self, atk: int, def_val: int) -> None:
+            super().__init__()
+            self.atk = atk
+            self.def_val = def_val
+
+        def ao_aplicar(self, alvo: "Personagem") -> None:
+            alvo._forca_base += self.atk
+            alvo._defesa_base += self.def_val
+
+        def acumular(self, novo: "StatusEffect", alvo: "Personagem") -> None:
+            super().acumular(novo, alvo)
+            novo.ao_aplicar(alvo)
+            self.atk += novo.atk
+            self.def_val += novo.def_val
+
+        def ao_expirar(self, alvo: "Personagem") -> None:
+            alvo._forca_base -= self.atk
+            alvo._defesa_base -= self.def_val
+
+        def capturar(self) -> Tuple[int, ...]:
+            return (self.vence_em, self.stacks, self.atk, self.def_val)
+
+        def restaurar(self, estado: Tuple[int, ...]) -> None:
+            self.vence_em, self.stacks, self.atk, self.def_val = estado
+
+    def usar_habilidade_classe(self, alvo: "Personagem", party: List["Personagem"], battle: "Batalha") -> int:
+        if alvo not in party or not alvo.esta_vivo():
+            battle.registrar(" Alvo inválido para Chamado do Líder.", "error")
+            return 0
+        buff_atk = Dado.rolar(1, 12, battle.rng)
+        buff_def = Dado.rolar(1, 12, battle.rng)
+        self.ChamadoLiderBuff(buff_atk, buff_def).aplicar(alvo, battle)
+        battle.emitir(EventoBuff, "chamado", self.nome, alvo.nome, buff_atk, buff_def)
+        return 1
+
+    def coronhada(self, alvo: "Personagem", party: List["Personagem"], battle: "Batalha") -> int:
+        if not alvo.esta_vivo():
+            return 0
+        dano_calculado, rolagem, is_crit = calcular_dano_rpg(self, alvo, dano_base_extra=2, rng=battle.rng)
+        causado = alvo.receber_dano(dano_calculado)
+        battle.emitir(EventoAtaque, "coronhada", self.nome, alvo.nome, causado, is_crit and dano_calculado > 0, rolagem)
+        if not alvo.esta_vivo() and isinstance(alvo, Monstro):
+            self.distribuir_xp_party(alvo, battle, party)
+        return causado
+
+
+class Mago(Personagem):
+    __slots__ = ()
+
+    def __init__(self, nome: str, stats: Dict[str, int]) -> None:
+        super().__init__(nome, stats["HP"], stats["ATK"], stats["DEF"], stats["SPD"], arma_inicial=VARA_MOFADA)
+
+    def atacar(self, alvo: "Personagem", battle: "Batalha", party: List["Personagem"]) -> int:
+        if not self.esta_vivo() or not alvo.esta_vivo():
+            return 0
+        dano_calculado, rolagem, is_crit = calcular_dano_rpg(
+            self, alvo, defensor_ignora_def_bonus=True, rng=battle.rng
+        )
+        causado = alvo.receber_dano(dano_calculado)
+        battle.emitir(EventoAtaque, "mago", self.nome, alvo.nome, causado, is_crit and dano_calculado > 0, rolagem)
+        if not alvo.esta_vivo() and isinstance(alvo, Monstro):
+            self.distribuir_xp_party(alvo, battle, party)
+        return causado
+
+    def get_habilidades_ativas(self) -> Dict[str, str]:
+        return {"classe": "Bola de Fogo", "arma": "Ignis"}
+
+    def usar_habilidade_classe(self, alvo: "Personagem", party: List["Personagem"], battle: "Batalha") -> int:
+        if not alvo.esta_vivo():
+            return 0
+        dano_calculado, rolagem, is_crit = calcular_dano_rpg(
+            self,
+            alvo,
+            dano_base_extra=1,
+            defensor_ignora_def_bonus=True,
+            rng=battle.rng,
+        )
+        causado = alvo.receber_dano(dano_calculado)
+        battle.emitir(EventoAtaque, "bola_fogo", self.nome, alvo.nome, causado, is_crit and dano_calculado > 0, rolagem)
+        if causado > 0 and Dado.rolar(1, 100, battle.rng) <= 30:
+            Queimacao().aplicar(alvo, battle)
+        if not alvo.esta_vivo() and isinstance(alvo, Monstro):
+            self.distribuir_xp_party(alvo, battle, party)
+        return causado
+
+    def usar_habilidade_arma(self, alvo: "Personagem", party: List["Personagem"], battle: "Batalha") -> int:
+        if alvo not in party or not alvo.equipamento.get("arma") or not alvo.esta_vivo():
+            battle.registrar(" Alvo inválido ou sem arma para Ignis.", "error")
+            return 0
+        alvo.arma_elemento_fogo_duracao = 2
+        battle.emitir(EventoBuff, "ignis", self.nome, alvo.nome)
+        return 1
+
+
+class Arqueiro(Personagem):
+    __slots__ = ("dano_passivo_extra",)
+
+    def __init__(self, nome: str, stats: Dict[str, int]) -> None:
+        super().__init__(nome, stats["HP"], stats["ATK"], stats["DEF"], stats["SPD"], arma_inicial=ARCO_GALHOS)
+        self.dano_passivo_extra = 1
+
+    def atacar(self, alvo: "Personagem", battle: "Batalha", party: List["Personagem"]) -> int:
+        if not self.esta_vivo() or not alvo.esta_vivo():
+            return 0
+        dano_calculado, rolagem, is_crit = calcular_dano_rpg(
+            self, alvo, dano_base_extra=self.dano_passivo_extra, rng=battle.rng
+        )
+        is_double_shot = Dado.rolar(1, 10, battle.rng) <= 3
+        causado = alvo.receber_dano(dano_calculado)
+        battle.emitir(EventoAtaque, "arqueiro", self.nome, alvo.nome, causado, is_crit and dano_calculado > 0, rolagem)
+        dano_total = causado
+        if is_double_shot and alvo.esta_vivo():
+            battle.emitir(EventoBuff, "combo", self.nome, alvo.nome)
+            dano_total += self.atacar(alvo, battle, party)
+        if not alvo.esta_vivo() and isinstance(alvo, Monstro):
+            self.distribuir_xp_party(alvo, battle, party)
+        return dano_total
+
+    def get_habilidades_ativas(self) -> Dict[str, str]:
+        return {"classe": "Olho de Águia", "arma": "Nenhuma (Passiva)"}
+
+    class OlhoAguiaBuff(StatusEffect):
+        __slots__ = ()
+
+        nome = "Olho de Águia (100% CRIT)"
+        duracao_max = 2
+
+        def ao_aplicar(self, alvo: "Personagem") -> None:
+            alvo.crit_chance_buff = self.duracao_max
+
+        def acumular(self, novo: "StatusEffect", alvo: "Personagem") -> None:
+            super().acumular(novo, alvo)
+            self.ao_aplicar(alvo)
+
+        def ao_expirar(self, alvo: "Personagem") -> None:
+            alvo.crit_chance_buff = 0
+
+    def usar_habilidade_classe(self, alvo: "Personagem", party: List["Personagem"], battle: "Batalha") -> int:
+        if alvo not in party or not alvo.esta_vivo():
+            battle.registrar(" Alvo inválido para Olho de Águia.", "error")
+            return 0
+        self.OlhoAguiaBuff().aplicar(alvo, battle)
+        battle.emitir(EventoBuff, "olho_aguia", self.nome, alvo.nome)
+        return 1
+
+def gerar_status_soma_25_4_stats(rng: Optional[random.Random] = None) -> Dict[str, int]:
+    rng = rng or random
+    soma = 25
+    cuts = sorted(rng.sample(range(1, soma), 3))
+    s1 = cuts[0]
+    s2 = cuts[1] - cuts[0]
+    s3 = cuts[2] - cuts[1]
+    s4 = soma - cuts[2]
+    stats = [s1, s2, s3, s4]
+    rng.shuffle(stats)
+    return {
+        "vida_max": stats[0] + 10,
+        "forca": stats[1] + 5,
+        "defesa": stats[2] + 5,
+        "velocidade": stats[3] + 5,
+    }
+
+
+class Monstro(Personagem):
+    __slots__ = ()
+
+    def __init__(self, nome: str, forca_extra: int = 0, rng: Optional[random.Random] = None) -> None:
+        stats = gerar_status_soma_25_4_stats(rng)
+        super().__init__(
+            nome,
+            stats["vida_max"],
+            stats["forca"] + forca_extra,
+            stats["defesa"],
+            stats["velocidade"],
+        )
+        self._forca_base += forca_extra
+
+    def atacar(self, alvo: Personagem, battle: "Batalha", party: List[Personagem]) -> int:
+        if not self.esta_vivo() or not alvo.esta_vivo():
+            return 0
+        dano_calculado, rolagem, is_crit = calcular_dano_rpg(self, alvo, rng=battle.rng)
+        causado = alvo.receber_dano(dano_calculado)
+        battle.emitir(EventoAtaque, "inimigo", self.nome, alvo.nome, causado, is_crit and dano_calculado > 0, rolagem)
+        if not alvo.esta_vivo():
+            battle.emitir(EventoDerrota, alvo.nome, self.nome)
+        return causado
+
+    def usar_habilidade_classe(self, alvo: Personagem, party: List[Personagem], battle: "Batalha") -> int:
+        return 0
+
+    def get_habilidades_ativas(self) -> Dict[str, str]:
+        return {"classe": "Nenhuma", "arma": "Nenhuma"}
+
+
+class Orc(Monstro):
+    __slots__ = ()
+
+    def __init__(self, i: int, rng: Optional[random.Random] = None) -> None:
+        super().__init__(f"Orc Brutal #{i}", rng=rng)
+
+
+class Ogro(Monstro):
+    __slots__ = ()
+
+    def __init__(self, i: int, rng: Optional[random.Random] = None) -> None:
+        super().__init__(f"Ogro Pesado #{i}", forca_extra=5, rng=rng)
+
+
+class Bruxa(Monstro):
+    __slots__ = ()
+
+    def __init__(self, i: int, rng: Optional[random.Random] = None) -> None:
+        super().__init__(f"Bruxa Sombria #{i}", rng=rng)
+
+    def atacar(self, alvo: Personagem, battle: "Batalha", party: List[Personagem]) -> int:
+        if Dado.rolar(1, 10, battle.rng) == 10:
+            dano_magico = self.forca + Dado.rolar(5, 15, battle.rng)
+            causado = alvo.receber_dano(dano_magico)
+            battle.emitir(EventoAtaque, "maldicao", self.nome, alvo.nome, causado, False)
+            if not alvo.esta_vivo():
+                battle.emitir(EventoDerrota, alvo.nome, self.nome)
+            return causado
+        return super().atacar(alvo, battle, party)
+
+
+def gerar_monstro_aleatorio_escalado(andar: int, rng: Optional[random.Random] = None) -> Monstro:
+    monster_types = [Orc, Ogro, Bruxa]
+    monstro_cls = (rng or random).choice(monster_types)
+    fator_escala = 1.3 ** (andar - 1)
+    monstro = monstro_cls(andar, rng)
+    monstro._vida_max_base = math.ceil(monstro._vida_max_base * fator_escala)
+    monstro._vida = monstro.vida_max
+    monstro._forca_base = math.ceil(monstro._forca_base * fator_escala)
+    monstro._defesa_base = math.ceil(monstro._defesa_base * fator_escala)
+    monstro._velocidade_base = math.ceil(monstro._velocidade_base * fator_escala)
+    tipo_andar = "Grupo"
+    if andar == 10:
+        tipo_andar = "Final"
+    monstro.nome = f"Andar {andar} ({tipo_andar}) | {monstro.nome}"
+    return monstro
+
+
+VELOCIDADE_REFERENCIA_ATB = 10
+
+ChaveIniciativa = Tuple[int, int, int]
+
+
+def _chave_iniciativa(unidade: Personagem) -> ChaveIniciativa:
+    return (-unidade.velocidade, -unidade.forca, unidade.posicao)
+
+
+class AgendaRodadas:
+    __slots__ = ("unidades", "ordem", "indice", "_fila", "_chaves")
+
+    def __init__(self, unidades: List[Personagem]) -> None:
+        self.unidades = unidades
+        self._chaves: List[Optional[ChaveIniciativa]] = [None] * len(unidades)
+        self._fila: List[ChaveIniciativa] = []
+        for unidade in unidades:
+            if unidade.esta_vivo():
+                self._inserir(unidade)
+        self.ordem = sorted(unidades, key=_chave_iniciativa)
+        self.indice = 0
+
+    def _inserir(self, unidade: Personagem) -> None:
+        chave = _chave_iniciativa(unidade)
+        self._chaves[unidade.posicao] = chave
+        bisect.insort(self._fila, chave)
+
+    def _remover(self, unidade: Personagem) -> None:
+        chave = self._chaves[unidade.posicao]
+        if chave is not None:
+            del self._fila[bisect.bisect_left(self._fila, chave)]
+            self._chaves[unidade.posicao] = None
+
+    def _nova_rodada(self) -> None:
+        self.indice = 0
+        self.ordem = [self.unidades[chave[2]] for chave in self._fila]
+
+    def reagendar(self, unidade: Personagem) -> None:
+        chave = self._chaves[unidade.posicao]
+        if chave is not None and chave != _chave_iniciativa(unidade):
+            self._remover(unidade)
+            self._inserir(unidade)
+
+    def atualizar_vivo(self, unidade: Personagem) -> None:
+        if unidade.esta_vivo():
+            if self._chaves[unidade.posicao] is None:
+                self._inserir(unidade)
+        else:
+            self._remover(unidade)
+
+    def capturar(self) -> Tuple[Any, ...]:
+        return (tuple(self.ordem), self.indice, tuple(self._fila))
+
+    def restaurar(self, estado: Tuple[Any, ...]) -> None:
+        ordem, self.indice, fila = estado
+        self.ordem = list(ordem)
+        self._fila = list(fila)
+        self._chaves = [None] * len(self.unidades)
+        for chave in fila:
+            self._chaves[chave[2]] = chave
+
+    def proximo(self, batalha: "Batalha") -> Optional[Personagem]:
+        ordem = self.ordem
+        while True:
+            if self.indice >= len(ordem):
+                if not ordem:
+                    return None
+                batalha.rodada += 1
+                self._nova_rodada()
+                ordem = self.ordem
+                if not ordem:
+                    return None
+                batalha.emitir(EventoMensagem, "--- Nova Rodada Iniciada ---", "turn_start")
+            unidade = ordem[self.indice]
+            self.indice += 1
+            if unidade.esta_vivo():
+                return unidade
+
+
+class AgendaATB:
+    __slots__ = ("unidades", "tempo", "_heap", "_ultimo", "_geracao", "_ordem")
+
+    def __init__(self, unidades: List[Personagem]) -> None:
+        self.unidades = unidades
+        self.tempo = 0.0
+        self._ultimo = [0.0] * len(unidades)
+        self._geracao = [0] * len(unidades)
+        self._heap = [self._entrada(i, 0.0) for i in range(len(unidades))]
+        heapq.heapify(self._heap)
+        self._ordem: Optional[List[Personagem]] = None
+
+    def _entrada(self, posicao: int, inicio: float) -> Tuple[float, int, int, int, int]:
+        unidade = self.unidades[posicao]
+        intervalo = VELOCIDADE_REFERENCIA_ATB / max(1, unidade.velocidade)
+        return (inicio + intervalo, -unidade.velocidade, -unidade.forca, posicao, self._geracao[posicao])
+
+    @property
+    def ordem(self) -> List[Personagem]:
+        if self._ordem is None:
+            self._ordem = [self.unidades[e[3]] for e in sorted(self._heap) if e[4] == self._geracao[e[3]]]
+        return self._ordem
+
+    @property
+    def indice(self) -> int:
+        return 0
+
+    def capturar(self) -> Tuple[Any, ...]:
+        return (self.tempo, tuple(self._heap), tuple(self._ultimo), tuple(self._geracao))
+
+    def restaurar(self, estado: Tuple[Any, ...]) -> None:
+        self.tempo, heap, ultimo, geracao = estado
+        self._heap = list(heap)
+        self._ultimo = list(ultimo)
+        self._geracao = list(geracao)
+        self._ordem = None
+
+    def reagendar(self, unidade: Personagem) -> None:
+        posicao = unidade.posicao
+        self._geracao[posicao] += 1
+        heapq.heappush(self._heap, self._entrada(posicao, self._ultimo[posicao]))
+        self._ordem = None
+
+    def atualizar_vivo(self, unidade: Personagem) -> None:
+        if unidade.esta_vivo():
+            self.reagendar(unidade)
+        else:
+            self._geracao[unidade.posicao] += 1
+            self._ordem = None
+
+    def proximo(self, batalha: "Batalha") -> Optional[Personagem]:
+        while self._heap:
+            instante, _, _, posicao, geracao = heapq.heappop(self._heap)
+            unidade = self.unidades[posicao]
+            if geracao != self._geracao[posicao] or not unidade.esta_vivo():
+                continue
+            self.tempo = instante
+            self._ultimo[posicao] = instante
+            heapq.heappush(self._heap, self._entrada(posicao, instante))
+            self._ordem = None
+            rodada = max(1, math.ceil(instante))
+            if rodada > batalha.rodada:
+                batalha.rodada = rodada
+                batalha.emitir(EventoMensagem, "--- Nova Rodada Iniciada ---", "turn_start")
+            return unidade
+        return None
+
+
+Agenda = Union[AgendaRodadas, AgendaATB]
+AGENDAS = {"rodadas": AgendaRodadas, "atb": AgendaATB}
+
+EstadoBatalha = Tuple[Any, ...]
+IAInimigo = Callable[["Batalha", Personagem], Optional[Personagem]]
+
+
+def alvo_aleatorio(batalha: "Batalha", unidade: Personagem) -> Optional[Personagem]:
+    vivos = batalha.unidades_vivas(batalha.herois)
+    return batalha.rng.choice(vivos) if vivos else None
+
+
+class Batalha:
+    def __init__(
+        self,
+        herois: List[Personagem],
+        inimigos: List[Personagem],
+        registrar_eventos: bool = True,
+        log: Optional[LogEventos] = None,
+        rng: Optional[random.Random] = None,
+        modo_iniciativa: str = "rodadas",
+        ia_inimigos: Optional[IAInimigo] = None,
+    ) -> None:
+        if modo_iniciativa not in AGENDAS:
+            raise ValueError(f"Modo de iniciativa desconhecido: {modo_iniciativa}")
+        self.herois = herois
+        self.inimigos = inimigos
+        self.rng = rng or RANDOM_GLOBAL
+        self.ia_inimigos = ia_inimigos or alvo_aleatorio
+        self.log = log if log is not None else LogEventos()
+        self.registrar_eventos = registrar_eventos
+        self.turno_ativo: Optional[Personagem] = None
+        self._lados = (herois, inimigos)
+        self.vivos: Tuple[Set[int], Set[int]] = (
+            {i for i, u in enumerate(herois) if u.esta_vivo()},
+            {i for i, u in enumerate(inimigos) if u.esta_vivo()},
+        )
+        for posicao, unidade in enumerate(herois + inimigos):
+            unidade.batalha = self
+            unidade.posicao = posicao
+        self.agenda: Agenda = AGENDAS[modo_iniciativa](herois + inimigos)
+        self.emitir(EventoMensagem, "Iniciativa: {0}", "info", ([u.nome for u in self.ordem],))
+        self.rodada = 1
+
+    @property
+    def ordem(self) -> List[Personagem]:
+        return self.agenda.ordem
+
+    @property
+    def turno_idx(self) -> int:
+        return self.agenda.indice
+
+    def capturar(self, com_rng: bool = False) -> EstadoBatalha:
+        return (
+            tuple(u.capturar() for u in self.herois + self.inimigos),
+            self.rodada,
+            self.turno_ativo,
+            tuple(self.vivos[0]),
+            tuple(self.vivos[1]),
+            self.agenda.capturar(),
+            self.rng.getstate() if com_rng else None,
+        )
+
+    def restaurar(self, estado: EstadoBatalha) -> None:
+        unidades, self.rodada, self.turno_ativo, vivos_herois, vivos_inimigos, agenda, rng = estado
+        for unidade, estado_unidade in zip(self.herois + self.inimigos, unidades):
+            unidade.restaurar(estado_unidade)
+        self.vivos = (set(vivos_herois), set(vivos_inimigos))
+        self.agenda.restaurar(agenda)
+        if rng is not None:
+            self.rng.setstate(rng)
+
+    def emitir(self, tipo: Callable[..., Evento], *campos: object) -> None:
+        if self.registrar_eventos:
+            self.log.append(tipo(*campos))
+
+    def registrar(self, texto: str, tag: str = "default") -> None:
+        self.emitir(EventoMensagem, texto, tag)
+
+    def textos_log(self, posicao: int = 0) -> List[Tuple[str, str]]:
+        return list(renderizar(self.log.desde(posicao)))
+
+    def atualizar_vivo(self, unidade: Personagem) -> None:
+        n_herois = len(self.herois)
+        lado, i = (0, unidade.posicao) if unidade.posicao < n_herois else (1, unidade.posicao - n_herois)
+        if unidade.esta_vivo():
+            self.vivos[lado].add(i)
+        else:
+            self.vivos[lado].discard(i)
+        self.agenda.atualizar_vivo(unidade)
+
+    def unidades_vivas(self, grupo: List[Personagem]) -> List[Personagem]:
+        for lado, unidades in enumerate(self._lados):
+            if grupo is unidades:
+                return [unidades[i] for i in sorted(self.vivos[lado])]
+        return [u for u in grupo if u.esta_vivo()]
+
+    def acaba(self) -> bool:
+        return not (self.vivos[0] and self.vivos[1])
+
+    def aplicar_status_turn_start(self, unit: Personagem) -> bool:
+        for status in list(unit.status_effects.values()):
+            status.no_inicio_turno(unit, self)
+            if not unit.esta_vivo():
+                return False
+        return True
+
+    def gerenciar_status_pos_turno(self, unit: Personagem) -> None:
+        if not unit.esta_vivo():
+            return
+        unit.turnos += 1
+        if unit.expiracoes is None:
+            return
+        for status in unit.expiracoes.vencidos(unit.turnos):
+            if unit.status_effects.get(status.nome) is status:
+                status.ao_expirar(unit)
+                self.emitir(EventoStatus, unit.nome, status.nome, "fim")
+                del unit.status_effects[status.nome]
+
+    def proximo_turno(self) -> Optional[str]:
+        if self.acaba():
+            return None
+        while True:
+            unidade = self.agenda.proximo(self)
+            if unidade is None:
+                return None
+            self.turno_ativo = unidade
+            if not self.aplicar_status_turn_start(self.turno_ativo):
+                self.gerenciar_status_pos_turno(self.turno_ativo)
+                if self.acaba():
+                    return None
+                continue
+            if self.turno_ativo in self.herois:
+                return "Jogador"
+            self.ai_turn(self.turno_ativo)
+            self.gerenciar_status_pos_turno(self.turno_ativo)
+            if self.acaba():
+                return None
+
+    def ai_turn(self, unit: Personagem) -> None:
+        alvo = self.ia_inimigos(self, unit)
+        if alvo is None:
+            return
+        unit.atacar(alvo, self, self.herois)
+
+
+ALLY_CLASS_SKILLS = {"Chamado do Líder", "Olho de Águia"}
+ENEMY_CLASS_SKILLS = {"Bola de Fogo"}
+ALLY_WEAPON_SKILLS = {"Ignis"}
+ENEMY_WEAPON_SKILLS = {"Coronhada"}
+
+ACOES = ("atacar", "classe", "arma", "curar", "passar")
+
+
+def tipo_alvo_acao(heroi: Personagem, acao: str) -> Optional[str]:
+    if acao == "atacar":
+        return "inimigo"
+    if acao in ("classe", "arma"):
+        skill = heroi.get_habilidades_ativas().get(acao, "Nenhuma")
+        aliados, inimigos = (
+            (ALLY_CLASS_SKILLS, ENEMY_CLASS_SKILLS) if acao == "classe" else (ALLY_WEAPON_SKILLS, ENEMY_WEAPON_SKILLS)
+        )
+        if skill in aliados:
+            return "aliado"
+        if skill in inimigos:
+            return "inimigo"
+    return None
+
+
+def acoes_disponiveis(heroi: Personagem) -> List[str]:
+    acoes = ["atacar"]
+    for acao in ("classe", "arma"):
+        if tipo_alvo_acao(heroi, acao):
+            acoes.append(acao)
+    if heroi.inventario.contar(PocaoCura) > 0:
+        acoes.append("curar")
+    acoes.append("passar")
+    return acoes
+
+
+def alvos_acao(batalha: "Batalha", heroi: Personagem, acao: str) -> List[Personagem]:
+    tipo = tipo_alvo_acao(heroi, acao)
+    if tipo == "inimigo":
+        return batalha.unidades_vivas(batalha.inimigos)
+    if tipo == "aliado":
+        return batalha.unidades_vivas(batalha.herois)
+    return []
+
+
+def executar_acao(batalha: "Batalha", heroi: Personagem, acao: str, alvo: Optional[Personagem] = None) -> int:
+    party = batalha.herois
+    if acao == "atacar":
+        return heroi.atacar(alvo, batalha, party) if alvo else 0
+    if acao == "classe":
+        if not alvo or not tipo_alvo_acao(heroi, acao):
+            return 0
+        return heroi.usar_habilidade_classe(alvo, party, batalha)
+    if acao == "arma":
+        tipo = tipo_alvo_acao(heroi, acao)
+        if not alvo or not tipo:
+            return 0
+        if tipo == "aliado":
+            return heroi.usar_habilidade_arma(alvo, party, batalha)
+        if isinstance(heroi, Guerreiro):
+            return heroi.coronhada(alvo, party, batalha)
+        return 0
+    if acao == "curar":
+        pocao = next((item for item in heroi.inventario.itens if isinstance(item, PocaoCura)), None)
+        if not pocao:
+            return 0
+        curado = pocao.usar(heroi, batalha)
+        heroi.inventario.remover(pocao)
+        return curado
+    batalha.emitir(EventoMensagem, " {0} passa o turno.", "info", (heroi.nome,))
+    return 0
+
+
+def equipar_do_inventario(heroi: Personagem, item: Item, batalha: Optional["Batalha"] = None) -> bool:
+    if not isinstance(item, Equipamento) or not heroi.equipar_item(item):
+        return False
+    heroi.inventario.remover(item)
+    if batalha:
+        batalha.emitir(EventoMensagem, " {0} equipou **{1}** através do inventário.", "equip", (heroi.nome, item.nome))
+    return True
+
+CLASSES_HEROI = {
+    "Guerreiro": Guerreiro,
+    "Mago": Mago,
+    "Arqueiro": Arqueiro,
+}
+
+NOMES_ALIADOS = {
+    Guerreiro: "Aliado Guerreiro",
+    Mago: "Aliado Mago",
+    Arqueiro: "Aliado Arqueiro",
+}
+
+
+def preparar_heroi_inicial(heroi: Personagem) -> None:
+    heroi.inventario.adicionar(PocaoCura())
+    heroi.inventario.adicionar(PocaoCura())
+    heroi.auto_equipar()
+
+
+def montar_party(
+    nome: str,
+    classe_escolhida: str,
+    stats_heroi: Optional[Dict[str, int]] = None,
+    rng: Optional[random.Random] = None,
+) -> List[Personagem]:
+    classe_principal = CLASSES_HEROI.get(classe_escolhida, Guerreiro)
+    stats_heroi = stats_heroi or distribuir_pontos_aleatorio(gerar_status_base_aleatorio(rng), 15, rng)
+    heroi_principal = classe_principal(nome, stats_heroi)
+    preparar_heroi_inicial(heroi_principal)
+
+    party: List[Personagem] = [heroi_principal]
+    for classe, nome_padrao in NOMES_ALIADOS.items():
+        if classe is classe_principal:
+            continue
+        stats_aliado = distribuir_pontos_aleatorio(gerar_status_base_aleatorio(rng), 10, rng)
+        aliado = classe(nome_padrao, stats_aliado)
+        preparar_heroi_inicial(aliado)
+        party.append(aliado)
+    return party
+
+
+class Campanha:
+    def __init__(
+        self,
+        party: List[Personagem],
+        andar_final: int = 10,
+        registrar_eventos: bool = True,
+        log: Optional[LogEventos] = None,
+        sementes: Optional[SequenciaSementes] = None,
+        modo_iniciativa: str = "rodadas",
+        ia_inimigos: Optional[IAInimigo] = None,
+    ) -> None:
+        self.party = party
+        self.andar_atual = 1
+        self.andar_final = andar_final
+        self.registrar_eventos = registrar_eventos
+        self.log = log if log is not None else LogEventos()
+        self.sementes = sementes
+        self.modo_iniciativa = modo_iniciativa
+        self.ia_inimigos = ia_inimigos
+        self.batalha: Optional[Batalha] = None
+
+    def herois_vivos(self) -> List[Personagem]:
+        return [h for h in self.party if h.esta_vivo()]
+
+    def iniciar_andar(self) -> Optional[Batalha]:
+        if not self.herois_vivos():
+            self.batalha = None
+            return None
+        rng = self.sementes.filho(self.andar_atual).rng() if self.sementes else None
+        quantidade = Dado.rolar(1, 3, rng)
+        inimigos = [gerar_monstro_aleatorio_escalado(self.andar_atual, rng) for _ in range(quantidade)]
+        self.batalha = Batalha(
+            self.party, inimigos, self.registrar_eventos, self.log, rng, self.modo_iniciativa, self.ia_inimigos
+        )
+        return self.batalha
+
+    def finalizar_andar(self) -> str:
+        vivos = self.herois_vivos()
+        if not vivos:
+            return "derrota"
+        for heroi in vivos:
+            curado = heroi.curar(heroi.vida_max // 4)
+            if curado > 0 and self.batalha:
+                self.batalha.emitir(EventoCura, heroi.nome, curado, heroi.vida, heroi.vida_max)
+        if self.andar_atual >= self.andar_final:
+            return "vitoria"
+        self.andar_atual += 1
+        return "proximo"
+
+
+def iniciar_campanha(
+    nome: str,
+    classe_escolhida: str,
+    stats_heroi: Optional[Dict[str, int]] = None,
+    sementes: Optional[SequenciaSementes] = None,
+    andar_final: int = 10,
+    registrar_eventos: bool = True,
+    log: Optional[LogEventos] = None,
+    ia_inimigos: Optional[IAInimigo] = None,
+) -> Campanha:
+    sementes = sementes or SequenciaSementes()
+    party = montar_party(nome, classe_escolhida, stats_heroi, rng=sementes.filho(0).rng())
+    return Campanha(party, andar_final, registrar_eventos, log, sementes, ia_inimigos=ia_inimigos)
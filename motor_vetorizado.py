@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+import copy
+import random
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError as exc:  # pragma: no cover - ambientes sem NumPy
+    raise ImportError("O motor vetorizado requer NumPy (pip install numpy).") from exc
+
+from motor import Arqueiro, Batalha, Bruxa, Guerreiro, Mago, Monstro, Personagem, Queimacao, SequenciaSementes
+
+STATS = ("ATK", "DEF", "HP", "SPD")
+SLOTS = ("arma", "armadura", "bota", "luva")
+ATK, DEF, HP, SPD = range(4)
+PREFERENCIA_SLOT = np.array([ATK, DEF, SPD, DEF])
+ORDEM_PONTOS = np.array([HP, ATK, DEF, SPD])
+
+HEROI, INIMIGO = 0, 1
+TIPO_MONSTRO, TIPO_GUERREIRO, TIPO_MAGO, TIPO_ARQUEIRO, TIPO_BRUXA = range(5)
+
+
+def _tipo_unidade(unidade: Personagem) -> int:
+    if isinstance(unidade, Bruxa):
+        return TIPO_BRUXA
+    if isinstance(unidade, Monstro):
+        return TIPO_MONSTRO
+    if isinstance(unidade, Mago):
+        return TIPO_MAGO
+    if isinstance(unidade, Arqueiro):
+        return TIPO_ARQUEIRO
+    if isinstance(unidade, Guerreiro):
+        return TIPO_GUERREIRO
+    return TIPO_MONSTRO
+
+
+class BatalhasVetorizadas:
+    def __init__(
+        self,
+        batalhas: Sequence[Batalha],
+        seed: Union[int, SequenciaSementes, None] = None,
+    ) -> None:
+        if isinstance(seed, SequenciaSementes):
+            seed = seed.semente()
+        self.rng = np.random.default_rng(seed)
+        n = len(batalhas)
+        u = max(len(b.herois) + len(b.inimigos) for b in batalhas)
+        self.n = n
+        self.u = u
+
+        self.ativa_unidade = np.zeros((n, u), dtype=bool)
+        self.lado = np.full((n, u), -1, dtype=np.int8)
+        self.tipo = np.zeros((n, u), dtype=np.int8)
+        self.vida = np.zeros((n, u), dtype=np.int64)
+        self.vida_max_base = np.zeros((n, u), dtype=np.int64)
+        self.forca_base = np.zeros((n, u), dtype=np.int64)
+        self.defesa_base = np.zeros((n, u), dtype=np.int64)
+        self.velocidade_base = np.zeros((n, u), dtype=np.int64)
+        self.equip = np.zeros((n, u, len(SLOTS), len(STATS)), dtype=np.int64)
+        self.tem_equip = np.zeros((n, u, len(SLOTS)), dtype=bool)
+        self.bonus = np.zeros((n, u, len(STATS)), dtype=np.int64)
+        self.crit_buff = np.zeros((n, u), dtype=np.int64)
+        self.queimacao_stacks = np.zeros((n, u), dtype=np.int64)
+        self.queimacao_duracao = np.zeros((n, u), dtype=np.int64)
+        self.chamado_atk = np.zeros((n, u), dtype=np.int64)
+        self.chamado_def = np.zeros((n, u), dtype=np.int64)
+        self.chamado_duracao = np.zeros((n, u), dtype=np.int64)
+        self.nivel = np.ones((n, u), dtype=np.int64)
+        self.nivel_max = np.full((n, u), 20, dtype=np.int64)
+        self.xp_atual = np.zeros((n, u), dtype=np.int64)
+        self.xp_proximo = np.full((n, u), 10, dtype=np.int64)
+        self.auto_attr_idx = np.zeros((n, u), dtype=np.int64)
+
+        self.ordem = np.full((n, u), -1, dtype=np.int64)
+        self.n_ordem = np.zeros(n, dtype=np.int64)
+        self.ptr = np.zeros(n, dtype=np.int64)
+        self.rodada = np.ones(n, dtype=np.int64)
+
+        for i, batalha in enumerate(batalhas):
+            self._empacotar(i, batalha)
+        vivos = self.vida > 0
+        self.vivos_lado = np.stack([(vivos & (self.lado == HEROI)).sum(1), (vivos & (self.lado == INIMIGO)).sum(1)], 1)
+        self.ativa = self.vivos_lado.min(axis=1) > 0
+
+    def _empacotar(self, i: int, batalha: Batalha) -> None:
+        unidades = list(batalha.herois) + list(batalha.inimigos)
+        indice = {id(unidade): j for j, unidade in enumerate(unidades)}
+        for j, unidade in enumerate(unidades):
+            self.ativa_unidade[i, j] = True
+            self.lado[i, j] = HEROI if j < len(batalha.herois) else INIMIGO
+            self.tipo[i, j] = _tipo_unidade(unidade)
+            self.vida[i, j] = unidade.vida
+            self.vida_max_base[i, j] = unidade._vida_max_base
+            self.forca_base[i, j] = unidade._forca_base
+            self.defesa_base[i, j] = unidade._defesa_base
+            self.velocidade_base[i, j] = unidade._velocidade_base
+            for s, slot in enumerate(SLOTS):
+                item = unidade.equipamento.get(slot)
+                if item:
+                    self.tem_equip[i, j, s] = True
+                    for k, stat in enumerate(STATS):
+                        self.equip[i, j, s, k] = item.modificadores.get(stat, 0)
+            self.bonus[i, j] = self.equip[i, j].sum(axis=0)
+            self.crit_buff[i, j] = unidade.crit_chance_buff
+            queimacao = unidade.status_effects.get(Queimacao.nome)
+            if queimacao:
+                self.queimacao_stacks[i, j] = queimacao.stacks
+                self.queimacao_duracao[i, j] = queimacao.duracao_restante
+            chamado = unidade.status_effects.get(Guerreiro.ChamadoLiderBuff.nome)
+            if chamado:
+                self.chamado_atk[i, j] = chamado.atk
+                self.chamado_def[i, j] = chamado.def_val
+                self.chamado_duracao[i, j] = chamado.duracao_restante
+            self.nivel[i, j] = unidade.nivel
+            self.nivel_max[i, j] = unidade.nivel_max
+            self.xp_atual[i, j] = unidade.xp_atual
+            self.xp_proximo[i, j] = unidade.xp_proximo_nivel
+            self.auto_attr_idx[i, j] = unidade._auto_attr_index
+        ordem = [indice[id(unidade)] for unidade in batalha.ordem]
+        self.ordem[i, : len(ordem)] = ordem
+        self.n_ordem[i] = len(ordem)
+        self.ptr[i] = batalha.turno_idx
+        self.rodada[i] = batalha.rodada
+
+    @classmethod
+    def de_modelo(cls, batalha: Batalha, n: int, seed: Union[int, SequenciaSementes, None] = None) -> "BatalhasVetorizadas":
+        modelo = cls([batalha], seed=seed)
+        for nome, valor in list(vars(modelo).items()):
+            if isinstance(valor, np.ndarray) and valor.shape[:1] == (1,):
+                setattr(modelo, nome, np.repeat(valor, n, axis=0))
+        modelo.n = n
+        return modelo
+
+    def forca(self, b: np.ndarray, u: np.ndarray) -> np.ndarray:
+        return self.forca_base[b, u] + self.bonus[b, u, ATK]
+
+    def defesa(self, b: np.ndarray, u: np.ndarray) -> np.ndarray:
+        return self.defesa_base[b, u] + self.bonus[b, u, DEF]
+
+    def vida_max(self, b: np.ndarray, u: np.ndarray) -> np.ndarray:
+        return self.vida_max_base[b, u] + self.bonus[b, u, HP]
+
+    def _vivos(self, b: np.ndarray, lado: int) -> np.ndarray:
+        return (self.vida[b] > 0) & (self.lado[b] == lado)
+
+    def _nova_rodada(self, b: np.ndarray) -> None:
+        vel = self.velocidade_base[b] + self.bonus[b, :, SPD]
+        forca = self.forca_base[b] + self.bonus[b, :, ATK]
+        morto = ~(self.vida[b] > 0) | ~self.ativa_unidade[b]
+        idx = np.broadcast_to(np.arange(self.u), morto.shape)
+        self.ordem[b] = np.lexsort((idx, -forca, -vel, morto), axis=-1)
+        self.n_ordem[b] = (~morto).sum(axis=1)
+        self.ptr[b] = 0
+        self.rodada[b] += 1
+
+    def _escolher_alvo(self, b: np.ndarray, lado_alvo: int) -> np.ndarray:
+        vivos = self._vivos(b, lado_alvo)
+        k = self.rng.integers(0, self.vivos_lado[b, lado_alvo])
+        return np.argmax(np.cumsum(vivos, axis=1) > k[:, None], axis=1)
+
+    def _dano_rpg(self, b: np.ndarray, a: np.ndarray, d: np.ndarray) -> np.ndarray:
+        m = len(b)
+        tipo = self.tipo[b, a]
+        extra = (tipo == TIPO_ARQUEIRO).astype(np.int64)
+        d_atk = self.rng.integers(1, 7, m)
+        d_def = self.rng.integers(1, 7, m)
+        bonus_def = np.where(tipo == TIPO_MAGO, 0, self.defesa(b, d) // 6)
+        bruto = d_atk + self.forca(b, a) // 5 + extra - (d_def + bonus_def)
+        final = np.where(bruto < 0, 0, np.where(bruto == 0, 1, bruto))
+        crit = (d_atk == 6) | (self.crit_buff[b, a] > 0)
+        return np.where(crit & (final > 0), final * 2, final)
+
+    def _receber_dano(self, b: np.ndarray, u: np.ndarray, dano: np.ndarray) -> None:
+        vida = np.maximum(0, self.vida[b, u] - dano)
+        self.vida[b, u] = vida
+        morreu = vida == 0
+        if morreu.any():
+            self.vivos_lado[b[morreu], self.lado[b[morreu], u[morreu]]] -= 1
+
+    def _ataque_inimigo(self, b: np.ndarray, a: np.ndarray) -> None:
+        alvo = self._escolher_alvo(b, HEROI)
+        dano = self._dano_rpg(b, a, alvo)
+        bruxa = self.tipo[b, a] == TIPO_BRUXA
+        if bruxa.any():
+            maldicao = bruxa & (self.rng.integers(1, 11, len(b)) == 10)
+            magico = self.forca(b, a) + self.rng.integers(5, 16, len(b))
+            dano = np.where(maldicao, magico, dano)
+        self._receber_dano(b, alvo, dano)
+
+    def _ataque_heroi(self, b: np.ndarray, a: np.ndarray, alvo: np.ndarray) -> None:
+        dano = self._dano_rpg(b, a, alvo)
+        duplo = (self.tipo[b, a] == TIPO_ARQUEIRO) & (self.rng.integers(1, 11, len(b)) <= 3)
+        self._receber_dano(b, alvo, dano)
+        segue = duplo & (self.vida[b, alvo] > 0)
+        if segue.any():
+            self._ataque_heroi(b[segue], a[segue], alvo[segue])
+        abateu = self.vida[b, alvo] <= 0
+        if abateu.any():
+            self._distribuir_xp(b[abateu], a[abateu])
+
+    def _distribuir_xp(self, b: np.ndarray, matador: np.ndarray) -> None:
+        colunas = np.arange(self.u)
+        vivos = self._vivos(b, HEROI)
+        ganho = np.where(colunas[None, :] == matador[:, None], 8, 5)
+        recebe = vivos & (self.nivel[b] < self.nivel_max[b])
+        xp = self.xp_atual[b] + np.where(recebe, ganho, 0)
+        nivel = self.nivel[b]
+        proximo = self.xp_proximo[b]
+        pontos = np.zeros_like(xp)
+        while True:
+            sobe = recebe & (xp >= proximo) & (nivel < self.nivel_max[b])
+            if not sobe.any():
+                break
+            nivel = nivel + sobe
+            xp = xp - np.where(sobe, proximo, 0)
+            proximo = np.where(sobe, nivel * 10, proximo)
+            pontos = pontos + 5 * sobe
+        self.xp_atual[b] = xp
+        self.nivel[b] = nivel
+        self.xp_proximo[b] = proximo
+        self._distribuir_pontos(b, pontos)
+        self._drop(b, matador)
+
+    def _distribuir_pontos(self, b: np.ndarray, pontos: np.ndarray) -> None:
+        while (pontos > 0).any():
+            linha, coluna = np.nonzero(pontos > 0)
+            bb = b[linha]
+            attr = ORDEM_PONTOS[self.auto_attr_idx[bb, coluna] % 4]
+            self.auto_attr_idx[bb, coluna] += 1
+            for stat, base in ((HP, self.vida_max_base), (ATK, self.forca_base), (DEF, self.defesa_base),
+                               (SPD, self.velocidade_base)):
+                sel = attr == stat
+                np.add.at(base, (bb[sel], coluna[sel]), 1)
+                if stat == HP:
+                    np.add.at(self.vida, (bb[sel], coluna[sel]), 1)
+            pontos[linha, coluna] -= 1
+
+    def _drop(self, b: np.ndarray, h: np.ndarray) -> None:
+        m = len(b)
+        slot = self.rng.integers(0, 4, m)
+        hp_ou_def = np.where(self.rng.integers(0, 2, m) == 0, HP, DEF)
+        stat = np.select([slot == 0, slot == 2], [ATK, SPD], hp_ou_def)
+        valor = np.where(stat == SPD, self.rng.integers(1, 16, m), self.rng.integers(1, 11, m))
+        novo = np.zeros((m, len(STATS)), dtype=np.int64)
+        novo[np.arange(m), stat] = valor
+        preferido = PREFERENCIA_SLOT[slot]
+        antigo = self.equip[b, h, slot]
+        chave_nova = np.stack([novo[np.arange(m), preferido], valor], axis=1)
+        chave_antiga = np.stack([antigo[np.arange(m), preferido], antigo.sum(axis=1)], axis=1)
+        melhor = (chave_nova[:, 0] > chave_antiga[:, 0]) | (
+            (chave_nova[:, 0] == chave_antiga[:, 0]) & (chave_nova[:, 1] > chave_antiga[:, 1])
+        )
+        equipa = ~self.tem_equip[b, h, slot] | melhor
+        if not equipa.any():
+            return
+        b, h, slot, novo = b[equipa], h[equipa], slot[equipa], novo[equipa]
+        hp_antes = self.vida[b, h]
+        max_antes = self.vida_max(b, h)
+        self.bonus[b, h] += novo - self.equip[b, h, slot]
+        self.equip[b, h, slot] = novo
+        self.tem_equip[b, h, slot] = True
+        max_depois = self.vida_max(b, h)
+        self.vida[b, h] = np.clip(hp_antes + (max_depois - max_antes), 0, max_depois)
+
+    def _status_pos_turno(self, b: np.ndarray, u: np.ndarray) -> None:
+        sel = self.crit_buff[b, u] > 0
+        if sel.any():
+            self.crit_buff[b[sel], u[sel]] -= 1
+        sel = self.chamado_duracao[b, u] > 0
+        if sel.any():
+            bs, us = b[sel], u[sel]
+            self.chamado_duracao[bs, us] -= 1
+            expira = self.chamado_duracao[bs, us] == 0
+            bs, us = bs[expira], us[expira]
+            self.forca_base[bs, us] -= self.chamado_atk[bs, us]
+            self.defesa_base[bs, us] -= self.chamado_def[bs, us]
+        sel = self.queimacao_duracao[b, u] > 0
+        if sel.any():
+            bs, us = b[sel], u[sel]
+            self.queimacao_duracao[bs, us] -= 1
+            expira = self.queimacao_duracao[bs, us] == 0
+            self.queimacao_stacks[bs[expira], us[expira]] = 0
+
+    def passo(self) -> None:
+        b = ativas = np.nonzero(self.ativa)[0]
+        if not len(b):
+            return
+        fim_rodada = self.ptr[b] >= self.n_ordem[b]
+        if fim_rodada.any():
+            self._nova_rodada(b[fim_rodada])
+        u = self.ordem[b, self.ptr[b]]
+        self.ptr[b] += 1
+        age = self.vida[b, u] > 0
+        b, u = b[age], u[age]
+
+        stacks = self.queimacao_stacks[b, u]
+        if stacks.any():
+            self._receber_dano(b, u, stacks)
+            age = self.vida[b, u] > 0
+            b, u = b[age], u[age]
+
+        heroi = self.lado[b, u] == HEROI
+        if heroi.any():
+            bh, uh = b[heroi], u[heroi]
+            self._ataque_heroi(bh, uh, self._escolher_alvo(bh, INIMIGO))
+        if (~heroi).any():
+            self._ataque_inimigo(b[~heroi], u[~heroi])
+        vivo = self.vida[b, u] > 0
+        self._status_pos_turno(b[vivo], u[vivo])
+
+        self.ativa[ativas] = self.vivos_lado[ativas].min(axis=1) > 0
+
+    def executar(self, max_passos: int = 10_000) -> "BatalhasVetorizadas":
+        for _ in range(max_passos):
+            if not self.ativa.any():
+                break
+            self.passo()
+        return self
+
+    def resultados(self) -> Dict[str, np.ndarray]:
+        vida_herois = np.where(self.lado == HEROI, self.vida, 0)
+        return {
+            "vitoria": (self.vivos_lado[:, HEROI] > 0) & (self.vivos_lado[:, INIMIGO] == 0),
+            "rodadas": self.rodada.copy(),
+            "vida_herois": vida_herois.sum(axis=1),
+        }
+
+
+def politica_ataque_aleatorio(batalha: Batalha, heroi: Personagem) -> Tuple[str, Optional[Personagem]]:
+    return "atacar", batalha.rng.choice(batalha.unidades_vivas(batalha.inimigos))
+
+
+def simular_referencia(fabrica: Callable[[], Batalha], n: int, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    from simulacao import jogar_batalha
+
+    sementes = SequenciaSementes(seed)
+    vitorias: List[bool] = []
+    rodadas: List[int] = []
+    vidas: List[int] = []
+    for i in range(n):
+        batalha = fabrica()
+        batalha.registrar_eventos = False
+        batalha.rng = sementes.filho(i).rng()
+        jogar_batalha(batalha, politica_ataque_aleatorio, max_rodadas=10_000)
+        vitorias.append(not batalha.vivos[1])
+        rodadas.append(batalha.rodada)
+        vidas.append(sum(h.vida for h in batalha.herois))
+    return {"vitoria": np.array(vitorias), "rodadas": np.array(rodadas), "vida_herois": np.array(vidas)}
+
+
+def comparar_com_referencia(
+    fabrica: Callable[[random.Random], Batalha],
+    n: int = 20_000,
+    seed: Optional[int] = None,
+) -> Dict[str, Tuple[float, float]]:
+    modelo = fabrica(random.Random(seed))
+    vetorizado = BatalhasVetorizadas.de_modelo(modelo, n, seed=seed).executar().resultados()
+    referencia = simular_referencia(lambda: copy.deepcopy(modelo), n, seed=seed)
+    return {
+        chave: (float(vetorizado[chave].mean()), float(referencia[chave].mean()))
+        for chave in ("vitoria", "rodadas", "vida_herois")
+    }
+
@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import struct
+import sys
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+from motor import (
+    ACOES,
+    CLASSES_HEROI,
+    Batalha,
+    Campanha,
+    IAInimigo,
+    Personagem,
+    SequenciaSementes,
+    equipar_do_inventario,
+    executar_acao,
+    iniciar_campanha,
+)
+
+MAGICA = b"HRPL"
+VERSAO = 2
+OP_ANDAR = 0xF0
+OP_TURNO = 0xF1
+OP_EQUIPAR = 0xF2
+OP_ALVO_IA = 0xF3
+SEM_ALVO = 0xFF
+ORDEM_STATS = ("HP", "ATK", "DEF", "SPD")
+CLASSES = tuple(CLASSES_HEROI)
+
+Operacao = Tuple[int, ...]
+
+
+def _unidades(batalha: Batalha) -> List[Personagem]:
+    return batalha.herois + batalha.inimigos
+
+
+class GravadorReplay:
+    def __init__(
+        self,
+        saida: BinaryIO,
+        nome: str,
+        classe: str,
+        stats_heroi: Optional[Dict[str, int]],
+        sementes: SequenciaSementes,
+        andar_final: int = 10,
+    ) -> None:
+        self.saida = saida
+        entropia = sementes.entropia.to_bytes((sementes.entropia.bit_length() + 7) // 8 or 1, "little")
+        nome_bytes = nome.encode("utf-8")[:255]
+        cabecalho = MAGICA + struct.pack("<BBH", VERSAO, andar_final, len(entropia)) + entropia
+        cabecalho += struct.pack("<B", len(nome_bytes)) + nome_bytes
+        cabecalho += struct.pack("<BB", CLASSES.index(classe), 1 if stats_heroi else 0)
+        if stats_heroi:
+            cabecalho += struct.pack("<4H", *(stats_heroi[s] for s in ORDEM_STATS))
+        self._escrever(cabecalho)
+
+    @classmethod
+    def abrir(
+        cls,
+        caminho: str,
+        nome: str,
+        classe: str,
+        stats_heroi: Optional[Dict[str, int]],
+        sementes: SequenciaSementes,
+        andar_final: int = 10,
+    ) -> "GravadorReplay":
+        return cls(open(caminho, "wb"), nome, classe, stats_heroi, sementes, andar_final)
+
+    def _escrever(self, dados: bytes) -> None:
+        self.saida.write(dados)
+        self.saida.flush()
+
+    def andar(self, andar: int) -> None:
+        self._escrever(bytes((OP_ANDAR, andar)))
+
+    def turno(self) -> None:
+        self._escrever(bytes((OP_TURNO,)))
+
+    def acao(self, batalha: Batalha, acao: str, alvo: Optional[Personagem]) -> None:
+        indice = _unidades(batalha).index(alvo) if alvo else SEM_ALVO
+        self._escrever(bytes((ACOES.index(acao), indice)))
+
+    def registrar_ia(self, ia: IAInimigo) -> IAInimigo:
+        def escolher(batalha: Batalha, unidade: Personagem) -> Optional[Personagem]:
+            alvo = ia(batalha, unidade)
+            indice = _unidades(batalha).index(alvo) if alvo else SEM_ALVO
+            self._escrever(bytes((OP_ALVO_IA, indice)))
+            return alvo
+
+        return escolher
+
+    def equipar(self, party: List[Personagem], heroi: Personagem, indice_item: int) -> None:
+        self._escrever(struct.pack("<BBH", OP_EQUIPAR, party.index(heroi), indice_item))
+
+    def fechar(self) -> None:
+        self.saida.close()
+
+
+class Replay:
+    def __init__(
+        self,
+        entropia: int,
+        nome: str,
+        classe: str,
+        stats_heroi: Optional[Dict[str, int]],
+        andar_final: int,
+        operacoes: List[Operacao],
+        alvos_ia: Optional[List[int]] = None,
+    ) -> None:
+        self.entropia = entropia
+        self.nome = nome
+        self.classe = classe
+        self.stats_heroi = stats_heroi
+        self.andar_final = andar_final
+        self.operacoes = operacoes
+        self.alvos_ia = alvos_ia or []
+        self.inicio_andar = {op[1]: i for i, op in enumerate(operacoes) if op[0] == OP_ANDAR}
+
+    @classmethod
+    def de_bytes(cls, dados: bytes) -> "Replay":
+        if dados[:4] != MAGICA:
+            raise ValueError("Arquivo não é um replay válido.")
+        versao, andar_final, tamanho = struct.unpack_from("<BBH", dados, 4)
+        if versao != VERSAO:
+            raise ValueError(f"Versão de replay não suportada: {versao}")
+        pos = 8
+        entropia = int.from_bytes(dados[pos : pos + tamanho], "little")
+        pos += tamanho
+        tamanho_nome = dados[pos]
+        nome = dados[pos + 1 : pos + 1 + tamanho_nome].decode("utf-8")
+        pos += 1 + tamanho_nome
+        classe_idx, tem_stats = dados[pos], dados[pos + 1]
+        pos += 2
+        stats_heroi = None
+        if tem_stats:
+            stats_heroi = dict(zip(ORDEM_STATS, struct.unpack_from("<4H", dados, pos)))
+            pos += 8
+        operacoes: List[Operacao] = []
+        alvos_ia: List[int] = []
+        while pos < len(dados):
+            op = dados[pos]
+            if op == OP_TURNO:
+                operacoes.append((op,))
+                pos += 1
+            elif op == OP_ALVO_IA:
+                alvos_ia.append(dados[pos + 1])
+                pos += 2
+            elif op == OP_EQUIPAR:
+                operacoes.append(struct.unpack_from("<BBH", dados, pos))
+                pos += 4
+            else:
+                operacoes.append((op, dados[pos + 1]))
+                pos += 2
+        return cls(entropia, nome, CLASSES[classe_idx], stats_heroi, andar_final, operacoes, alvos_ia)
+
+    @classmethod
+    def ler(cls, caminho: str) -> "Replay":
+        with open(caminho, "rb") as arquivo:
+            return cls.de_bytes(arquivo.read())
+
+    def nova_campanha(self, registrar_eventos: bool = False, ia_inimigos: Optional[IAInimigo] = None) -> Campanha:
+        return iniciar_campanha(
+            self.nome,
+            self.classe,
+            self.stats_heroi,
+            SequenciaSementes(self.entropia),
+            self.andar_final,
+            registrar_eventos,
+            ia_inimigos=ia_inimigos,
+        )
+
+
+class ReprodutorReplay:
+    def __init__(self, replay: Replay, registrar_eventos: bool = False) -> None:
+        self.replay = replay
+        self.registrar_eventos = registrar_eventos
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        replay = self.replay
+        self.proximo_alvo_ia = 0
+        self.campanha = replay.nova_campanha(self.registrar_eventos, self._alvo_gravado if replay.alvos_ia else None)
+        self.batalha: Optional[Batalha] = None
+        self.posicao = 0
+        self.resultado: Optional[str] = None
+
+    def _alvo_gravado(self, batalha: Batalha, unidade: Personagem) -> Optional[Personagem]:
+        indice = self.replay.alvos_ia[self.proximo_alvo_ia]
+        self.proximo_alvo_ia += 1
+        return None if indice == SEM_ALVO else _unidades(batalha)[indice]
+
+    def _verificar_fim(self) -> None:
+        if self.batalha and self.batalha.acaba() and self.resultado is None:
+            self.resultado = self.campanha.finalizar_andar()
+
+    def passo(self) -> bool:
+        if self.posicao >= len(self.replay.operacoes):
+            return False
+        op = self.replay.operacoes[self.posicao]
+        self.posicao += 1
+        if op[0] == OP_ANDAR:
+            self.batalha = self.campanha.iniciar_andar()
+            self.resultado = None
+        elif op[0] == OP_TURNO:
+            self.batalha.proximo_turno()
+            self._verificar_fim()
+        elif op[0] == OP_EQUIPAR:
+            heroi = self.campanha.party[op[1]]
+            equipar_do_inventario(heroi, heroi.inventario.itens[op[2]], self.batalha)
+        else:
+            heroi = self.batalha.turno_ativo
+            alvo = None if op[1] == SEM_ALVO else _unidades(self.batalha)[op[1]]
+            executar_acao(self.batalha, heroi, ACOES[op[0]], alvo)
+            self.batalha.gerenciar_status_pos_turno(heroi)
+            self._verificar_fim()
+        return True
+
+    def ir_para_andar(self, andar: int) -> Optional[Batalha]:
+        alvo = self.replay.inicio_andar.get(andar)
+        if alvo is None:
+            raise ValueError(f"Andar {andar} não está no replay.")
+        if alvo < self.posicao:
+            self.reiniciar()
+        while self.posicao <= alvo:
+            self.passo()
+        return self.batalha
+
+    def executar(self) -> Campanha:
+        while self.passo():
+            pass
+        return self.campanha
+
+
+def reproduzir(caminho: str, ate_andar: Optional[int] = None, registrar_eventos: bool = False) -> ReprodutorReplay:
+    reprodutor = ReprodutorReplay(Replay.ler(caminho), registrar_eventos)
+    if ate_andar is None:
+        reprodutor.executar()
+    else:
+        reprodutor.ir_para_andar(ate_andar)
+    return reprodutor
+
+
+if __name__ == "__main__":
+    for caminho in sys.argv[1:]:
+        reprodutor = reproduzir(caminho)
+        campanha = reprodutor.campanha
+        vivos = ", ".join(f"{h.nome} {h.vida}/{h.vida_max}" for h in campanha.herois_vivos())
+        print(f"{caminho}: andar {campanha.andar_atual}, {reprodutor.resultado or 'incompleto'} | {vivos}")
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from conselheiro import Conselheiro
+from eventos import Evento
+from motor import (
+    Batalha,
+    Campanha,
+    Equipamento,
+    Item,
+    Personagem,
+    PocaoCura,
+    equipar_do_inventario,
+    executar_acao,
+)
+from replay import GravadorReplay
+
+VELOCIDADES: Dict[str, Tuple[float, float]] = {
+    "normal": (0.4, 0.8),
+    "rapido": (0.1, 0.2),
+    "instantaneo": (0.0, 0.0),
+}
+
+
+class QuadroUnidade(NamedTuple):
+    nome: str
+    classe: str
+    vida: int
+    vida_max: int
+    nivel: int
+    xp_atual: int
+    xp_proximo_nivel: int
+    forca: int
+    defesa: int
+    velocidade: int
+    pocoes: int
+    status: Tuple[Tuple[str, int], ...]
+    equipamento: Tuple[Optional[Equipamento], ...]
+    itens: Tuple[Item, ...]
+
+    @classmethod
+    def de(cls, unidade: Personagem) -> "QuadroUnidade":
+        return cls(
+            unidade.nome,
+            unidade.__class__.__name__,
+            unidade.vida,
+            unidade.vida_max,
+            unidade.nivel,
+            unidade.xp_atual,
+            unidade.xp_proximo_nivel,
+            unidade.forca,
+            unidade.defesa,
+            unidade.velocidade,
+            unidade.inventario.contar(PocaoCura),
+            tuple((nome, status.duracao_restante) for nome, status in unidade.status_effects.items()),
+            unidade.equipamento.values(),
+            tuple(unidade.inventario.itens),
+        )
+
+    @property
+    def vivo(self) -> bool:
+        return self.vida > 0
+
+
+class AndarIniciado(NamedTuple):
+    andar: int
+    batalha: Batalha
+
+
+class Atualizacao(NamedTuple):
+    eventos: Tuple[Evento, ...]
+    herois: Tuple[QuadroUnidade, ...]
+    inimigos: Tuple[QuadroUnidade, ...]
+
+
+class TurnoJogador(NamedTuple):
+    heroi: Personagem
+    conselheiro: Optional[Conselheiro] = None
+
+
+class ItemEquipado(NamedTuple):
+    heroi: Personagem
+    item: Item
+    equipou: bool
+    retorno: Optional[Callable[[bool], None]]
+
+
+class AndarConcluido(NamedTuple):
+    resultado: str
+
+
+class ErroSessao(NamedTuple):
+    erro: Exception
+
+
+Mensagem = Union[AndarIniciado, Atualizacao, TurnoJogador, ItemEquipado, AndarConcluido, ErroSessao]
+
+
+class Acao(NamedTuple):
+    acao: str
+    alvo: Optional[Personagem]
+
+
+class Equipar(NamedTuple):
+    heroi: Personagem
+    item: Item
+    retorno: Optional[Callable[[bool], None]] = None
+
+
+class Velocidade(NamedTuple):
+    modo: str
+
+
+Comando = Union[Acao, Equipar, Velocidade, None]
+
+
+class SessaoEncerrada(Exception):
+    pass
+
+
+class SessaoCampanha:
+    def __init__(
+        self,
+        campanha: Campanha,
+        gravador: Optional[GravadorReplay] = None,
+        velocidade: str = "normal",
+        conselho: bool = False,
+    ) -> None:
+        if velocidade not in VELOCIDADES:
+            raise ValueError(f"Velocidade desconhecida: {velocidade}")
+        self.campanha = campanha
+        self.gravador = gravador
+        self.velocidade = velocidade
+        self.conselho = conselho
+        self.batalha: Optional[Batalha] = None
+        self.mensagens: "queue.Queue[Mensagem]" = queue.Queue()
+        self._comandos: "queue.Queue[Comando]" = queue.Queue()
+        self._posicao_log = campanha.log.total
+        self._thread = threading.Thread(target=self._executar, name="motor", daemon=True)
+
+    def iniciar(self) -> None:
+        self._thread.start()
+
+    def agir(self, acao: str, alvo: Optional[Personagem] = None) -> None:
+        self._comandos.put(Acao(acao, alvo))
+
+    def equipar(self, heroi: Personagem, item: Item, retorno: Optional[Callable[[bool], None]] = None) -> None:
+        self._comandos.put(Equipar(heroi, item, retorno))
+
+    def definir_velocidade(self, modo: str) -> None:
+        if modo not in VELOCIDADES:
+            raise ValueError(f"Velocidade desconhecida: {modo}")
+        self._comandos.put(Velocidade(modo))
+
+    def encerrar(self) -> None:
+        self._comandos.put(None)
+
+    def aguardar(self, timeout: Optional[float] = None) -> bool:
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def ativa(self) -> bool:
+        return self._thread.is_alive()
+
+    def drenar(self) -> List[Mensagem]:
+        mensagens: List[Mensagem] = []
+        while True:
+            try:
+                mensagens.append(self.mensagens.get_nowait())
+            except queue.Empty:
+                return mensagens
+
+    def _publicar_atualizacao(self) -> None:
+        log = self.campanha.log
+        eventos = tuple(log.desde(self._posicao_log))
+        self._posicao_log = log.total
+        herois = tuple(QuadroUnidade.de(h) for h in self.campanha.party)
+        inimigos = tuple(QuadroUnidade.de(i) for i in self.batalha.inimigos) if self.batalha else ()
+        self.mensagens.put(Atualizacao(eventos, herois, inimigos))
+
+    def _equipar(self, comando: Equipar) -> None:
+        itens = comando.heroi.inventario.itens
+        indice_item = itens.index(comando.item) if comando.item in itens else -1
+        equipou = indice_item >= 0 and equipar_do_inventario(comando.heroi, comando.item, self.batalha)
+        if equipou:
+            if self.gravador:
+                self.gravador.equipar(self.campanha.party, comando.heroi, indice_item)
+            self._publicar_atualizacao()
+        self.mensagens.put(ItemEquipado(comando.heroi, comando.item, equipou, comando.retorno))
+
+    def _receber(self, timeout: Optional[float]) -> Optional[Acao]:
+        try:
+            comando = self._comandos.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if comando is None:
+            raise SessaoEncerrada
+        if isinstance(comando, Equipar):
+            self._equipar(comando)
+            return None
+        if isinstance(comando, Velocidade):
+            self.velocidade = comando.modo
+            return None
+        return comando
+
+    def _esperar(self, entre_andares: bool = False) -> None:
+        inicio = time.monotonic()
+        while True:
+            restante = inicio + VELOCIDADES[self.velocidade][entre_andares] - time.monotonic()
+            if restante <= 0:
+                return
+            self._receber(restante)
+
+    def _aguardar_acao(self) -> Acao:
+        while True:
+            comando = self._receber(None)
+            if comando is not None:
+                return comando
+
+    def _jogar_andar(self, batalha: Batalha) -> None:
+        while True:
+            if self.gravador:
+                self.gravador.turno()
+            resultado = batalha.proximo_turno()
+            if batalha.acaba():
+                return
+            self._publicar_atualizacao()
+            if resultado == "Jogador":
+                heroi = batalha.turno_ativo
+                conselheiro = Conselheiro(batalha, heroi) if self.conselho else None
+                self.mensagens.put(TurnoJogador(heroi, conselheiro))
+                comando = self._aguardar_acao()
+                if self.gravador:
+                    self.gravador.acao(batalha, comando.acao, comando.alvo)
+                executar_acao(batalha, heroi, comando.acao, comando.alvo)
+                batalha.gerenciar_status_pos_turno(heroi)
+                if batalha.acaba():
+                    return
+                if self.velocidade != "instantaneo":
+                    self._publicar_atualizacao()
+            self._esperar()
+
+    def _executar(self) -> None:
+        try:
+            while True:
+                self.batalha = self.campanha.iniciar_andar()
+                if not self.batalha:
+                    self.mensagens.put(AndarConcluido("derrota"))
+                    return
+                if self.gravador:
+                    self.gravador.andar(self.campanha.andar_atual)
+                self.mensagens.put(AndarIniciado(self.campanha.andar_atual, self.batalha))
+                self._jogar_andar(self.batalha)
+                resultado = self.campanha.finalizar_andar()
+                self._publicar_atualizacao()
+                self.mensagens.put(AndarConcluido(resultado))
+                if resultado != "proximo":
+                    return
+                self._esperar(entre_andares=True)
+        except SessaoEncerrada:
+            pass
+        except Exception as exc:
+            self.mensagens.put(ErroSessao(exc))
+        finally:
+            self.campanha.log.fechar()
+            if self.gravador:
+                self.gravador.fechar()
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+import os
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ia import ORCAMENTO_SIMULACAO_MS, IAExpectimax
+from motor import (
+    CLASSES_HEROI,
+    Batalha,
+    Campanha,
+    IAInimigo,
+    Personagem,
+    PocaoCura,
+    SequenciaSementes,
+    acoes_disponiveis,
+    alvos_acao,
+    distribuir_pontos_aleatorio,
+    executar_acao,
+    gerar_status_base_aleatorio,
+    montar_party,
+    preparar_heroi_inicial,
+    tipo_alvo_acao,
+)
+
+Politica = Callable[[Batalha, Personagem], Tuple[str, Optional[Personagem]]]
+PartySpec = Union[str, Sequence[Tuple[str, Optional[Dict[str, int]]]]]
+
+IAS_SIMULACAO = ("aleatoria", "expectimax")
+
+
+def politica_aleatoria(batalha: Batalha, heroi: Personagem) -> Tuple[str, Optional[Personagem]]:
+    acoes = [a for a in acoes_disponiveis(heroi) if a != "passar"]
+    acao = batalha.rng.choice(acoes)
+    if acao == "curar":
+        return acao, None
+    alvos = alvos_acao(batalha, heroi, acao)
+    return (acao, batalha.rng.choice(alvos)) if alvos else ("passar", None)
+
+
+def politica_agressiva(batalha: Batalha, heroi: Personagem) -> Tuple[str, Optional[Personagem]]:
+    if heroi.vida * 3 < heroi.vida_max and heroi.inventario.contar(PocaoCura) > 0:
+        return "curar", None
+    inimigos = batalha.unidades_vivas(batalha.inimigos)
+    if not inimigos:
+        return "passar", None
+    alvo = min(inimigos, key=lambda u: u.vida)
+    if tipo_alvo_acao(heroi, "classe") == "inimigo":
+        return "classe", alvo
+    return "atacar", alvo
+
+
+def montar_party_spec(party_spec: PartySpec, rng: Optional[random.Random] = None) -> List[Personagem]:
+    if isinstance(party_spec, str):
+        return montar_party(party_spec, party_spec, rng=rng)
+    party: List[Personagem] = []
+    for classe_nome, stats in party_spec:
+        classe = CLASSES_HEROI[classe_nome]
+        stats = stats or distribuir_pontos_aleatorio(gerar_status_base_aleatorio(rng), 10, rng)
+        heroi = classe(f"{classe_nome} #{len(party) + 1}", stats)
+        preparar_heroi_inicial(heroi)
+        party.append(heroi)
+    return party
+
+
+def criar_ia(nome: str) -> Optional[IAInimigo]:
+    if nome not in IAS_SIMULACAO:
+        raise ValueError(f"IA desconhecida: {nome}")
+    return IAExpectimax(ORCAMENTO_SIMULACAO_MS) if nome == "expectimax" else None
+
+
+def jogar_batalha(batalha: Batalha, politica: Politica, max_rodadas: int = 200) -> bool:
+    while batalha.rodada <= max_rodadas:
+        if batalha.proximo_turno() != "Jogador":
+            return True
+        heroi = batalha.turno_ativo
+        acao, alvo = politica(batalha, heroi)
+        executar_acao(batalha, heroi, acao, alvo)
+        batalha.gerenciar_status_pos_turno(heroi)
+        if batalha.acaba():
+            return True
+    return False
+
+
+def simular_campanha(
+    party_spec: PartySpec,
+    floors: int = 10,
+    politica: Politica = politica_agressiva,
+    max_rodadas: int = 200,
+    sementes: Optional[SequenciaSementes] = None,
+    ia_inimigos: Optional[IAInimigo] = None,
+    ia: str = "aleatoria",
+) -> Dict[str, Any]:
+    ia_inimigos = ia_inimigos or criar_ia(ia)
+    rng = sementes.filho(0).rng() if sementes else None
+    campanha = Campanha(
+        montar_party_spec(party_spec, rng),
+        andar_final=floors,
+        registrar_eventos=False,
+        sementes=sementes,
+        ia_inimigos=ia_inimigos,
+    )
+    mortes: List[int] = []
+    rodadas: List[int] = []
+    resultado = "derrota"
+    while True:
+        vivos_antes = len(campanha.herois_vivos())
+        batalha = campanha.iniciar_andar()
+        if not batalha:
+            break
+        concluida = jogar_batalha(batalha, politica, max_rodadas)
+        mortes.append(vivos_antes - len(campanha.herois_vivos()))
+        rodadas.append(batalha.rodada)
+        if not concluida:
+            break
+        resultado = campanha.finalizar_andar()
+        if resultado != "proximo":
+            break
+    return {
+        "vitoria": resultado == "vitoria",
+        "andar": campanha.andar_atual,
+        "herois": len(campanha.party),
+        "mortes": mortes,
+        "rodadas": rodadas,
+    }
+
+
+def _simular_lote(
+    args: Tuple[range, PartySpec, int, Politica, int, int, Optional[IAInimigo], str]
+) -> List[Dict[str, Any]]:
+    indices, party_spec, floors, politica, max_rodadas, entropia, ia_inimigos, ia = args
+    ia_inimigos = ia_inimigos or criar_ia(ia)
+    raiz = SequenciaSementes(entropia)
+    return [simular_campanha(party_spec, floors, politica, max_rodadas, raiz.filho(i), ia_inimigos) for i in indices]
+
+
+def agregar_resultados(resultados: List[Dict[str, Any]], floors: int) -> Dict[str, Any]:
+    total = len(resultados)
+    vitorias = sum(1 for r in resultados if r["vitoria"])
+    andares = []
+    for andar in range(floors):
+        jogados = [r for r in resultados if len(r["mortes"]) > andar]
+        if not jogados:
+            andares.append({"andar": andar + 1, "batalhas": 0})
+            continue
+        wipes = sum(1 for r in jogados if len(r["mortes"]) == andar + 1 and not r["vitoria"])
+        herois_mortos = sum(r["mortes"][andar] for r in jogados)
+        rodadas = [r["rodadas"][andar] for r in jogados]
+        andares.append(
+            {
+                "andar": andar + 1,
+                "batalhas": len(jogados),
+                "taxa_derrota": wipes / len(jogados),
+                "mortes_por_batalha": herois_mortos / len(jogados),
+                "rodadas_media": sum(rodadas) / len(rodadas),
+                "rodadas_max": max(rodadas),
+            }
+        )
+    return {
+        "campanhas": total,
+        "vitorias": vitorias,
+        "taxa_vitoria": vitorias / total if total else 0.0,
+        "andares": andares,
+    }
+
+
+def simular_campanhas(
+    n: int,
+    party_spec: PartySpec,
+    floors: int = 10,
+    workers: Optional[int] = None,
+    politica: Politica = politica_agressiva,
+    seed: Optional[int] = None,
+    max_rodadas: int = 200,
+    ia_inimigos: Optional[IAInimigo] = None,
+    ia: str = "aleatoria",
+) -> Dict[str, Any]:
+    if ia not in IAS_SIMULACAO:
+        raise ValueError(f"IA desconhecida: {ia}")
+    workers = workers or os.cpu_count() or 1
+    lotes = min(n, workers * 4) or 1
+    entropia = SequenciaSementes(seed).entropia
+    tarefas = [
+        (range(i, n, lotes), party_spec, floors, politica, max_rodadas, entropia, ia_inimigos, ia)
+        for i in range(lotes)
+    ]
+    if workers == 1:
+        parciais = [_simular_lote(t) for t in tarefas]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parciais = list(pool.map(_simular_lote, tarefas))
+    resultados = [r for parcial in parciais for r in parcial]
+    return agregar_resultados(resultados, floors)
+
+
+simulate_campaigns = simular_campanhas
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+    import time
+
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    inicio = time.perf_counter()
+    relatorio = simular_campanhas(quantidade, "Guerreiro")
+    relatorio["segundos"] = round(time.perf_counter() - inicio, 3)
+    print(json.dumps(relatorio, indent=2, ensure_ascii=False))
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from dano import ModeloAtaque
+from motor import Batalha
+from transposicao import Efeitos as EfeitosUnidade, efeitos_unidade
+
+Efeitos = Tuple[EfeitosUnidade, ...]
+Estado = Tuple[Tuple[int, ...], Efeitos]
+
+
+# Exato só no modelo de ataque básico: sem habilidades, níveis ou drops durante a luta.
+class SolucionadorBatalha:
+    def __init__(
+        self,
+        batalha: Batalha,
+        politica_alvo: str = "aleatoria",
+        max_estados: Optional[int] = None,
+    ) -> None:
+        if politica_alvo not in ("aleatoria", "menor_vida"):
+            raise ValueError(f"Política de alvo desconhecida: {politica_alvo}")
+        self.politica_alvo = politica_alvo
+        self.max_estados = max_estados
+        self.unidades = list(batalha.herois) + list(batalha.inimigos)
+        self.n_herois = len(batalha.herois)
+        self.herois = tuple(range(self.n_herois))
+        self.inimigos = tuple(range(self.n_herois, len(self.unidades)))
+        self.modelo = ModeloAtaque(self.unidades)
+        self.velocidade = [u.velocidade for u in self.unidades]
+        self._cache_rodada: Dict[Estado, List[float]] = {}
+        self._cache_turno: Dict[Tuple[object, ...], List[float]] = {}
+
+        hp = tuple(u.vida for u in self.unidades)
+        efeitos = tuple(efeitos_unidade(u) for u in self.unidades)
+        posicoes = {id(u): i for i, u in enumerate(self.unidades)}
+        self.estado_inicial: Estado = (hp, efeitos)
+        self.ordem_inicial = tuple(posicoes[id(u)] for u in batalha.ordem)
+        self.ptr_inicial = batalha.turno_idx
+
+    def _ordem(self, hp: Tuple[int, ...], efeitos: Efeitos) -> Tuple[int, ...]:
+        vivos = [u for u in range(len(hp)) if hp[u] > 0]
+        vivos.sort(key=lambda u: (self.velocidade[u], self.modelo.forca(u, efeitos)), reverse=True)
+        return tuple(vivos)
+
+    def _acabou(self, hp: Tuple[int, ...]) -> bool:
+        return not any(hp[u] > 0 for u in self.herois) or not any(hp[u] > 0 for u in self.inimigos)
+
+    def _terminal(self, hp: Tuple[int, ...]) -> List[float]:
+        vitoria = 1.0 if any(hp[u] > 0 for u in self.herois) and not any(hp[u] > 0 for u in self.inimigos) else 0.0
+        return [vitoria] + [float(v) for v in hp]
+
+    def _alvos(self, a: int, hp: Tuple[int, ...]) -> List[Tuple[int, float]]:
+        if a < self.n_herois:
+            vivos = [u for u in self.inimigos if hp[u] > 0]
+            if self.politica_alvo == "menor_vida":
+                return [(min(vivos, key=lambda u: hp[u]), 1.0)]
+        else:
+            vivos = [u for u in self.herois if hp[u] > 0]
+        return [(u, 1.0 / len(vivos)) for u in vivos]
+
+    @staticmethod
+    def _pos_turno(u: int, efeitos: Efeitos) -> Efeitos:
+        crit, chamado, stacks, duracao = efeitos[u]
+        if not (crit or chamado or duracao):
+            return efeitos
+        duracao = max(0, duracao - 1)
+        novo = (max(0, crit - 1), max(0, chamado - 1), stacks if duracao > 0 else 0, duracao)
+        return efeitos[:u] + (novo,) + efeitos[u + 1 :]
+
+    def _lado_derrotado(self, u: int, hp: Tuple[int, ...]) -> bool:
+        lado = self.herois if u < self.n_herois else self.inimigos
+        return not any(hp[v] > 0 for v in lado)
+
+    def _turno(self, u: int, hp: Tuple[int, ...], efeitos: Efeitos) -> List[Tuple[Estado, float, bool]]:
+        if hp[u] <= 0:
+            return [((hp, efeitos), 1.0, False)]
+        stacks = efeitos[u][2]
+        if stacks:
+            hp = hp[:u] + (max(0, hp[u] - stacks),) + hp[u + 1 :]
+            if hp[u] <= 0:
+                return [((hp, efeitos), 1.0, self._lado_derrotado(u, hp))]
+        efeitos_depois = self._pos_turno(u, efeitos)
+        resultado: List[Tuple[Estado, float, bool]] = []
+        for alvo, p_alvo in self._alvos(u, hp):
+            for vida, p in self.modelo.ataque(u, alvo, hp[alvo], efeitos):
+                novo_hp = hp[:alvo] + (vida,) + hp[alvo + 1 :]
+                fim = vida <= 0 and self._lado_derrotado(alvo, novo_hp)
+                resultado.append(((novo_hp, efeitos_depois), p_alvo * p, fim))
+        return resultado
+
+    def _valor(self, hp: Tuple[int, ...], efeitos: Efeitos, ordem: Tuple[int, ...], ptr: int) -> List[float]:
+        if ptr >= len(ordem):
+            return self._valor_rodada((hp, efeitos))
+        chave = (hp, efeitos, ordem, ptr)
+        valor = self._cache_turno.get(chave)
+        if valor is not None:
+            return valor
+        valor = [0.0] * (len(self.unidades) + 1)
+        for (novo_hp, novo_efeitos), q, fim in self._turno(ordem[ptr], hp, efeitos):
+            v = self._terminal(novo_hp) if fim else self._valor(novo_hp, novo_efeitos, ordem, ptr + 1)
+            valor = [acc + q * x for acc, x in zip(valor, v)]
+        self._registrar(self._cache_turno, chave, valor)
+        return valor
+
+    def _registrar(self, cache: Dict, chave: object, valor: List[float]) -> None:
+        cache[chave] = valor
+        if self.max_estados and len(self._cache_turno) + len(self._cache_rodada) > self.max_estados:
+            raise ValueError(f"Espaço de estados excede o limite de {self.max_estados} estados.")
+
+    def _valor_rodada(self, estado: Estado) -> List[float]:
+        valor = self._cache_rodada.get(estado)
+        if valor is not None:
+            return valor
+        ordem = self._ordem(*estado)
+        valor = [0.0] * (len(self.unidades) + 1)
+        p_repetir = 1.0
+        for ptr, u in enumerate(ordem):
+            p_inalterado = 0.0
+            for novo, q, fim in self._turno(u, *estado):
+                if novo == estado:
+                    p_inalterado += q
+                    continue
+                v = self._terminal(novo[0]) if fim else self._valor(novo[0], novo[1], ordem, ptr + 1)
+                peso = p_repetir * q
+                valor = [acc + peso * x for acc, x in zip(valor, v)]
+            p_repetir *= p_inalterado
+            if not p_repetir:
+                break
+        if p_repetir >= 1.0:
+            valor = self._terminal(estado[0])
+            valor[0] = 0.0
+        elif p_repetir:
+            valor = [v / (1.0 - p_repetir) for v in valor]
+        self._registrar(self._cache_rodada, estado, valor)
+        return valor
+
+    def resolver(self) -> Dict[str, object]:
+        hp, efeitos = self.estado_inicial
+        limite = sys.getrecursionlimit()
+        sys.setrecursionlimit(max(limite, 20_000))
+        try:
+            if self._acabou(hp):
+                valor = self._terminal(hp)
+            else:
+                valor = self._valor(hp, efeitos, self.ordem_inicial, self.ptr_inicial)
+        finally:
+            sys.setrecursionlimit(limite)
+        return {
+            "prob_vitoria": valor[0],
+            "vida_esperada": {u.nome: valor[i + 1] for i, u in enumerate(self.unidades)},
+            "vida_herois_esperada": sum(valor[i + 1] for i in self.herois),
+            "estados": len(self._cache_rodada) + len(self._cache_turno),
+        }
+
+
+def resolver_batalha(
+    batalha: Batalha,
+    politica_alvo: str = "aleatoria",
+    max_estados: Optional[int] = None,
+) -> Dict[str, object]:
+    return SolucionadorBatalha(batalha, politica_alvo, max_estados).resolver()
+
+
+def prob_vitoria_ataque_basico(batalha: Batalha, politica_alvo: str = "aleatoria") -> float:
+    return float(resolver_batalha(batalha, politica_alvo)["prob_vitoria"])
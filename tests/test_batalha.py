@@ -0,0 +1,134 @@
+from motor import (
+    Arma,
+    PocaoCura,
+    Queimacao,
+    SequenciaSementes,
+    equipar_do_inventario,
+    executar_acao,
+    iniciar_campanha,
+)
+from simulacao import politica_aleatoria
+
+
+def _batalha(semente=5, classe="Mago", andar=2):
+    campanha = iniciar_campanha("Herói", classe, sementes=SequenciaSementes(semente))
+    campanha.andar_atual = andar
+    return campanha.iniciar_andar()
+
+
+def _jogar(batalha, turnos, politica=politica_aleatoria):
+    jogadas = []
+    for _ in range(turnos):
+        if batalha.proximo_turno() != "Jogador":
+            break
+        heroi = batalha.turno_ativo
+        acao, alvo = politica(batalha, heroi)
+        executar_acao(batalha, heroi, acao, alvo)
+        batalha.gerenciar_status_pos_turno(heroi)
+        jogadas.append((heroi.nome, acao, alvo.nome if alvo else None))
+        if batalha.acaba():
+            break
+    return jogadas
+
+
+def _resumo(batalha):
+    return [
+        (
+            u.vida,
+            u.vida_max,
+            u.forca,
+            u.defesa,
+            u.velocidade,
+            u.nivel,
+            u.xp_atual,
+            u.turnos,
+            [item.nome if item else None for item in u.equipamento.values()],
+            [item.nome for item in u.inventario.itens],
+            sorted(u.status_effects),
+        )
+        for u in batalha.herois + batalha.inimigos
+    ] + [batalha.rodada, batalha.rng.getstate()]
+
+
+def test_restaurar_repete_a_batalha():
+    for semente in range(6):
+        batalha = _batalha(semente)
+        _jogar(batalha, 3)
+        estado = batalha.capturar(com_rng=True)
+        inicio = batalha.log.total
+        jogadas = _jogar(batalha, 40)
+        assert jogadas
+        fim = _resumo(batalha)
+        eventos = batalha.log.desde(inicio)
+        batalha.restaurar(estado)
+        assert batalha.capturar(com_rng=True) == estado
+        inicio = batalha.log.total
+        assert _jogar(batalha, 40) == jogadas
+        assert _resumo(batalha) == fim
+        assert batalha.log.desde(inicio) == eventos
+
+
+def test_restaurar_desfaz_equipamento_itens_nivel_e_efeitos():
+    batalha = _batalha(classe="Guerreiro")
+    heroi = batalha.herois[0]
+    arma = Arma(atk_bonus=6, nome_base="Espada de Teste")
+    heroi.inventario.adicionar(arma)
+    heroi.inventario.adicionar(PocaoCura())
+    heroi.vida -= 5
+    estado = batalha.capturar()
+    atributos = (heroi.vida, heroi.vida_max, heroi.forca, heroi.defesa, heroi.velocidade, heroi.nivel)
+    arma_antes = heroi.equipamento.arma
+    itens = list(heroi.inventario.itens)
+
+    assert equipar_do_inventario(heroi, arma, batalha)
+    executar_acao(batalha, heroi, "curar")
+    heroi.ganhar_xp(heroi.xp_proximo_nivel * 3, batalha)
+    Queimacao().aplicar(heroi, batalha)
+    assert heroi.forca > atributos[2]
+    assert heroi.nivel > atributos[5]
+
+    batalha.restaurar(estado)
+    assert (heroi.vida, heroi.vida_max, heroi.forca, heroi.defesa, heroi.velocidade, heroi.nivel) == atributos
+    assert heroi.equipamento.arma is arma_antes
+    assert heroi.inventario.itens == itens
+    assert not heroi.status_effects
+    assert batalha.capturar() == estado
+
+
+def _vivos_recalculados(batalha):
+    return tuple({i for i, u in enumerate(lado) if u.esta_vivo()} for lado in (batalha.herois, batalha.inimigos))
+
+
+def test_vivos_acompanha_mortes_curas_e_restauracao():
+    for semente in range(8):
+        batalha = _batalha(semente, classe="Guerreiro", andar=3)
+        estados = [(batalha.capturar(), _vivos_recalculados(batalha))]
+        while batalha.proximo_turno() == "Jogador":
+            assert batalha.vivos == _vivos_recalculados(batalha)
+            heroi = batalha.turno_ativo
+            acao, alvo = politica_aleatoria(batalha, heroi)
+            executar_acao(batalha, heroi, acao, alvo)
+            batalha.gerenciar_status_pos_turno(heroi)
+            assert batalha.vivos == _vivos_recalculados(batalha)
+            assert batalha.unidades_vivas(batalha.herois) == [u for u in batalha.herois if u.esta_vivo()]
+            estados.append((batalha.capturar(), _vivos_recalculados(batalha)))
+            if batalha.acaba():
+                break
+        assert batalha.vivos == _vivos_recalculados(batalha)
+        for estado, vivos in reversed(estados):
+            batalha.restaurar(estado)
+            assert batalha.vivos == vivos == _vivos_recalculados(batalha)
+
+
+def test_cura_e_dano_direto_atualizam_vivos():
+    batalha = _batalha(classe="Guerreiro")
+    heroi = batalha.herois[1]
+    heroi.vida = 0
+    assert 1 not in batalha.vivos[0]
+    assert heroi not in batalha.unidades_vivas(batalha.herois)
+    heroi.curar(5)
+    assert 1 in batalha.vivos[0]
+    for inimigo in batalha.inimigos:
+        inimigo.vida -= inimigo.vida
+    assert not batalha.vivos[1]
+    assert batalha.acaba()
@@ -0,0 +1,84 @@
+import time
+
+import pytest
+
+from conselheiro import MIN_ROLLOUTS, Conselheiro, ConselheiroSegundoPlano, melhores_por_acao
+from ia import BuscaExpectimax, alvo_guloso
+from motor import SequenciaSementes, executar_acao, iniciar_campanha
+
+
+def _turno_do_heroi(semente=2):
+    campanha = iniciar_campanha("Herói", "Guerreiro", sementes=SequenciaSementes(semente))
+    batalha = campanha.iniciar_andar()
+    while batalha.proximo_turno() != "Jogador":
+        pass
+    return batalha, batalha.turno_ativo
+
+
+def _estado(batalha):
+    return batalha.capturar(), batalha.log.total
+
+
+def test_avaliacoes_deterministicas_e_sem_efeito_na_batalha():
+    batalha, heroi = _turno_do_heroi()
+    antes = _estado(batalha)
+    a = Conselheiro(batalha, heroi, semente=3).refinar(8)
+    b = Conselheiro(batalha, heroi, semente=3).refinar(8)
+    assert a == b
+    assert _estado(batalha) == antes
+    assert {avaliacao.acao for avaliacao in a} >= {"atacar", "passar"}
+    for avaliacao in a:
+        assert avaliacao.rollouts == 8
+        assert 0.0 <= avaliacao.prob_vitoria <= 1.0
+
+
+@pytest.mark.parametrize("classe", ["Guerreiro", "Mago", "Arqueiro"])
+def test_alvo_guloso_igual_a_busca_de_profundidade_1(classe):
+    campanha = iniciar_campanha("Herói", classe, sementes=SequenciaSementes(6))
+    campanha.andar_atual = 3
+    batalha = campanha.iniciar_andar()
+    comparados = 0
+    while not batalha.acaba() and batalha.proximo_turno() == "Jogador":
+        heroi = batalha.turno_ativo
+        executar_acao(batalha, heroi, "atacar", batalha.unidades_vivas(batalha.inimigos)[0])
+        batalha.gerenciar_status_pos_turno(heroi)
+        if len(batalha.unidades_vivas(batalha.herois)) > 1:
+            for inimigo in batalha.unidades_vivas(batalha.inimigos):
+                assert alvo_guloso(batalha, inimigo) is BuscaExpectimax(batalha, inimigo).melhor_alvo(1)
+                comparados += 1
+    assert comparados
+
+
+def test_rollouts_usam_o_inimigo_guloso():
+    batalha, heroi = _turno_do_heroi()
+    assert Conselheiro(batalha, heroi).batalha.ia_inimigos is alvo_guloso
+
+
+def test_convergencia_exige_minimo_de_rollouts():
+    batalha, heroi = _turno_do_heroi()
+    conselheiro = Conselheiro(batalha, heroi)
+    conselheiro.refinar(8)
+    assert not conselheiro.convergiu()
+    while conselheiro.rollouts < MIN_ROLLOUTS:
+        conselheiro.refinar()
+    assert conselheiro.rollouts == MIN_ROLLOUTS
+
+
+def test_melhores_por_acao():
+    batalha, heroi = _turno_do_heroi()
+    avaliacoes = Conselheiro(batalha, heroi).refinar(8)
+    melhores = melhores_por_acao(avaliacoes)
+    for acao, melhor in melhores.items():
+        candidatas = [a for a in avaliacoes if a.acao == acao]
+        assert max((a.prob_vitoria, a.dano_medio) for a in candidatas) == (melhor.prob_vitoria, melhor.dano_medio)
+
+
+def test_segundo_plano_para_no_limite():
+    batalha, heroi = _turno_do_heroi()
+    segundo_plano = ConselheiroSegundoPlano(Conselheiro(batalha, heroi), max_rollouts=16)
+    limite = time.monotonic() + 30
+    while segundo_plano.ativo():
+        assert time.monotonic() < limite
+        time.sleep(0.01)
+    ultimas = segundo_plano.ultimas()
+    assert ultimas and all(avaliacao.rollouts == 16 for avaliacao in ultimas)
@@ -0,0 +1,108 @@
+from fractions import Fraction
+from itertools import product
+import random
+
+import pytest
+
+from dano import FACES, ModeloAtaque, distribuicao_ataque, distribuicao_dano
+from motor import Arqueiro, Batalha, Bruxa, Guerreiro, Mago, calcular_dano_rpg
+
+
+class DadosRoteirizados:
+    def __init__(self, valores):
+        self.valores = list(valores)
+
+    def randint(self, a, b):
+        return self.valores.pop(0)
+
+
+def _unidade(classe, atk, defesa):
+    return classe("U", {"HP": 20, "ATK": atk, "DEF": defesa, "SPD": 10})
+
+
+def _pmf_por_enumeracao(atacante, defensor, **opcoes):
+    contagens = {}
+    for d_atk, d_def in product(range(1, FACES + 1), repeat=2):
+        dano, _, _ = calcular_dano_rpg(atacante, defensor, rng=DadosRoteirizados((d_atk, d_def)), **opcoes)
+        contagens[dano] = contagens.get(dano, 0) + 1
+    return {dano: Fraction(c, FACES * FACES) for dano, c in sorted(contagens.items())}
+
+
+@pytest.mark.parametrize("atk,defesa", [(8, 8), (25, 6), (6, 30), (40, 12)])
+@pytest.mark.parametrize("opcoes", [{}, {"dano_base_extra": 2}, {"defensor_ignora_def_bonus": True}])
+def test_pmf_igual_a_calcular_dano_rpg(atk, defesa, opcoes):
+    atacante = _unidade(Guerreiro, atk, 10)
+    defensor = _unidade(Arqueiro, 10, defesa)
+    dist = distribuicao_ataque(atacante, defensor, **opcoes)
+    assert dist.pmf_exata() == _pmf_por_enumeracao(atacante, defensor, **opcoes)
+
+
+def test_pmf_com_buff_de_critico():
+    atacante = _unidade(Arqueiro, 20, 10)
+    defensor = _unidade(Guerreiro, 10, 15)
+    atacante.crit_chance_buff = 2
+    dist = distribuicao_ataque(atacante, defensor)
+    assert dist.pmf_exata() == _pmf_por_enumeracao(atacante, defensor)
+    assert dist.prob_critico == 1 - dist.prob_erro
+
+
+@pytest.mark.parametrize("diferenca", range(-6, 8))
+@pytest.mark.parametrize("critico", [False, True])
+def test_pmf_soma_um(diferenca, critico):
+    dist = distribuicao_dano(diferenca, 0, crit_buff=critico)
+    assert sum(dist.pmf_exata().values()) == 1
+    assert sum(dist.pmf.values()) == pytest.approx(1.0)
+    assert dist.media == pytest.approx(sum(d * p for d, p in dist.pmf.items()))
+
+
+@pytest.mark.parametrize("diferenca", range(-6, 8))
+@pytest.mark.parametrize("critico", [False, True])
+def test_tabela_alias_reproduz_contagens(diferenca, critico):
+    dist = distribuicao_dano(diferenca, 0, crit_buff=critico)
+    n = len(dist._prob)
+    massa = [0.0] * n
+    for i, (prob, alias) in enumerate(zip(dist._prob, dist._alias)):
+        massa[i] += prob / n
+        massa[alias] += (1 - prob) / n
+    esperado = [c / dist.total for c in dist.contagens]
+    assert massa == pytest.approx(esperado)
+
+
+def test_amostrar_e_deterministico_com_semente():
+    dist = distribuicao_dano(3, 1)
+    a = [dist.amostrar(random.Random(7)) for _ in range(5)]
+    b = [dist.amostrar(random.Random(7)) for _ in range(5)]
+    assert a == b
+    assert all(resultado in dist.resultados for resultado in a)
+
+
+@pytest.mark.parametrize("classe", [Mago, Arqueiro, Bruxa])
+def test_modelo_ataque_igual_ao_motor(classe):
+    rng = random.Random(5)
+    atacante = Bruxa(1, rng=rng) if classe is Bruxa else _unidade(classe, 18, 10)
+    defensor = _unidade(Guerreiro, 10, 24)
+    defensor.vida = 9
+    if classe is Bruxa:
+        batalha = Batalha([defensor], [atacante], registrar_eventos=False, rng=rng)
+    else:
+        batalha = Batalha([atacante], [defensor], registrar_eventos=False, rng=rng)
+    modelo = ModeloAtaque([atacante, defensor])
+    esperado = dict(modelo.ataque(0, 1, 9, [(0, 0, 0, 0), (0, 0, 0, 0)]))
+    n = 20_000
+    contagens = {}
+    for _ in range(n):
+        atacante.atacar(defensor, batalha, batalha.herois)
+        contagens[defensor.vida] = contagens.get(defensor.vida, 0) + 1
+        defensor.vida = 9
+    assert sum(esperado.values()) == pytest.approx(1.0)
+    for restante in set(esperado) | set(contagens):
+        assert contagens.get(restante, 0) / n == pytest.approx(esperado.get(restante, 0.0), abs=0.015)
+
+
+@pytest.mark.parametrize("classe", [Mago, Arqueiro, Bruxa])
+def test_dano_medio_igual_ao_modelo_sem_limite_de_vida(classe):
+    atacante = Bruxa(1, rng=random.Random(2)) if classe is Bruxa else _unidade(classe, 18, 10)
+    modelo = ModeloAtaque([atacante, _unidade(Guerreiro, 10, 12)])
+    efeitos = [(0, 0, 0, 0), (0, 0, 0, 0)]
+    media = sum((200 - vida) * p for vida, p in modelo.ataque(0, 1, 200, efeitos))
+    assert modelo.dano_medio(0, 1, efeitos) == pytest.approx(media)
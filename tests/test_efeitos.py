@@ -0,0 +1,95 @@
+import random
+
+from motor import Arqueiro, Batalha, Guerreiro, Orc, Queimacao, RodaExpiracao, StatusEffect
+
+
+class EfeitoLongo(StatusEffect):
+    __slots__ = ()
+
+    duracao_max = RodaExpiracao.TAMANHO + 3
+
+
+def _batalha():
+    herois = [
+        Guerreiro("Guerreiro", {"HP": 30, "ATK": 12, "DEF": 10, "SPD": 10}),
+        Arqueiro("Arqueiro", {"HP": 20, "ATK": 12, "DEF": 8, "SPD": 12}),
+    ]
+    inimigos = [Orc(1, rng=random.Random(0))]
+    return Batalha(herois, inimigos, registrar_eventos=False, rng=random.Random(0))
+
+
+def _passar_turnos(batalha, unidade, n):
+    for _ in range(n):
+        batalha.gerenciar_status_pos_turno(unidade)
+
+
+def test_chamado_reverte_atributos_ao_expirar():
+    batalha = _batalha()
+    heroi = batalha.herois[1]
+    forca, defesa = heroi.forca, heroi.defesa
+    Guerreiro.ChamadoLiderBuff(5, 3).aplicar(heroi, batalha)
+    assert (heroi.forca, heroi.defesa) == (forca + 5, defesa + 3)
+    _passar_turnos(batalha, heroi, 1)
+    assert Guerreiro.ChamadoLiderBuff.nome in heroi.status_effects
+    _passar_turnos(batalha, heroi, 1)
+    assert Guerreiro.ChamadoLiderBuff.nome not in heroi.status_effects
+    assert (heroi.forca, heroi.defesa) == (forca, defesa)
+
+
+def test_chamado_acumulado_reverte_a_soma_no_novo_prazo():
+    batalha = _batalha()
+    heroi = batalha.herois[0]
+    forca, defesa = heroi.forca, heroi.defesa
+    Guerreiro.ChamadoLiderBuff(5, 3).aplicar(heroi, batalha)
+    _passar_turnos(batalha, heroi, 1)
+    Guerreiro.ChamadoLiderBuff(2, 7).aplicar(heroi, batalha)
+    assert (heroi.forca, heroi.defesa) == (forca + 7, defesa + 10)
+    _passar_turnos(batalha, heroi, 1)
+    assert (heroi.forca, heroi.defesa) == (forca + 7, defesa + 10)
+    _passar_turnos(batalha, heroi, 1)
+    assert Guerreiro.ChamadoLiderBuff.nome not in heroi.status_effects
+    assert (heroi.forca, heroi.defesa) == (forca, defesa)
+    _passar_turnos(batalha, heroi, 2 * RodaExpiracao.TAMANHO)
+    assert (heroi.forca, heroi.defesa) == (forca, defesa)
+
+
+def test_olho_de_aguia_e_queimacao_expiram():
+    batalha = _batalha()
+    arqueiro = batalha.herois[1]
+    orc = batalha.inimigos[0]
+    Arqueiro.OlhoAguiaBuff().aplicar(arqueiro, batalha)
+    Queimacao().aplicar(orc, batalha)
+    _passar_turnos(batalha, orc, 1)
+    Queimacao().aplicar(orc, batalha)
+    assert orc.status_effects[Queimacao.nome].stacks == 2
+    _passar_turnos(batalha, arqueiro, 2)
+    assert arqueiro.crit_chance_buff == 0
+    assert not arqueiro.status_effects
+    _passar_turnos(batalha, orc, 1)
+    assert Queimacao.nome in orc.status_effects
+    _passar_turnos(batalha, orc, 1)
+    assert not orc.status_effects
+
+
+def test_duracao_maior_que_a_roda():
+    batalha = _batalha()
+    heroi = batalha.herois[0]
+    EfeitoLongo().aplicar(heroi, batalha)
+    _passar_turnos(batalha, heroi, EfeitoLongo.duracao_max - 1)
+    assert EfeitoLongo.nome in heroi.status_effects
+    _passar_turnos(batalha, heroi, 1)
+    assert EfeitoLongo.nome not in heroi.status_effects
+
+
+def test_expiracao_sobrevive_a_capturar_e_restaurar():
+    batalha = _batalha()
+    heroi = batalha.herois[0]
+    forca = heroi.forca
+    Guerreiro.ChamadoLiderBuff(4, 4).aplicar(heroi, batalha)
+    estado = batalha.capturar()
+    _passar_turnos(batalha, heroi, 2)
+    assert heroi.forca == forca
+    batalha.restaurar(estado)
+    assert heroi.forca == forca + 4
+    _passar_turnos(batalha, heroi, 2)
+    assert heroi.forca == forca
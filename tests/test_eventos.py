@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from eventos import EventoDerrota, EventoMensagem, LogEventos, agrupar_por_tag
+
+
+def _mensagens(n, inicio=0):
+    return [EventoMensagem(f"evento {i}") for i in range(inicio, inicio + n)]
+
+
+def test_capacidade_invalida():
+    with pytest.raises(ValueError):
+        LogEventos(0)
+
+
+def test_descarta_os_mais_antigos():
+    log = LogEventos(3)
+    for evento in _mensagens(5):
+        log.append(evento)
+    assert log.total == 5
+    assert log.inicio == 2
+    assert len(log) == 3
+    assert [e.modelo for e in log] == ["evento 2", "evento 3", "evento 4"]
+    assert log[0].modelo == "evento 2"
+
+
+def test_desde_usa_posicoes_absolutas():
+    log = LogEventos(4)
+    for evento in _mensagens(3):
+        log.append(evento)
+    posicao = log.total
+    assert log.desde(posicao) == []
+    for evento in _mensagens(3, inicio=3):
+        log.append(evento)
+    assert [e.modelo for e in log.desde(posicao)] == ["evento 3", "evento 4", "evento 5"]
+    assert [e.modelo for e in log.desde(4)] == ["evento 4", "evento 5"]
+    assert [e.modelo for e in log.desde(0)] == [e.modelo for e in log]
+    assert log.desde(log.total + 10) == []
+
+
+def test_despejo_em_disco_guarda_todos_os_eventos(tmp_path):
+    caminho = tmp_path / "log.jsonl"
+    log = LogEventos(2, str(caminho))
+    eventos = _mensagens(4) + [EventoDerrota("Orc", "Herói")]
+    for evento in eventos:
+        log.append(evento)
+    assert len(log) == 2
+    log.fechar()
+    log.fechar()
+    registros = [json.loads(linha) for linha in caminho.read_text(encoding="utf-8").splitlines()]
+    assert [r["evento"] for r in registros] == ["EventoMensagem"] * 4 + ["EventoDerrota"]
+    assert [r.get("modelo") for r in registros[:4]] == [e.modelo for e in eventos[:4]]
+    assert registros[-1]["alvo"] == "Orc"
+
+
+def test_fechar_sem_arquivo_nao_grava_nada():
+    log = LogEventos(2)
+    for evento in _mensagens(3):
+        log.append(evento)
+    log.fechar()
+    assert log.total == 3
+
+
+def test_agrupar_por_tag_junta_tags_seguidas():
+    linhas = [("a", "damage"), ("b", "damage"), ("c", "heal"), ("d", "damage")]
+    assert agrupar_por_tag(linhas) == [("a\nb\n", "damage"), ("c\n", "heal"), ("d\n", "damage")]
@@ -0,0 +1,89 @@
+import random
+
+from motor import Batalha, Guerreiro, Orc
+
+
+def _unidade(nome, velocidade, forca=10):
+    return Guerreiro(nome, {"HP": 20, "ATK": forca, "DEF": 10, "SPD": velocidade})
+
+
+def _batalha(velocidades, modo="rodadas"):
+    herois = [_unidade(f"H{i}", v) for i, v in enumerate(velocidades)]
+    inimigos = [Orc(1, rng=random.Random(0))]
+    inimigos[0]._velocidade_base = 1
+    return Batalha(herois, inimigos, registrar_eventos=False, rng=random.Random(0), modo_iniciativa=modo)
+
+
+def _turnos(batalha, n):
+    return [batalha.agenda.proximo(batalha).nome for _ in range(n)]
+
+
+def test_rodadas_ordenadas_por_velocidade_e_forca():
+    batalha = _batalha([8, 12, 8])
+    batalha.herois[2]._forca_base += 5
+    assert _turnos(batalha, 4) == ["H1", "H0", "H2", batalha.inimigos[0].nome]
+    assert _turnos(batalha, 4) == ["H1", "H2", "H0", batalha.inimigos[0].nome]
+
+
+def test_mudanca_de_velocidade_vale_na_proxima_rodada():
+    batalha = _batalha([12, 10, 8])
+    orc = batalha.inimigos[0].nome
+    assert _turnos(batalha, 1) == ["H0"]
+    batalha.herois[2]._velocidade_base += 10
+    assert _turnos(batalha, 3) == ["H1", "H2", orc]
+    assert _turnos(batalha, 4) == ["H2", "H0", "H1", orc]
+
+
+def test_morto_sai_da_fila_e_volta_ao_reviver():
+    batalha = _batalha([12, 10, 8])
+    orc = batalha.inimigos[0].nome
+    batalha.herois[1].vida = 0
+    assert _turnos(batalha, 3) == ["H0", "H2", orc]
+    assert [u.nome for u in batalha.ordem] == ["H0", "H1", "H2", orc]
+    batalha.herois[1].vida = 5
+    assert _turnos(batalha, 4) == ["H0", "H1", "H2", orc]
+
+
+def test_fila_igual_a_reordenar_tudo():
+    rng = random.Random(3)
+    batalha = _batalha([rng.randint(1, 20) for _ in range(12)])
+    unidades = batalha.herois + batalha.inimigos
+    for _ in range(300):
+        unidade = rng.choice(batalha.herois)
+        sorteio = rng.random()
+        if sorteio < 0.4:
+            unidade._velocidade_base += rng.randint(-3, 3)
+        elif sorteio < 0.7:
+            unidade._forca_base += rng.randint(-3, 3)
+        else:
+            unidade.vida = 0 if unidade.esta_vivo() else 10
+        batalha.agenda.indice = len(batalha.agenda.ordem)
+        batalha.agenda.proximo(batalha)
+        vivos = [u for u in unidades if u.esta_vivo()]
+        esperado = sorted(vivos, key=lambda u: (u.velocidade, u.forca), reverse=True)
+        assert batalha.ordem == esperado
+
+
+def test_atb_unidade_rapida_age_mais_vezes():
+    batalha = _batalha([20, 10, 10], modo="atb")
+    batalha.herois[2]._forca_base += 5
+    turnos = _turnos(batalha, 6)
+    assert turnos == ["H0", "H0", "H2", "H1", "H0", "H0"]
+    assert batalha.rodada == 2
+
+
+def test_atb_ordem_reflete_o_heap():
+    batalha = _batalha([20, 10, 5], modo="atb")
+    orc = batalha.inimigos[0].nome
+    assert [u.nome for u in batalha.ordem] == ["H0", "H1", "H2", orc]
+    _turnos(batalha, 1)
+    assert [u.nome for u in batalha.ordem] == ["H0", "H1", "H2", orc]
+    batalha.herois[1].vida = 0
+    assert [u.nome for u in batalha.ordem] == ["H0", "H2", orc]
+
+
+def test_atb_mudanca_de_velocidade_no_meio_da_luta():
+    batalha = _batalha([10, 10], modo="atb")
+    assert _turnos(batalha, 2) == ["H0", "H1"]
+    batalha.herois[1]._velocidade_base += 10
+    assert _turnos(batalha, 4) == ["H1", "H1", "H0", "H1"]
@@ -0,0 +1,118 @@
+import gc
+import random
+import weakref
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from heroeis import ListaItens, texto_item
+from motor import Arma, Item, PocaoCura
+
+
+class ListboxFalsa:
+    def __init__(self):
+        self.linhas = []
+        self.chamadas = 0
+
+    def insert(self, indice, *textos):
+        self.chamadas += 1
+        if indice == "end":
+            indice = len(self.linhas)
+        self.linhas[indice:indice] = list(textos)
+
+    def delete(self, inicio, fim=None):
+        self.chamadas += 1
+        fim = inicio if fim is None else fim
+        fim = len(self.linhas) - 1 if fim == "end" else fim
+        del self.linhas[inicio : fim + 1]
+
+    def itemconfig(self, indice, **opcoes):
+        pass
+
+
+def _conferir(lista, listbox, itens):
+    assert lista.itens == itens
+    assert listbox.linhas == ([texto_item(item) for item in itens] or [lista.vazio])
+
+
+def _itens(n):
+    rng = random.Random(0)
+    return [Arma(rng=rng) if i % 3 == 0 else PocaoCura() if i % 3 == 1 else Item(f"Item {i}") for i in range(n)]
+
+
+def test_abrir_insere_tudo_de_uma_vez():
+    listbox = ListboxFalsa()
+    lista = ListaItens(listbox)
+    itens = _itens(300)
+    lista.sincronizar(itens)
+    _conferir(lista, listbox, itens)
+    assert listbox.chamadas == 1
+
+
+def test_remocao_e_insercao_so_tocam_linhas_alteradas():
+    listbox = ListboxFalsa()
+    lista = ListaItens(listbox)
+    itens = _itens(300)
+    lista.sincronizar(itens)
+    novo = Item("Novo")
+    novos = itens[:100] + itens[101:] + [novo]
+    listbox.chamadas = 0
+    lista.sincronizar(novos)
+    _conferir(lista, listbox, novos)
+    assert listbox.chamadas == 2
+
+
+def test_lista_vazia_mostra_aviso():
+    listbox = ListboxFalsa()
+    lista = ListaItens(listbox)
+    lista.sincronizar([])
+    assert listbox.linhas == [lista.vazio]
+    itens = _itens(3)
+    lista.sincronizar(itens)
+    _conferir(lista, listbox, itens)
+    lista.sincronizar([])
+    _conferir(lista, listbox, [])
+
+
+def test_reordenacao_reconstroi():
+    listbox = ListboxFalsa()
+    lista = ListaItens(listbox)
+    itens = _itens(10)
+    lista.sincronizar(itens)
+    invertidos = list(reversed(itens))
+    lista.sincronizar(invertidos)
+    _conferir(lista, listbox, invertidos)
+
+
+def test_edicoes_aleatorias():
+    rng = random.Random(1)
+    estoque = _itens(40)
+    listbox = ListboxFalsa()
+    lista = ListaItens(listbox)
+    atual = []
+    for _ in range(2000):
+        novos = list(atual)
+        sorteio = rng.random()
+        if sorteio < 0.3 and novos:
+            del novos[rng.randrange(len(novos))]
+        elif sorteio < 0.35:
+            rng.shuffle(novos)
+        elif sorteio < 0.4:
+            novos = []
+        else:
+            novos.insert(rng.randrange(len(novos) + 1), rng.choice(estoque))
+        if rng.random() < 0.3:
+            novos.append(rng.choice(estoque))
+        lista.sincronizar(novos)
+        _conferir(lista, listbox, novos)
+        atual = novos
+
+
+def test_texto_em_cache_nao_segura_o_item():
+    item = Arma(atk_bonus=2, nome_base="Arma Descartada")
+    ref = weakref.ref(item)
+    assert texto_item(item) is texto_item(item)
+    del item
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from motor import Batalha, gerar_monstro_aleatorio_escalado, montar_party
+from motor_vetorizado import comparar_com_referencia
+
+
+def _andar_3(rng):
+    party = montar_party("Herói", "Mago", rng=rng)
+    inimigos = [gerar_monstro_aleatorio_escalado(3, rng) for _ in range(2)]
+    return Batalha(party, inimigos, registrar_eventos=False, rng=rng)
+
+
+def test_estatisticas_iguais_ao_motor_de_referencia():
+    comparacao = comparar_com_referencia(_andar_3, n=2000, seed=4)
+    vetorizado, referencia = comparacao["vitoria"]
+    assert 0.1 < referencia < 0.9
+    assert vetorizado == pytest.approx(referencia, abs=0.03)
+    vetorizado, referencia = comparacao["rodadas"]
+    assert vetorizado == pytest.approx(referencia, rel=0.03)
+    vetorizado, referencia = comparacao["vida_herois"]
+    assert vetorizado == pytest.approx(referencia, rel=0.08)
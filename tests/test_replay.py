@@ -0,0 +1,103 @@
+import io
+import random
+
+import pytest
+
+from ia import IAExpectimax
+from motor import Equipamento, SequenciaSementes, equipar_do_inventario, executar_acao, iniciar_campanha
+from replay import GravadorReplay, Replay, ReprodutorReplay
+from simulacao import politica_agressiva
+
+
+def _jogar_gravando(semente, classe, andar_final=10, ia=None):
+    sementes = SequenciaSementes(semente)
+    campanha = iniciar_campanha("Herói", classe, sementes=sementes, andar_final=andar_final)
+    saida = io.BytesIO()
+    gravador = GravadorReplay(saida, "Herói", classe, None, sementes, andar_final)
+    if ia is not None:
+        campanha.ia_inimigos = gravador.registrar_ia(ia)
+    rng = random.Random(semente)
+    while True:
+        batalha = campanha.iniciar_andar()
+        if not batalha:
+            return campanha, "derrota", saida.getvalue()
+        gravador.andar(campanha.andar_atual)
+        while not batalha.acaba():
+            gravador.turno()
+            if batalha.proximo_turno() != "Jogador":
+                continue
+            heroi = batalha.turno_ativo
+            equipamentos = [item for item in heroi.inventario.itens if isinstance(item, Equipamento)]
+            if equipamentos and rng.random() < 0.5:
+                indice = heroi.inventario.itens.index(equipamentos[0])
+                if equipar_do_inventario(heroi, equipamentos[0], batalha):
+                    gravador.equipar(campanha.party, heroi, indice)
+            acao, alvo = politica_agressiva(batalha, heroi)
+            gravador.acao(batalha, acao, alvo)
+            executar_acao(batalha, heroi, acao, alvo)
+            batalha.gerenciar_status_pos_turno(heroi)
+        resultado = campanha.finalizar_andar()
+        if resultado != "proximo":
+            return campanha, resultado, saida.getvalue()
+
+
+def _estado(campanha):
+    return campanha.andar_atual, [
+        (
+            h.vida,
+            h.vida_max,
+            h.nivel,
+            h.xp_atual,
+            h.forca,
+            h.defesa,
+            h.velocidade,
+            [item.nome if item else None for item in h.equipamento.values()],
+            [item.nome for item in h.inventario.itens],
+        )
+        for h in campanha.party
+    ]
+
+
+@pytest.mark.parametrize("semente,classe", [(1, "Guerreiro"), (2, "Mago"), (3, "Arqueiro"), (4, "Guerreiro")])
+def test_replay_reproduz_a_campanha(semente, classe):
+    campanha, resultado, dados = _jogar_gravando(semente, classe)
+    reprodutor = ReprodutorReplay(Replay.de_bytes(dados))
+    assert _estado(reprodutor.executar()) == _estado(campanha)
+    assert reprodutor.resultado == resultado
+
+
+def test_replay_com_ia_gravada():
+    campanha, resultado, dados = _jogar_gravando(5, "Mago", andar_final=3, ia=IAExpectimax(None, 2))
+    replay = Replay.de_bytes(dados)
+    assert replay.alvos_ia
+    reprodutor = ReprodutorReplay(replay)
+    assert _estado(reprodutor.executar()) == _estado(campanha)
+    assert reprodutor.proximo_alvo_ia == len(replay.alvos_ia)
+
+
+def test_ir_para_andar_para_frente_e_para_tras():
+    _, _, dados = _jogar_gravando(6, "Guerreiro")
+    replay = Replay.de_bytes(dados)
+    ultimo = max(replay.inicio_andar)
+    assert ultimo > 1
+
+    def inicio_de(andar):
+        reprodutor = ReprodutorReplay(replay)
+        reprodutor.ir_para_andar(andar)
+        return _estado(reprodutor.campanha), [(i.nome, i.vida) for i in reprodutor.batalha.inimigos]
+
+    reprodutor = ReprodutorReplay(replay)
+    reprodutor.ir_para_andar(ultimo)
+    reprodutor.ir_para_andar(1)
+    assert (_estado(reprodutor.campanha), [(i.nome, i.vida) for i in reprodutor.batalha.inimigos]) == inicio_de(1)
+    reprodutor.ir_para_andar(ultimo)
+    assert (_estado(reprodutor.campanha), [(i.nome, i.vida) for i in reprodutor.batalha.inimigos]) == inicio_de(
+        ultimo
+    )
+    with pytest.raises(ValueError):
+        reprodutor.ir_para_andar(ultimo + 1)
+
+
+def test_arquivo_invalido():
+    with pytest.raises(ValueError):
+        Replay.de_bytes(b"XXXX" + bytes(8))
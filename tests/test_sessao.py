@@ -0,0 +1,135 @@
+import io
+import time
+
+import pytest
+
+from eventos import LogEventos
+from motor import Batalha, Equipamento, SequenciaSementes, iniciar_campanha
+from replay import GravadorReplay, Replay, ReprodutorReplay
+from sessao import (
+    AndarConcluido,
+    AndarIniciado,
+    Atualizacao,
+    ErroSessao,
+    ItemEquipado,
+    SessaoCampanha,
+    TurnoJogador,
+)
+from simulacao import politica_agressiva
+
+PRAZO_S = 60.0
+
+
+def _jogar(sessao, ao_turno=None):
+    mensagens = []
+    batalha = None
+    limite = time.monotonic() + PRAZO_S
+    sessao.iniciar()
+    while sessao.ativa() or not sessao.mensagens.empty():
+        assert time.monotonic() < limite
+        for mensagem in sessao.drenar():
+            mensagens.append(mensagem)
+            if isinstance(mensagem, AndarIniciado):
+                batalha = mensagem.batalha
+            elif isinstance(mensagem, TurnoJogador):
+                if ao_turno:
+                    ao_turno(sessao, mensagem)
+                sessao.agir(*politica_agressiva(batalha, mensagem.heroi))
+        time.sleep(0.001)
+    return mensagens
+
+
+def test_sessao_gravada_reproduz_no_replay():
+    sementes = SequenciaSementes(11)
+    campanha = iniciar_campanha("Herói", "Arqueiro", sementes=sementes)
+    saida = io.BytesIO()
+    saida.close = lambda: None
+    gravador = GravadorReplay(saida, "Herói", "Arqueiro", None, sementes, campanha.andar_final)
+    equipados = []
+
+    def trocar_equipamento(sessao, mensagem):
+        for heroi in campanha.party:
+            itens = [item for item in heroi.inventario.itens if isinstance(item, Equipamento)]
+            if itens:
+                sessao.equipar(heroi, itens[0], equipados.append)
+                return
+
+    mensagens = _jogar(SessaoCampanha(campanha, gravador, "instantaneo"), trocar_equipamento)
+    assert isinstance(mensagens[-1], AndarConcluido)
+    assert mensagens[-1].resultado in ("derrota", "vitoria")
+    for mensagem in mensagens:
+        if isinstance(mensagem, ItemEquipado) and mensagem.retorno:
+            mensagem.retorno(mensagem.equipou)
+    assert equipados
+
+    reprodutor = ReprodutorReplay(Replay.de_bytes(saida.getvalue()))
+    reprodutor.executar()
+    assert [(h.vida, h.nivel, h.xp_atual) for h in reprodutor.campanha.party] == [
+        (h.vida, h.nivel, h.xp_atual) for h in campanha.party
+    ]
+    assert reprodutor.resultado == mensagens[-1].resultado
+
+
+def test_quadros_trazem_equipamento_e_inventario():
+    campanha = iniciar_campanha("Herói", "Guerreiro", sementes=SequenciaSementes(3), andar_final=1)
+    mensagens = _jogar(SessaoCampanha(campanha, velocidade="instantaneo"))
+    ultima = [m for m in mensagens if isinstance(m, Atualizacao)][-1]
+    for heroi, quadro in zip(campanha.party, ultima.herois):
+        assert quadro.itens == tuple(heroi.inventario.itens)
+        assert quadro.equipamento == heroi.equipamento.values()
+        assert quadro.vida == heroi.vida
+
+
+def test_conselheiro_vem_pronto_no_turno():
+    campanha = iniciar_campanha("Herói", "Mago", sementes=SequenciaSementes(4), andar_final=1)
+    turnos = []
+    _jogar(SessaoCampanha(campanha, velocidade="instantaneo", conselho=True), lambda s, m: turnos.append(m))
+    assert turnos
+    for turno in turnos:
+        assert turno.conselheiro is not None
+        assert turno.conselheiro.batalha is not campanha.batalha
+        assert turno.conselheiro.heroi.nome == turno.heroi.nome
+
+
+def test_excecao_do_motor_vira_mensagem(monkeypatch):
+    def falhar(self):
+        raise RuntimeError("falha no motor")
+
+    monkeypatch.setattr(Batalha, "proximo_turno", falhar)
+    campanha = iniciar_campanha("Herói", "Mago", sementes=SequenciaSementes(1))
+    mensagens = _jogar(SessaoCampanha(campanha, velocidade="instantaneo"))
+    erros = [m for m in mensagens if isinstance(m, ErroSessao)]
+    assert len(erros) == 1
+    assert str(erros[0].erro) == "falha no motor"
+
+
+def test_encerrar_e_aguardar_despeja_o_log(tmp_path):
+    arquivo = tmp_path / "eventos.jsonl"
+    log = LogEventos(5, str(arquivo))
+    campanha = iniciar_campanha("Herói", "Guerreiro", sementes=SequenciaSementes(8), log=log)
+    sessao = SessaoCampanha(campanha, velocidade="instantaneo")
+    sessao.iniciar()
+    limite = time.monotonic() + PRAZO_S
+    batalha = None
+    turnos = 0
+    while turnos < 3:
+        assert time.monotonic() < limite
+        for mensagem in sessao.drenar():
+            if isinstance(mensagem, AndarIniciado):
+                batalha = mensagem.batalha
+            elif isinstance(mensagem, TurnoJogador):
+                turnos += 1
+                if turnos < 3:
+                    sessao.agir(*politica_agressiva(batalha, mensagem.heroi))
+        time.sleep(0.001)
+    sessao.encerrar()
+    assert sessao.aguardar(PRAZO_S)
+    assert not sessao.ativa()
+    assert log.total > log.capacidade
+    assert len(arquivo.read_text(encoding="utf-8").splitlines()) == log.total
+
+
+def test_velocidade_desconhecida():
+    campanha = iniciar_campanha("Herói", "Mago", sementes=SequenciaSementes(1))
+    with pytest.raises(ValueError):
+        SessaoCampanha(campanha, velocidade="turbo")
@@ -0,0 +1,36 @@
+import pytest
+
+import simulacao
+from ia import IAExpectimax
+
+
+def test_ia_expectimax_criada_em_cada_lote(monkeypatch):
+    criadas = []
+    original = simulacao.criar_ia
+
+    def registrar(nome):
+        ia = original(nome)
+        criadas.append(ia)
+        return ia
+
+    monkeypatch.setattr(simulacao, "criar_ia", registrar)
+    relatorio = simulacao.simular_campanhas(6, "Guerreiro", floors=2, workers=1, seed=3, ia="expectimax")
+    assert relatorio["campanhas"] == 6
+    assert len(criadas) == 4
+    assert all(isinstance(ia, IAExpectimax) for ia in criadas)
+    assert all(ia.ultima_profundidade > 0 for ia in criadas)
+
+
+def test_ia_desconhecida():
+    with pytest.raises(ValueError):
+        simulacao.simular_campanhas(1, "Mago", workers=1, ia="minimax")
+    with pytest.raises(ValueError):
+        simulacao.simular_campanha("Mago", ia="minimax")
+
+
+@pytest.mark.parametrize("politica", [simulacao.politica_agressiva, simulacao.politica_aleatoria])
+def test_mesma_semente_mesmo_resultado_com_qualquer_numero_de_workers(politica):
+    um = simulacao.simular_campanhas(24, "Arqueiro", floors=4, workers=1, politica=politica, seed=9)
+    tres = simulacao.simular_campanhas(24, "Arqueiro", floors=4, workers=3, politica=politica, seed=9)
+    assert um == tres
+    assert um != simulacao.simular_campanhas(24, "Arqueiro", floors=4, workers=1, politica=politica, seed=10)
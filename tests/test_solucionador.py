@@ -0,0 +1,89 @@
+from functools import lru_cache
+from itertools import product
+import random
+
+import pytest
+
+from dano import FACES
+from motor import Batalha, Guerreiro, Monstro, calcular_dano_rpg
+from solucionador import prob_vitoria_ataque_basico, resolver_batalha
+
+PROFUNDIDADE_FORCA_BRUTA = 100
+
+
+class DadosRoteirizados:
+    def __init__(self, valores):
+        self.valores = list(valores)
+
+    def randint(self, a, b):
+        return self.valores.pop(0)
+
+
+def _batalha(n_inimigos, semente):
+    rng = random.Random(semente)
+    heroi = Guerreiro("Herói", {"HP": 14, "ATK": 12, "DEF": 12, "SPD": 40})
+    inimigos = [Monstro(f"Monstro {i}", rng=rng) for i in range(n_inimigos)]
+    for inimigo in inimigos:
+        inimigo.vida = min(inimigo.vida, 6)
+    return Batalha([heroi], inimigos, registrar_eventos=False)
+
+
+def _forca_bruta(batalha):
+    unidades = batalha.herois + batalha.inimigos
+    n_herois = len(batalha.herois)
+
+    def dano(a, d):
+        contagens = {}
+        for dados in product(range(1, FACES + 1), repeat=2):
+            valor, _, _ = calcular_dano_rpg(unidades[a], unidades[d], rng=DadosRoteirizados(dados))
+            contagens[valor] = contagens.get(valor, 0) + 1
+        return [(valor, c / FACES**2) for valor, c in contagens.items()]
+
+    danos = {(a, d): dano(a, d) for a in range(len(unidades)) for d in range(len(unidades))}
+
+    def ordem(hp):
+        vivos = [u for u in range(len(unidades)) if hp[u] > 0]
+        return tuple(sorted(vivos, key=lambda u: (unidades[u].velocidade, unidades[u].forca), reverse=True))
+
+    @lru_cache(maxsize=None)
+    def valor(hp, turnos, ptr, restante):
+        if not any(hp[n_herois:]):
+            return 1.0
+        if not any(hp[:n_herois]):
+            return 0.0
+        if ptr == len(turnos):
+            return valor(hp, ordem(hp), 0, restante)
+        u = turnos[ptr]
+        if hp[u] <= 0:
+            return valor(hp, turnos, ptr + 1, restante)
+        if restante == 0:
+            return 0.0
+        alvos = [v for v in (range(n_herois, len(hp)) if u < n_herois else range(n_herois)) if hp[v] > 0]
+        total = 0.0
+        for alvo in alvos:
+            for d, p in danos[(u, alvo)]:
+                novo = hp[:alvo] + (max(0, hp[alvo] - d),) + hp[alvo + 1 :]
+                total += p / len(alvos) * valor(novo, turnos, ptr + 1, restante - 1)
+        return total
+
+    hp = tuple(u.vida for u in unidades)
+    return valor(hp, ordem(hp), 0, PROFUNDIDADE_FORCA_BRUTA)
+
+
+@pytest.mark.parametrize("n_inimigos,semente", [(1, 1), (1, 2), (2, 3), (2, 4)])
+def test_solucionador_igual_a_forca_bruta(n_inimigos, semente):
+    batalha = _batalha(n_inimigos, semente)
+    assert prob_vitoria_ataque_basico(batalha) == pytest.approx(_forca_bruta(batalha), abs=1e-6)
+
+
+def test_vida_esperada_dentro_dos_limites():
+    batalha = _batalha(2, 5)
+    resultado = resolver_batalha(batalha)
+    assert 0.0 <= resultado["prob_vitoria"] <= 1.0
+    for unidade in batalha.herois + batalha.inimigos:
+        assert 0.0 <= resultado["vida_esperada"][unidade.nome] <= unidade.vida
+
+
+def test_limite_de_estados():
+    with pytest.raises(ValueError):
+        resolver_batalha(_batalha(2, 3), max_estados=5)
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from ia import BuscaExpectimax
+from motor import Arqueiro, Batalha, Guerreiro, Mago, Monstro, Queimacao
+from transposicao import SEM_EFEITOS, TabelaTransposicao, efeitos_unidade, zobrist_batalha
+
+
+class TabelaMesmaProfundidade(TabelaTransposicao):
+    def buscar(self, chave, profundidade):
+        valor = super().buscar(chave, profundidade)
+        indice = chave & self._mascara
+        return valor if valor is not None and self._profundidades[indice] == profundidade else None
+
+
+class TabelaNula(TabelaTransposicao):
+    def buscar(self, chave, profundidade):
+        return None
+
+
+def _batalha(semente=0):
+    rng = random.Random(semente)
+    herois = [
+        Guerreiro("Guerreiro", {"HP": 20, "ATK": 14, "DEF": 12, "SPD": 12}),
+        Mago("Mago", {"HP": 16, "ATK": 16, "DEF": 8, "SPD": 11}),
+        Arqueiro("Arqueiro", {"HP": 16, "ATK": 15, "DEF": 9, "SPD": 14}),
+    ]
+    inimigos = [Monstro(f"Monstro {i}", forca_extra=4, rng=rng) for i in range(2)]
+    return Batalha(herois, inimigos, registrar_eventos=False, rng=rng)
+
+
+def _com_efeitos(batalha):
+    guerreiro, _, arqueiro = batalha.herois
+    Guerreiro.ChamadoLiderBuff(3, 2).aplicar(guerreiro, batalha)
+    Arqueiro.OlhoAguiaBuff().aplicar(arqueiro, batalha)
+    for _ in range(2):
+        Queimacao().aplicar(batalha.inimigos[0], batalha)
+    return batalha
+
+
+def test_capacidade_deve_ser_potencia_de_dois():
+    with pytest.raises(ValueError):
+        TabelaTransposicao(1000)
+
+
+def test_tabela_geracoes_e_profundidade():
+    tabela = TabelaTransposicao(16)
+    tabela.guardar(42, 3, 1.5)
+    assert tabela.buscar(42, 3) == 1.5
+    assert tabela.buscar(42, 2) == 1.5
+    assert tabela.buscar(42, 4) is None
+    tabela.guardar(42, 1, 9.0)
+    assert tabela.buscar(42, 3) == 1.5
+    tabela.nova_geracao()
+    assert tabela.buscar(42, 1) is None
+    assert len(tabela) == 0
+
+
+def test_chave_distingue_efeitos_e_rodada():
+    batalha = _batalha()
+    base = zobrist_batalha(batalha)
+    assert zobrist_batalha(_batalha()) == base
+    _com_efeitos(batalha)
+    assert zobrist_batalha(batalha) != base
+    assert efeitos_unidade(batalha.inimigos[0])[2] == 2
+    batalha.rodada += 1
+    assert zobrist_batalha(batalha) != base
+
+
+def test_pos_turno_incremental_igual_ao_motor():
+    batalha = _com_efeitos(_batalha())
+    for unidade in batalha.herois + batalha.inimigos:
+        efeitos = tuple(efeitos_unidade(u) for u in batalha.herois + batalha.inimigos)
+        h = zobrist_batalha(batalha)
+        depois, h_depois = BuscaExpectimax._pos_turno(unidade.posicao, efeitos, h)
+        batalha.gerenciar_status_pos_turno(unidade)
+        assert depois == tuple(efeitos_unidade(u) for u in batalha.herois + batalha.inimigos)
+        assert h_depois == zobrist_batalha(batalha)
+    assert efeitos_unidade(batalha.herois[0]) != SEM_EFEITOS
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_busca_com_tabela_igual_a_busca_sem_tabela(semente):
+    batalha = _com_efeitos(_batalha(semente))
+    monstro = batalha.inimigos[1]
+    com_tabela = BuscaExpectimax(batalha, monstro, tabela=TabelaMesmaProfundidade(1 << 16))
+    sem_tabela = BuscaExpectimax(batalha, monstro, tabela=TabelaNula(2))
+    assert com_tabela.hash_inicial == zobrist_batalha(batalha)
+    depois, h = com_tabela._pos_turno(com_tabela.raiz, com_tabela.efeitos_inicial, com_tabela.hash_inicial)
+    for alvo in range(len(batalha.herois)):
+        valores = [
+            busca._esperanca(
+                busca.raiz, alvo, busca.vida_inicial, busca.efeitos_inicial, depois, h, busca.heuristica_inicial, 0, 3
+            )
+            for busca in (com_tabela, sem_tabela)
+        ]
+        assert valores[0] == pytest.approx(valores[1], abs=1e-9)
+    assert com_tabela.tabela.acertos > 0
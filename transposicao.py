@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from motor import Batalha, Guerreiro, Personagem, Queimacao
+
+SEMENTE_ZOBRIST = 0x5EED_2B0B
+
+Efeitos = Tuple[int, int, int, int]
+SEM_EFEITOS: Efeitos = (0, 0, 0, 0)
+
+
+def efeitos_unidade(unidade: Personagem) -> Efeitos:
+    chamado = unidade.status_effects.get(Guerreiro.ChamadoLiderBuff.nome)
+    queimacao = unidade.status_effects.get(Queimacao.nome)
+    return (
+        unidade.crit_chance_buff,
+        chamado.duracao_restante if chamado else 0,
+        queimacao.stacks if queimacao else 0,
+        queimacao.duracao_restante if queimacao else 0,
+    )
+
+
+class ChavesZobrist:
+    def __init__(self, semente: int = SEMENTE_ZOBRIST) -> None:
+        self.semente = semente
+        self._chaves: Dict[Hashable, int] = {}
+
+    def chave(self, *componentes: Hashable) -> int:
+        valor = self._chaves.get(componentes)
+        if valor is None:
+            dados = repr((self.semente, componentes)).encode("utf-8")
+            valor = int.from_bytes(hashlib.blake2b(dados, digest_size=8).digest(), "little")
+            self._chaves[componentes] = valor
+        return valor
+
+    def tabela_vida(self, unidade: int, vida_max: int) -> List[int]:
+        return [self.chave("vida", unidade, v) for v in range(vida_max + 1)]
+
+    def efeitos(self, unidade: int, efeitos: Efeitos) -> int:
+        return 0 if efeitos == SEM_EFEITOS else self.chave("efeitos", unidade, efeitos)
+
+
+ZOBRIST = ChavesZobrist()
+
+
+def zobrist_batalha(batalha: Batalha, chaves: ChavesZobrist = ZOBRIST) -> int:
+    h = chaves.chave("rodada", batalha.rodada)
+    for u in batalha.herois + batalha.inimigos:
+        h ^= chaves.chave("vida", u.posicao, u.vida) ^ chaves.efeitos(u.posicao, efeitos_unidade(u))
+    return h
+
+
+class TabelaTransposicao:
+    def __init__(self, capacidade: int = 1 << 16) -> None:
+        if capacidade <= 0 or capacidade & (capacidade - 1):
+            raise ValueError("A capacidade da tabela deve ser uma potência de dois.")
+        self.capacidade = capacidade
+        self.geracao = 0
+        self.consultas = 0
+        self.acertos = 0
+        self._mascara = capacidade - 1
+        self._chaves = [0] * capacidade
+        self._profundidades = [-1] * capacidade
+        self._geracoes = [-1] * capacidade
+        self._valores = [0.0] * capacidade
+
+    def nova_geracao(self) -> None:
+        self.geracao += 1
+
+    def buscar(self, chave: int, profundidade: int) -> Optional[float]:
+        self.consultas += 1
+        indice = chave & self._mascara
+        if (
+            self._chaves[indice] != chave
+            or self._geracoes[indice] != self.geracao
+            or self._profundidades[indice] < profundidade
+        ):
+            return None
+        self.acertos += 1
+        return self._valores[indice]
+
+    def guardar(self, chave: int, profundidade: int, valor: float) -> None:
+        indice = chave & self._mascara
+        if self._geracoes[indice] != self.geracao or profundidade >= self._profundidades[indice]:
+            self._chaves[indice] = chave
+            self._profundidades[indice] = profundidade
+            self._geracoes[indice] = self.geracao
+            self._valores[indice] = valor
+
+    def __len__(self) -> int:
+        return sum(1 for g in self._geracoes if g == self.geracao)